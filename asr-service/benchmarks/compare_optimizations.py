@@ -0,0 +1,143 @@
+"""Accuracy and latency of the CPU inference modes over a fixed set of WAVs.
+
+Every mode (fp32, int8, compile, int8+compile) runs in its own process on
+the same samples. Accuracy is the word error rate against ``<name>.txt``
+next to each ``<name>.wav`` when present, otherwise against the fp32 output.
+
+    python benchmarks/compare_optimizations.py samples/ --model small --threads 4
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    "fp32": {"ASR_QUANTIZE": "false", "ASR_COMPILE": "false"},
+    "int8": {"ASR_QUANTIZE": "true", "ASR_COMPILE": "false"},
+    "compile": {"ASR_QUANTIZE": "false", "ASR_COMPILE": "true"},
+    "int8+compile": {"ASR_QUANTIZE": "true", "ASR_COMPILE": "true"},
+}
+
+
+def wav_duration(path: str) -> float:
+    with wave.open(path, "rb") as wav_file:
+        return wav_file.getnframes() / wav_file.getframerate()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    ref, hyp = reference.split(), hypothesis.split()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            ))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def run_child(model: str, samples, language, region) -> dict:
+    sys.path.insert(0, SERVICE_DIR)
+    import core
+
+    core.configure_torch_threads()
+
+    start = time.perf_counter()
+    if not core.setup_dolphin_model(model):
+        raise SystemExit(f"Failed to load model {model}")
+    load_seconds = time.perf_counter() - start
+
+    # The first decode pays for lazy init and compilation
+    start = time.perf_counter()
+    core.transcribe_audio_file(samples[0], language, region, model)
+    warmup_seconds = time.perf_counter() - start
+
+    results = {}
+    for path in samples:
+        start = time.perf_counter()
+        result = core.transcribe_audio_file(path, language, region, model)
+        results[path] = {
+            "seconds": time.perf_counter() - start,
+            "text": result["text"] if result else ""
+        }
+
+    return {"load_seconds": load_seconds, "warmup_seconds": warmup_seconds, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("samples", help="Directory of WAV files")
+    parser.add_argument("--model", default="small")
+    parser.add_argument("--language", default=None)
+    parser.add_argument("--region", default=None)
+    parser.add_argument("--threads", type=int, default=0, help="torch intra-op threads (0 = default)")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    samples = sorted(glob.glob(os.path.join(args.samples, "*.wav")))
+    if not samples:
+        raise SystemExit(f"No WAV files in {args.samples}")
+
+    if args.child:
+        print(json.dumps(run_child(args.model, samples, args.language, args.region)))
+        return
+
+    references = {}
+    for path in samples:
+        txt_path = os.path.splitext(path)[0] + ".txt"
+        if os.path.exists(txt_path):
+            with open(txt_path, encoding="utf-8") as f:
+                references[path] = f.read().strip()
+
+    command = [sys.executable, __file__, args.samples, "--model", args.model, "--child"]
+    if args.language:
+        command += ["--language", args.language]
+    if args.region:
+        command += ["--region", args.region]
+
+    runs = {}
+    with tempfile.TemporaryDirectory() as compiled_dir:
+        for mode in args.modes:
+            env = dict(os.environ, ASR_COMPILED_DIR=compiled_dir, ASR_NUM_THREADS=str(args.threads), **MODES[mode])
+            output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+            runs[mode] = json.loads(output.strip().splitlines()[-1])
+
+    if not references and "fp32" in runs:
+        print("No reference transcripts found, WER is measured against fp32 output\n")
+        references = {path: r["text"] for path, r in runs["fp32"]["results"].items()}
+
+    audio_seconds = sum(wav_duration(path) for path in samples)
+    print(f"{'mode':>13} {'load s':>7} {'warmup s':>9} {'mean s':>7} {'p95 s':>6} {'RTF':>6} {'WER':>6}")
+    for mode, run in runs.items():
+        latencies = [r["seconds"] for r in run["results"].values()]
+        wer = None
+        if references:
+            errors = [word_error_rate(references[p], r["text"]) for p, r in run["results"].items() if p in references]
+            wer = sum(errors) / len(errors)
+
+        print(f"{mode:>13} {run['load_seconds']:>7.2f} {run['warmup_seconds']:>9.2f} "
+              f"{sum(latencies) / len(latencies):>7.3f} {percentile(latencies, 0.95):>6.3f} "
+              f"{sum(latencies) / audio_seconds:>6.3f} {'-' if wer is None else f'{wer:.3f}':>6}")
+
+
+if __name__ == "__main__":
+    main()
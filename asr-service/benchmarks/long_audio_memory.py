@@ -0,0 +1,112 @@
+"""Peak memory of whole-file vs. windowed transcription on long recordings.
+
+Generates synthetic speech-like WAV files (1, 5 and 20 minutes by default)
+and transcribes each one in a fresh process, once by loading the whole file
+and once through the overlapping windows used by /api/asr/transcribe/long.
+
+    python benchmarks/long_audio_memory.py --model base --minutes 1 5 20
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_RATE = 16000
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def write_synthetic_wav(path: str, minutes: float):
+    """Alternate 4s of modulated tones with 1s of low noise, written in chunks."""
+    rng = np.random.default_rng(0)
+    total = int(minutes * 60 * SAMPLE_RATE)
+    chunk = 5 * SAMPLE_RATE
+
+    with wave.open(path, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(SAMPLE_RATE)
+
+        written = 0
+        while written < total:
+            n = min(chunk, total - written)
+            t = np.arange(n) / SAMPLE_RATE
+            speech = 0.3 * np.sin(2 * np.pi * 220 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 3 * t))
+            speech[4 * SAMPLE_RATE:] = rng.normal(0, 0.002, max(0, n - 4 * SAMPLE_RATE))
+            wav_file.writeframes((speech * 32767).astype(np.int16).tobytes())
+            written += n
+
+
+def run_child(mode: str, path: str, model: str) -> dict:
+    sys.path.insert(0, SERVICE_DIR)
+    import core
+
+    if not core.setup_dolphin_model(model):
+        raise SystemExit(f"Failed to load model {model}")
+    baseline = peak_rss_mb()
+
+    start = time.perf_counter()
+    if mode == "whole":
+        result = core.transcribe_audio_file(path, model_key=model)
+        text = result["text"] if result else ""
+    else:
+        transcript = core.LongFormTranscript()
+        with open(path, "rb") as audio_file:
+            for _, _, window in core.iter_audio_windows(audio_file):
+                transcript.add(core.run_waveform_transcription(model, window))
+        text = transcript.text
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "baseline_rss_mb": round(baseline, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "seconds": round(elapsed, 2),
+        "words": len(text.split())
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--minutes", type=float, nargs="+", default=[1, 5, 20])
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child[0], args.child[1], args.model)))
+        return
+
+    # Let the whole-file run accept recordings past the service limit
+    env = dict(os.environ, ASR_MAX_AUDIO_DURATION=str(int(max(args.minutes) * 60) + 1))
+
+    print(f"{'minutes':>8} {'mode':>6} {'baseline MB':>12} {'peak MB':>9} {'delta MB':>9} {'seconds':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for minutes in args.minutes:
+            path = os.path.join(tmp, f"synthetic_{minutes:g}min.wav")
+            write_synthetic_wav(path, minutes)
+
+            for mode in ("whole", "long"):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--model", args.model, "--child", mode, path],
+                    env=env, capture_output=True, text=True, check=True
+                ).stdout
+                stats = json.loads(output.strip().splitlines()[-1])
+                delta = stats["peak_rss_mb"] - stats["baseline_rss_mb"]
+                print(f"{minutes:>8g} {mode:>6} {stats['baseline_rss_mb']:>12} "
+                      f"{stats['peak_rss_mb']:>9} {delta:>9.1f} {stats['seconds']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Latency, real-time factor and memory of the ASR service under concurrent load.
+
+A synthetic corpus of short and long clips is decoded at each concurrency
+level, for every model and CPU inference mode, by two drivers:
+
+- direct: ``core.transcribe_audio_file`` from a thread pool, in a fresh
+  process per model and mode
+- http: the service itself started with uvicorn, with raw bodies posted to
+  /api/asr/transcribe/raw by concurrent keep-alive clients
+
+The result cache is disabled so every request is decoded. Nothing is
+downloaded once the models are in ASR_MODEL_DIR, so it runs offline on CPU.
+
+    python benchmarks/throughput.py --models base small --modes fp32 int8 --concurrency 1 2 4
+    python benchmarks/throughput.py --drivers http --corpus samples/ --json results.json
+"""
+import argparse
+import glob
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from compare_optimizations import MODES, percentile, wav_duration
+from long_audio_memory import peak_rss_mb, write_synthetic_wav
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHORT_SECONDS = (3, 4, 5, 6, 8)
+LONG_SECONDS = (45, 90)
+
+
+def write_corpus(directory: str, short: int, long: int):
+    durations = [SHORT_SECONDS[i % len(SHORT_SECONDS)] for i in range(short)]
+    durations += [LONG_SECONDS[i % len(LONG_SECONDS)] for i in range(long)]
+    for i, seconds in enumerate(durations):
+        write_synthetic_wav(os.path.join(directory, f"clip_{i:02d}_{seconds}s.wav"), seconds / 60)
+
+
+def run_load(jobs, concurrency: int) -> dict:
+    """Run every job from ``concurrency`` threads and time each one."""
+    def timed(job):
+        start = time.perf_counter()
+        try:
+            ok = job()
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(timed, jobs))
+    wall = time.perf_counter() - start
+
+    return {
+        "latencies": [seconds for seconds, ok in outcomes if ok],
+        "errors": sum(not ok for _, ok in outcomes),
+        "wall_seconds": wall
+    }
+
+
+def summarize(run: dict, audio_seconds: float) -> dict:
+    latencies = run["latencies"]
+    if not latencies:
+        return {"errors": run["errors"]}
+    return {
+        "requests": len(latencies),
+        "errors": run["errors"],
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        # Processing seconds per audio second, and audio seconds per wall second
+        "rtf": sum(latencies) / audio_seconds,
+        "x_realtime": audio_seconds / run["wall_seconds"]
+    }
+
+
+def run_direct_child(model: str, samples, concurrency_levels, repeats: int) -> list:
+    sys.path.insert(0, SERVICE_DIR)
+    import core
+
+    core.configure_torch_threads()
+    if not core.setup_dolphin_model(model):
+        raise SystemExit(f"Failed to load model {model}")
+    core.transcribe_audio_file(samples[0], model_key=model)
+
+    jobs = [lambda path=path: core.transcribe_audio_file(path, model_key=model) is not None
+            for path in samples * repeats]
+    audio_seconds = sum(wav_duration(path) for path in samples) * repeats
+
+    rows = []
+    for concurrency in concurrency_levels:
+        row = summarize(run_load(jobs, concurrency), audio_seconds)
+        row.update(concurrency=concurrency, peak_rss_mb=round(peak_rss_mb(), 1))
+        rows.append(row)
+    return rows
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def process_tree_peak_rss_mb(pid: int) -> float:
+    """Sum of VmHWM over the server and its worker processes (Linux only)."""
+    total_kb, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                total_kb += next((int(line.split()[1]) for line in f if line.startswith("VmHWM:")), 0)
+            with open(f"/proc/{current}/task/{current}/children") as f:
+                pending.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+def wait_until_ready(port: int, server: subprocess.Popen, timeout: float):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit("ASR service exited during startup")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/asr/ready", timeout=5) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(1)
+    raise SystemExit(f"ASR service was not ready after {timeout:.0f} seconds")
+
+
+def run_http(model: str, env: dict, samples, concurrency_levels, repeats: int, startup_timeout: float) -> list:
+    port = free_port()
+    env = dict(env, ASR_DEFAULT_MODEL=model, ASR_PRELOAD_MODELS="",
+               ASR_MAX_QUEUE_SIZE=str(max(concurrency_levels)))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=SERVICE_DIR, env=env, stdout=subprocess.DEVNULL
+    )
+
+    try:
+        wait_until_ready(port, server, startup_timeout)
+
+        bodies = []
+        for path in samples:
+            with open(path, "rb") as f:
+                bodies.append(f.read())
+        connections = threading.local()
+
+        def post(body: bytes) -> bool:
+            # One keep-alive connection per client thread
+            if not hasattr(connections, "conn"):
+                connections.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=600)
+            try:
+                connections.conn.request("POST", f"/api/asr/transcribe/raw?model={model}", body=body,
+                                         headers={"Content-Type": "application/octet-stream"})
+                response = connections.conn.getresponse()
+                response.read()
+                return response.status == 200
+            except (OSError, http.client.HTTPException):
+                del connections.conn
+                return False
+
+        jobs = [lambda body=body: post(body) for body in bodies * repeats]
+        audio_seconds = sum(wav_duration(path) for path in samples) * repeats
+
+        rows = []
+        for concurrency in concurrency_levels:
+            row = summarize(run_load(jobs, concurrency), audio_seconds)
+            row.update(concurrency=concurrency, peak_rss_mb=round(process_tree_peak_rss_mb(server.pid), 1))
+            rows.append(row)
+        return rows
+
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Directory of WAV files (default: generate a synthetic corpus)")
+    parser.add_argument("--short", type=int, default=8, help="Synthetic clips of 3-8 seconds")
+    parser.add_argument("--long", type=int, default=2, help="Synthetic clips of 45-90 seconds")
+    parser.add_argument("--models", nargs="+", default=["base", "small"])
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--drivers", nargs="+", choices=["direct", "http"], default=["direct", "http"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeats", type=int, default=2, help="Times each clip is sent per concurrency level")
+    parser.add_argument("--threads", type=int, default=0, help="torch intra-op threads (0 = default)")
+    parser.add_argument("--workers", type=int, default=0, help="ASR_MAX_WORKERS for the http driver (0 = default)")
+    parser.add_argument("--startup-timeout", type=float, default=600)
+    parser.add_argument("--json", help="Also write the results to this file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = args.corpus
+        if not corpus:
+            corpus = os.path.join(tmp, "corpus")
+            os.makedirs(corpus)
+            write_corpus(corpus, args.short, args.long)
+
+        samples = sorted(glob.glob(os.path.join(corpus, "*.wav")))
+        if not samples:
+            raise SystemExit(f"No WAV files in {corpus}")
+
+        if args.child:
+            print(json.dumps(run_direct_child(args.models[0], samples, args.concurrency, args.repeats)))
+            return
+
+        audio_seconds = sum(wav_duration(path) for path in samples)
+        print(f"Corpus: {len(samples)} clips, {audio_seconds:.0f}s of audio, {args.repeats} repeats per level\n")
+
+        compiled_dir = os.path.join(tmp, "compiled")
+        results = []
+        print(f"{'driver':>6} {'model':>6} {'mode':>13} {'conc':>4} {'errors':>6} {'p50 s':>6} {'p95 s':>6} "
+              f"{'p99 s':>6} {'RTF':>6} {'x RT':>6} {'peak MB':>8}")
+
+        for model in args.models:
+            for mode in args.modes:
+                env = dict(os.environ, ASR_COMPILED_DIR=compiled_dir, ASR_NUM_THREADS=str(args.threads),
+                           ASR_RESULT_CACHE_MAX_ENTRIES="0", ASR_RESULT_CACHE_DIR="", **MODES[mode])
+                if args.workers:
+                    env["ASR_MAX_WORKERS"] = str(args.workers)
+
+                for driver in args.drivers:
+                    if driver == "direct":
+                        command = [sys.executable, __file__, "--child", "--corpus", corpus, "--models", model,
+                                   "--repeats", str(args.repeats), "--concurrency",
+                                   *map(str, args.concurrency)]
+                        output = subprocess.run(command, env=env, capture_output=True, text=True,
+                                                check=True).stdout
+                        rows = json.loads(output.strip().splitlines()[-1])
+                    else:
+                        rows = run_http(model, env, samples, args.concurrency, args.repeats,
+                                        args.startup_timeout)
+
+                    for row in rows:
+                        row.update(driver=driver, model=model, mode=mode)
+                        results.append(row)
+                        if "p50" not in row:
+                            print(f"{driver:>6} {model:>6} {mode:>13} {row['concurrency']:>4} "
+                                  f"{row['errors']:>6}  every request failed")
+                            continue
+                        print(f"{driver:>6} {model:>6} {mode:>13} {row['concurrency']:>4} {row['errors']:>6} "
+                              f"{row['p50']:>6.2f} {row['p95']:>6.2f} {row['p99']:>6.2f} {row['rtf']:>6.3f} "
+                              f"{row['x_realtime']:>6.1f} {row['peak_rss_mb']:>8}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
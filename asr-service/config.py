@@ -6,11 +6,76 @@ ASR_CONFIG = {
     "model_dir": Path(os.getenv("ASR_MODEL_DIR", "./data/dolphin/models")),
     "assets_dir": Path(os.getenv("ASR_ASSETS_DIR", "./data/dolphin/assets")),
     "default_model": os.getenv("ASR_DEFAULT_MODEL", "small"),
+    # Extra models to load and warm up at startup besides the default one
+    "preload_models": [m.strip() for m in os.getenv("ASR_PRELOAD_MODELS", "").split(",") if m.strip()],
+    "warmup_enabled": os.getenv("ASR_WARMUP_ENABLED", "true").lower() == "true",
+    "warmup_seconds": float(os.getenv("ASR_WARMUP_SECONDS", "3")),
     "max_audio_duration": int(os.getenv("ASR_MAX_AUDIO_DURATION", "300")),
-    "supported_formats": ["wav", "mp3", "m4a", "ogg", "flac"]
+    "max_upload_mb": int(os.getenv("ASR_MAX_UPLOAD_MB", "50")),
+    # Loaded models are evicted least recently used first once their weights
+    # exceed this budget; the default model is never evicted
+    "model_cache_max_mb": int(os.getenv("ASR_MODEL_CACHE_MAX_MB", "2560")),
+    # Results of repeated uploads are served from a cache keyed by audio hash,
+    # model, language and region; set a directory to also keep them on disk
+    "result_cache_max_entries": int(os.getenv("ASR_RESULT_CACHE_MAX_ENTRIES", "1024")),
+    "result_cache_dir": Path(os.getenv("ASR_RESULT_CACHE_DIR")) if os.getenv("ASR_RESULT_CACHE_DIR") else None,
+    "result_cache_ttl_seconds": int(os.getenv("ASR_RESULT_CACHE_TTL_SECONDS", "86400")),
+    # Oldest result files are removed past this size; 0 leaves the disk tier unbounded
+    "result_cache_max_disk_mb": int(os.getenv("ASR_RESULT_CACHE_MAX_DISK_MB", "1024")),
+    # CPU inference options: int8 dynamic quantization of Linear layers and
+    # torch.compile of the encoder. Optimized models are cached in compiled_dir.
+    "quantize": os.getenv("ASR_QUANTIZE", "false").lower() == "true",
+    "compile": os.getenv("ASR_COMPILE", "false").lower() == "true",
+    "compiled_dir": Path(os.getenv("ASR_COMPILED_DIR", "./data/dolphin/compiled")),
+    # 0 keeps torch's default
+    "num_threads": int(os.getenv("ASR_NUM_THREADS", "0")),
+    "interop_threads": int(os.getenv("ASR_INTEROP_THREADS", "0")),
+    # How long clients may reuse the language catalog before revalidating it
+    "languages_max_age": int(os.getenv("ASR_LANGUAGES_MAX_AGE", "3600")),
+    "supported_formats": ["wav", "mp3", "m4a", "ogg", "flac"],
+    # PCM WAV is decoded in memory; anything else is piped through ffmpeg
+    "ffmpeg_fallback": os.getenv("ASR_FFMPEG_FALLBACK", "true").lower() == "true",
+    "worker_type": os.getenv("ASR_WORKER_TYPE", "thread"),
+    "max_workers": int(os.getenv("ASR_MAX_WORKERS", "2")),
+    "max_queue_size": int(os.getenv("ASR_MAX_QUEUE_SIZE", "8")),
+    "request_timeout": float(os.getenv("ASR_REQUEST_TIMEOUT", "120")),
+    "retry_after": int(os.getenv("ASR_RETRY_AFTER", "5")),
+    # Requests only batch together while enough workers are decoding at once,
+    # so batch_max_size is effectively capped by max_workers. Thread workers
+    # only: each worker process decodes one request at a time.
+    "batch_max_size": int(os.getenv("ASR_BATCH_MAX_SIZE", "4")),
+    "batch_window_ms": int(os.getenv("ASR_BATCH_WINDOW_MS", "20")),
+    "vad_enabled": os.getenv("ASR_VAD_ENABLED", "true").lower() == "true",
+    "vad_energy_threshold": float(os.getenv("ASR_VAD_ENERGY_THRESHOLD", "0.01")),
+    "vad_min_silence_ms": int(os.getenv("ASR_VAD_MIN_SILENCE_MS", "500")),
+    "vad_min_speech_ms": int(os.getenv("ASR_VAD_MIN_SPEECH_MS", "200")),
+    "vad_padding_ms": int(os.getenv("ASR_VAD_PADDING_MS", "200")),
+    # With auto-detect, the language is identified from the first lid_seconds
+    # of speech and then pinned for the full decode; callers that send a
+    # session_id reuse it for later requests of the same session
+    "lid_enabled": os.getenv("ASR_LID_ENABLED", "true").lower() == "true",
+    "lid_seconds": float(os.getenv("ASR_LID_SECONDS", "5")),
+    "session_language_max_entries": int(os.getenv("ASR_SESSION_LANGUAGE_MAX_ENTRIES", "4096")),
+    "session_language_ttl_seconds": int(os.getenv("ASR_SESSION_LANGUAGE_TTL_SECONDS", "1800")),
+    "stream_partial_seconds": float(os.getenv("ASR_STREAM_PARTIAL_SECONDS", "1.0")),
+    "stream_segment_seconds": float(os.getenv("ASR_STREAM_SEGMENT_SECONDS", "20")),
+    "stream_silence_ms": int(os.getenv("ASR_STREAM_SILENCE_MS", "600")),
+    "batch_max_files": int(os.getenv("ASR_BATCH_MAX_FILES", "500")),
+    # Total uncompressed size of the audio in one ZIP archive; each file is
+    # also held to max_upload_mb
+    "batch_max_archive_mb": int(os.getenv("ASR_BATCH_MAX_ARCHIVE_MB", "1024")),
+    # How long a batch file keeps retrying a full queue before it is
+    # reported as busy
+    "batch_busy_wait_seconds": float(os.getenv("ASR_BATCH_BUSY_WAIT_SECONDS", "300")),
+    # Recordings longer than max_audio_duration go through /transcribe/long,
+    # which decodes overlapping windows one after another
+    "long_form_window_seconds": float(os.getenv("ASR_LONG_FORM_WINDOW_SECONDS", "30")),
+    "long_form_overlap_seconds": float(os.getenv("ASR_LONG_FORM_OVERLAP_SECONDS", "3"))
 }
 
 
+# Downloads are verified against an optional "sha256" entry, falling back to
+# the checksum Hugging Face reports for LFS files
 ASR_MODELS = {
     "base": {
         "name": "base (140M)",
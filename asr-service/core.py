@@ -1,41 +1,152 @@
 import os
+import io
+import wave
 import urllib.request
 import shutil
-import tempfile
+import subprocess
 import base64
-from typing import Optional, Dict, List, Any
+import functools
+import hashlib
+import importlib.metadata
+import json
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from difflib import SequenceMatcher
+from typing import Optional, Dict, List, Any, Tuple, Iterator, BinaryIO, Callable
+import numpy as np
 import torch
+import torchaudio
+from torch.nn.utils.rnn import pad_sequence
 import dolphin
+from dolphin.constants import (
+    SAMPLE_RATE, SPEECH_LENGTH, NOTIME_SYMBOL,
+    FIRST_LANG_SYMBOL, LAST_LANG_SYMBOL, FIRST_REGION_SYMBOL, LAST_REGION_SYMBOL
+)
 from config import ASR_CONFIG, ASR_MODELS, ASR_ASSET_URLS
+from model_cache import ModelCache, ModelHandle
+from metrics import timed, record_audio
+from result_cache import (
+    TranscriptionCache, SessionLanguageCache, make_cache_key, hash_audio, hash_audio_file
+)
+
+
+model_cache = ModelCache(
+    max_bytes=ASR_CONFIG["model_cache_max_mb"] * 2**20,
+    pinned=[ASR_CONFIG["default_model"]]
+)
+transcription_cache = TranscriptionCache(
+    max_entries=ASR_CONFIG["result_cache_max_entries"],
+    disk_dir=ASR_CONFIG["result_cache_dir"],
+    ttl_seconds=ASR_CONFIG["result_cache_ttl_seconds"],
+    max_disk_bytes=ASR_CONFIG["result_cache_max_disk_mb"] * 2**20
+)
+session_languages = SessionLanguageCache(
+    max_entries=ASR_CONFIG["session_language_max_entries"],
+    ttl_seconds=ASR_CONFIG["session_language_ttl_seconds"]
+)
+model_locks = {}
+model_locks_guard = threading.Lock()
+model_loads: Dict[str, Future] = {}
+model_status: Dict[str, Dict[str, Any]] = {}
+model_loads_guard = threading.Lock()
+assets_lock = threading.Lock()
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+VAD_FRAME_MS = 30
+# Highest adaptive threshold, relative to the loud (90th percentile) frames: -20 dB
+VAD_MAX_THRESHOLD_RATIO = 0.1
+
+
+class ModelLoadError(RuntimeError):
+    pass
+
 
+class AudioTooLongError(ValueError):
+    pass
 
-dolphin_model = None
-current_model_key = "small"
-model_cache = {}
 
+class _LinkedEtagHandler(urllib.request.HTTPRedirectHandler):
+    """Keeps the ``X-Linked-Etag`` (the SHA-256 of an LFS file) that Hugging
+    Face sends on the redirect, since the CDN response doesn't carry it."""
 
-def download_file(url: str, dest_path: str) -> bool:
+    def __init__(self):
+        self.linked_etag = None
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        self.linked_etag = headers.get("X-Linked-Etag") or self.linked_etag
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+def download_file(url: str, dest_path: str, sha256: Optional[str] = None) -> bool:
+    """Download ``url`` to ``dest_path`` through a temp file in the same directory.
+
+    The file only appears at ``dest_path`` once it is complete and its SHA-256
+    matches ``sha256`` (or the ``X-Linked-Etag`` Hugging Face sends for LFS
+    files), so readers never see a partial download.
+    """
     if os.path.exists(dest_path):
         return True
 
+    tmp_file = tempfile.NamedTemporaryFile(
+        dir=os.path.dirname(dest_path), prefix=os.path.basename(dest_path) + ".", suffix=".part", delete=False)
     try:
         print(f"Downloading {url} to {dest_path}")
-        with urllib.request.urlopen(url) as response, open(dest_path, 'wb') as out_file:
-            shutil.copyfileobj(response, out_file)
+        digest = hashlib.sha256()
+        redirects = _LinkedEtagHandler()
+        with urllib.request.build_opener(redirects).open(url) as response, tmp_file:
+            linked_etag = response.headers.get("X-Linked-Etag") or redirects.linked_etag or ""
+            expected = (sha256 or linked_etag).strip('"').lower()
+            while True:
+                chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                tmp_file.write(chunk)
+
+        if len(expected) == 64:
+            if digest.hexdigest() != expected:
+                raise ValueError(f"checksum mismatch (expected {expected}, got {digest.hexdigest()})")
+        else:
+            print(f"⚠️ No SHA-256 published for {url}, the download is not verified")
+
+        os.replace(tmp_file.name, dest_path)
         print(f"Downloaded {dest_path}")
         return True
     except Exception as e:
         print(f"Error downloading {url}: {e}")
         return False
+    finally:
+        tmp_file.close()
+        if os.path.exists(tmp_file.name):
+            os.remove(tmp_file.name)
+
+
+def dolphin_transcribe_module():
+    # ``dolphin.transcribe`` is shadowed on the package by the transcribe()
+    # function it re-exports, so import the module by its full name
+    return importlib.import_module("dolphin.transcribe")
+
+
+def published_model_sha256(model_key: str) -> Optional[str]:
+    # Dolphin ships the hashes of its released checkpoints
+    try:
+        return dolphin_transcribe_module().MODELS[model_key]["sha256"]
+    except (ImportError, AttributeError, KeyError, TypeError):
+        return None
 
 
 def ensure_assets_downloaded() -> bool:
     ASR_CONFIG["assets_dir"].mkdir(parents=True, exist_ok=True)
 
-    for filename, url in ASR_ASSET_URLS.items():
-        dest_path = ASR_CONFIG["assets_dir"] / filename
-        if not download_file(url, str(dest_path)):
-            return False
+    with assets_lock:
+        for filename, url in ASR_ASSET_URLS.items():
+            dest_path = ASR_CONFIG["assets_dir"] / filename
+            if not download_file(url, str(dest_path)):
+                return False
     return True
 
 
@@ -47,149 +158,1076 @@ def ensure_model_downloaded(model_key: str) -> Optional[str]:
     ASR_CONFIG["model_dir"].mkdir(parents=True, exist_ok=True)
     model_path = ASR_CONFIG["model_dir"] / f"{model_key}.pt"
 
-    if download_file(ASR_MODELS[model_key]["url"], str(model_path)):
+    model_info = ASR_MODELS[model_key]
+    sha256 = model_info.get("sha256") or published_model_sha256(model_key)
+    if download_file(model_info["url"], str(model_path), sha256):
         return str(model_path)
     return None
 
 
-def setup_dolphin_model(model_key: str = "small") -> bool:
-    global dolphin_model, current_model_key, model_cache
+def load_dolphin_model(model_key: str) -> ModelHandle:
+    """Return a handle to ``model_key``, loading the model if it isn't cached.
 
-    if model_key in model_cache:
-        dolphin_model = model_cache[model_key]
-        current_model_key = model_key
-        return True
+    Concurrent callers for a model that is still loading wait for that one
+    load instead of starting their own. Release the handle (or use it as a
+    context manager) when the request is done so the cache can evict the
+    model again.
+    """
+    while True:
+        handle = model_cache.acquire(model_key)
+        if handle is not None:
+            return handle
+
+        with model_loads_guard:
+            pending = model_loads.get(model_key)
+            is_loader = pending is None
+            if is_loader:
+                pending = model_loads[model_key] = Future()
 
+        if not is_loader:
+            # Raises the loader's ModelLoadError if the load failed
+            with timed("model_load"):
+                pending.result()
+            continue
+
+        try:
+            with timed("model_load"):
+                handle = _load_dolphin_model(model_key)
+            pending.set_result(True)
+            return handle
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with model_loads_guard:
+                model_loads.pop(model_key, None)
+
+
+def _load_dolphin_model(model_key: str) -> ModelHandle:
     try:
         print(f"Loading Dolphin ASR model: {model_key}")
 
         if not ensure_assets_downloaded():
-            print("Failed to download required assets")
-            return False
+            raise ModelLoadError("Failed to download required assets")
 
         model_path = ensure_model_downloaded(model_key)
         if not model_path:
-            print(f"Failed to download model: {model_key}")
-            return False
+            raise ModelLoadError(f"Failed to download model: {model_key}")
 
         device = "cuda" if torch.cuda.is_available() else "cpu"
+        quantize = ASR_CONFIG["quantize"] and device == "cpu"
 
-        # Load model
-        model = dolphin.load_model(
-            model_key,
-            str(ASR_CONFIG["model_dir"]),
-            device,
-            assets_dir=str(ASR_CONFIG["assets_dir"])
-        )
+        # Load model, reusing a previously quantized copy if there is one
+        start = time.perf_counter()
+        artifact_path = get_optimized_model_path(model_key, model_path) if quantize else None
+        model = load_optimized_model(model_key, artifact_path) if artifact_path else None
 
-        # Cache the model
-        model_cache[model_key] = model
-        dolphin_model = model
-        current_model_key = model_key
+        if model is None:
+            model = dolphin.load_model(
+                model_key,
+                str(ASR_CONFIG["model_dir"]),
+                device,
+                assets_dir=str(ASR_CONFIG["assets_dir"]),
+                quantize_s2t_model=quantize
+            )
+            if artifact_path:
+                save_optimized_model(model, artifact_path)
+
+        if ASR_CONFIG["compile"] and device == "cpu":
+            compile_model(model)
+
+        # Cache the model, evicting least recently used ones if over budget
+        handle = model_cache.put(model_key, model, time.perf_counter() - start)
 
         print(f"Dolphin ASR model loaded successfully on {device}")
-        return True
+        return handle
 
+    except ModelLoadError as e:
+        print(e)
+        raise
     except Exception as e:
         print(f"Error loading Dolphin ASR model: {e}")
+        raise ModelLoadError(f"Failed to load ASR model: {model_key}") from e
+
+
+def configure_torch_threads():
+    if ASR_CONFIG["num_threads"] > 0:
+        torch.set_num_threads(ASR_CONFIG["num_threads"])
+
+    if ASR_CONFIG["interop_threads"] > 0:
+        try:
+            torch.set_num_interop_threads(ASR_CONFIG["interop_threads"])
+        except RuntimeError as e:
+            # Only allowed before torch runs any inter-op parallel work
+            print(f"Could not set torch interop threads: {e}")
+
+
+def get_dolphin_version() -> str:
+    try:
+        return importlib.metadata.version("dataoceanai-dolphin")
+    except importlib.metadata.PackageNotFoundError:
+        return getattr(dolphin, "__version__", "unknown")
+
+
+def checkpoint_sha256(model_key: str, model_path: str) -> str:
+    expected = ASR_MODELS[model_key].get("sha256") or published_model_sha256(model_key)
+    if expected:
+        return expected.lower()
+
+    digest = hashlib.sha256()
+    with open(model_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_optimized_model_path(model_key: str, model_path: str) -> str:
+    # Another dolphin release may build the model differently, and another
+    # checkpoint has other weights, so both are part of the name
+    ASR_CONFIG["compiled_dir"].mkdir(parents=True, exist_ok=True)
+    name = (f"{model_key}.int8.dolphin-{get_dolphin_version()}.torch-{torch.__version__.split('+')[0]}"
+            f".{checkpoint_sha256(model_key, model_path)[:16]}.pt")
+    artifact_path = ASR_CONFIG["compiled_dir"] / name
+
+    # A re-downloaded checkpoint makes the cached copy stale
+    if artifact_path.exists() and artifact_path.stat().st_mtime < os.path.getmtime(model_path):
+        artifact_path.unlink()
+
+    return str(artifact_path)
+
+
+def build_quantized_model(model_key: str):
+    """Build the quantized model without loading the fp32 checkpoint, the
+    way ``dolphin.load_model`` sets it up, for cached weights to be loaded into."""
+    # pyyaml comes with dolphin, which reads the same config with it
+    import yaml
+    from dolphin.model import DolphinSpeech2Text
+
+    dolphin_transcribe = dolphin_transcribe_module()
+
+    model_config = dolphin_transcribe.MODELS[model_key]["config"]
+    train_cfg_file = os.path.join(os.path.dirname(os.path.abspath(dolphin_transcribe.__file__)),
+                                  "assets", "config.yaml")
+    with open(train_cfg_file, "r", encoding="utf-8") as f:
+        train_cfg = yaml.safe_load(f)
+    train_cfg["encoder_conf"].update(**model_config["encoder"])
+    train_cfg["decoder_conf"].update(**model_config["decoder"])
+
+    return DolphinSpeech2Text(
+        s2t_train_config=train_cfg,
+        s2t_model_file=None,
+        device="cpu",
+        quantize_s2t_model=True
+    )
+
+
+def load_optimized_model(model_key: str, artifact_path: str):
+    if not os.path.exists(artifact_path):
+        return None
+
+    try:
+        # Only tensors are unpickled, so the cache directory can't inject code
+        state_dict = torch.load(artifact_path, map_location="cpu", weights_only=True)
+        model = build_quantized_model(model_key)
+        model.s2t_model.load_state_dict(state_dict)
+        print(f"Loaded quantized ASR model from {artifact_path}")
+        return model
+    except Exception as e:
+        print(f"Ignoring unusable quantized model {artifact_path}: {e}")
+        return None
+
+
+def save_optimized_model(model, artifact_path: str):
+    # Keep the quantized weights so the next start skips reading and hashing
+    # the fp32 checkpoint; quantization is re-applied to an empty model
+    tmp_path = f"{artifact_path}.{os.getpid()}.part"
+    try:
+        torch.save(model.s2t_model.state_dict(), tmp_path)
+        os.replace(tmp_path, artifact_path)
+        print(f"Saved quantized ASR model to {artifact_path}")
+    except Exception as e:
+        print(f"Could not cache quantized ASR model: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def compile_model(model):
+    """Compile the encoder, which does most of the work per request.
+
+    The beam search decoder runs one token at a time with changing shapes and
+    is left in eager mode. Inductor keeps its compiled kernels in
+    compiled_dir so restarts reuse them.
+    """
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(ASR_CONFIG["compiled_dir"] / "inductor"))
+    try:
+        model.s2t_model.encoder = torch.compile(model.s2t_model.encoder, dynamic=True)
+    except Exception as e:
+        print(f"torch.compile unavailable, running the encoder eagerly: {e}")
+
+
+def setup_dolphin_model(model_key: str = "small") -> bool:
+    try:
+        load_dolphin_model(model_key).release()
+        return True
+    except ModelLoadError:
         return False
 
 
-def convert_audio_to_wav_file(audio_data: bytes, sample_rate: int = 16000) -> Optional[str]:
+def pcm_to_float(frames: bytes, sample_width: int, num_channels: int = 1) -> np.ndarray:
+    if sample_width == 1:
+        samples = (np.frombuffer(frames, np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif sample_width == 2:
+        samples = np.frombuffer(frames, np.int16).astype(np.float32) / 32768.0
+    elif sample_width == 4:
+        samples = np.frombuffer(frames, np.int32).astype(np.float32) / 2147483648.0
+    else:
+        raise wave.Error(f"Unsupported WAV sample width: {sample_width}")
+
+    if num_channels > 1:
+        samples = samples.reshape(-1, num_channels).mean(axis=1)
+
+    return samples
+
+
+def resample(samples: np.ndarray, orig_rate: int, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    if orig_rate == sample_rate:
+        return samples
+    return torchaudio.functional.resample(
+        torch.from_numpy(np.ascontiguousarray(samples)), orig_rate, sample_rate).numpy()
+
+
+def decode_wav_bytes(audio_data: bytes, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    with wave.open(io.BytesIO(audio_data), 'rb') as wav_file:
+        num_channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        frame_rate = wav_file.getframerate()
+        frames = wav_file.readframes(wav_file.getnframes())
+
+    samples = pcm_to_float(frames, sample_width, num_channels)
+    return np.ascontiguousarray(resample(samples, frame_rate, sample_rate), dtype=np.float32)
+
+
+def decode_with_ffmpeg(audio_data: bytes, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    # Same conversion as dolphin.load_audio, but fed through stdin instead of a file
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate),
+        "-"
+    ]
+
+    try:
+        out = subprocess.run(cmd, input=audio_data, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to decode audio: {e.stderr.decode(errors='ignore')}") from e
+
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+
+def decode_audio_bytes(audio_data: bytes, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
     if not audio_data:
-        return None
+        raise ValueError("Empty audio data")
+
+    if audio_data[:4] == b'RIFF' and audio_data[8:12] == b'WAVE':
+        try:
+            return decode_wav_bytes(audio_data, sample_rate)
+        except (wave.Error, EOFError) as e:
+            # e.g. float or compressed WAV payloads the wave module can't read
+            if not ASR_CONFIG["ffmpeg_fallback"]:
+                raise
+            print(f"Falling back to ffmpeg for WAV data: {e}")
+
+    elif not ASR_CONFIG["ffmpeg_fallback"]:
+        raise ValueError("Only PCM WAV audio is supported when ffmpeg fallback is disabled")
+
+    return decode_with_ffmpeg(audio_data, sample_rate)
+
+
+def iter_wav_blocks(fileobj: BinaryIO, block_seconds: float = 1.0) -> Iterator[np.ndarray]:
+    with wave.open(fileobj, 'rb') as wav_file:
+        num_channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        frame_rate = wav_file.getframerate()
+        block_frames = max(1, int(frame_rate * block_seconds))
 
+        while True:
+            frames = wav_file.readframes(block_frames)
+            if not frames:
+                break
+            yield resample(pcm_to_float(frames, sample_width, num_channels), frame_rate)
+
+
+def iter_ffmpeg_blocks(fileobj: BinaryIO, block_seconds: float = 1.0) -> Iterator[np.ndarray]:
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-loglevel", "error",
+        "-i", "pipe:0",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(SAMPLE_RATE),
+        "-"
+    ]
+    process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+    def feed_stdin():
+        try:
+            shutil.copyfileobj(fileobj, process.stdin)
+        except (BrokenPipeError, ValueError):
+            pass
+        finally:
+            process.stdin.close()
+
+    feeder = threading.Thread(target=feed_stdin, daemon=True)
+    feeder.start()
+
+    block_bytes = int(SAMPLE_RATE * block_seconds) * 2
     try:
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-
-        if isinstance(audio_data, bytes):
-            # If it's raw bytes, try to interpret as audio
-            temp_file.write(audio_data)
-            temp_file.close()
-            return temp_file.name
+        while True:
+            chunk = process.stdout.read(block_bytes)
+            if not chunk:
+                break
+            yield pcm_to_float(chunk[:len(chunk) - len(chunk) % 2], 2)
+    finally:
+        process.stdout.close()
+        process.kill()
+        process.wait()
+        feeder.join()
+
+
+def iter_audio_blocks(fileobj: BinaryIO, block_seconds: float = 1.0) -> Iterator[np.ndarray]:
+    header = fileobj.read(12)
+    fileobj.seek(0)
+
+    if header[:4] == b'RIFF' and header[8:12] == b'WAVE':
+        try:
+            yield from iter_wav_blocks(fileobj, block_seconds)
+            return
+        except (wave.Error, EOFError) as e:
+            if not ASR_CONFIG["ffmpeg_fallback"]:
+                raise
+            print(f"Falling back to ffmpeg for WAV stream: {e}")
+            fileobj.seek(0)
+
+    elif not ASR_CONFIG["ffmpeg_fallback"]:
+        raise ValueError("Only PCM WAV audio is supported when ffmpeg fallback is disabled")
+
+    yield from iter_ffmpeg_blocks(fileobj, block_seconds)
+
+
+def iter_audio_windows(fileobj: BinaryIO, window_seconds: Optional[float] = None,
+                       overlap_seconds: Optional[float] = None) -> Iterator[Tuple[float, float, np.ndarray]]:
+    """Yield (start_seconds, end_seconds, waveform) windows that overlap by ``overlap_seconds``.
+
+    Audio is read block by block, so at most one window is held in memory no
+    matter how long the input is.
+    """
+    window = int(min(window_seconds or ASR_CONFIG["long_form_window_seconds"], SPEECH_LENGTH) * SAMPLE_RATE)
+    overlap = int((overlap_seconds if overlap_seconds is not None else ASR_CONFIG["long_form_overlap_seconds"]) * SAMPLE_RATE)
+    overlap = min(overlap, window // 2)
+    hop = window - overlap
+
+    buffer = np.zeros(0, dtype=np.float32)
+    offset = 0
+    for block in iter_audio_blocks(fileobj):
+        buffer = np.concatenate([buffer, block])
+        while len(buffer) >= window:
+            yield offset / SAMPLE_RATE, (offset + window) / SAMPLE_RATE, buffer[:window]
+            buffer = buffer[hop:]
+            offset += hop
+
+    # The tail is only worth decoding if it holds more than the overlap
+    # already covered by the previous window.
+    if len(buffer) > overlap or (offset == 0 and len(buffer)):
+        yield offset / SAMPLE_RATE, (offset + len(buffer)) / SAMPLE_RATE, buffer
+
+
+def merge_overlap_text(previous: str, current: str, max_words: int = 30) -> str:
+    """Return the part of ``current`` that isn't a repeat of the end of ``previous``."""
+    previous_words = previous.split()[-max_words:]
+    current_words = current.split()
+    if not previous_words or not current_words:
+        return current.strip()
+
+    head = current_words[:max_words]
+    match = SequenceMatcher(None, previous_words, head, autojunk=False).find_longest_match(
+        0, len(previous_words), 0, len(head))
+
+    # Only trust matches that run up to the end of the previous window's text
+    reaches_end = match.a + match.size >= len(previous_words) - 1
+    if match.size >= min(2, len(head)) and reaches_end:
+        return " ".join(current_words[match.b + match.size:])
+    return current.strip()
+
+
+class LongFormTranscript:
+    def __init__(self, language: Optional[str] = None, region: Optional[str] = None):
+        self.language = language
+        self.region = region
+        self.results: List[Dict[str, Any]] = []
+        self.text = ""
+
+    def add(self, result: Optional[Dict[str, Any]]) -> str:
+        if not result:
+            return ""
+
+        self.results.append(result)
+        new_text = merge_overlap_text(self.text, result["text"])
+        if new_text:
+            self.text = f"{self.text} {new_text}".strip()
+        return new_text
+
+    def final(self) -> Dict[str, Any]:
+        result = stitch_results(self.results, self.language, self.region)
+        result["text"] = self.text
+        return result
+
+
+def get_model_lock(model_key: str) -> threading.Lock:
+    # Dolphin keeps the decoding prefix on its beam search object, so two
+    # threads must never decode with the same model instance at once.
+    with model_locks_guard:
+        if model_key not in model_locks:
+            model_locks[model_key] = threading.Lock()
+        return model_locks[model_key]
+
+
+def format_result(result) -> Dict[str, Any]:
+    return {
+        'text': result.text.strip() if hasattr(result, 'text') else "",
+        'language': getattr(result, 'language', None),
+        'region': getattr(result, 'region', None),
+        'confidence': getattr(result, 'confidence', None)
+    }
+
+
+def transcribe_waveform(model, waveform, language: Optional[str] = None,
+                        region: Optional[str] = None) -> Dict[str, Any]:
+    kwargs = {
+        "predict_time": False,
+        "padding_speech": False
+    }
+
+    if language:
+        kwargs["lang_sym"] = language
+    if region:
+        kwargs["region_sym"] = region
+
+    return format_result(model(waveform, **kwargs))
+
+
+def resolve_language_ids(model, enc: torch.Tensor, language: Optional[str] = None,
+                         region: Optional[str] = None) -> Tuple[int, int]:
+    token2id = model.converter.token2id
+    if language and region:
+        return token2id[f"<{language}>"], token2id[f"<{region}>"]
+
+    # Same scoring as DolphinSpeech2Text.detect_language, but on an encoder
+    # output that was already computed as part of the batch.
+    decoder = model.s2t_model.decoder
+    sos = model.s2t_model.sos
+
+    if language:
+        lang_id = token2id[f"<{language}>"]
+    else:
+        ys = torch.tensor([[sos]], dtype=torch.long, device=model.device)
+        logp, _ = decoder.batch_score(ys, [None], enc)
+        mask = torch.ones(logp.size(1), dtype=torch.bool)
+        mask[token2id[FIRST_LANG_SYMBOL]:token2id[LAST_LANG_SYMBOL] + 1] = False
+        logp[0, mask] = -float("inf")
+        lang_id = logp.argmax(dim=-1).tolist()[0]
+
+    ys = torch.tensor([[sos, lang_id]], dtype=torch.long, device=model.device)
+    logp, _ = decoder.batch_score(ys, [None], enc)
+    mask = torch.ones(logp.size(1), dtype=torch.bool)
+    mask[token2id[FIRST_REGION_SYMBOL]:token2id[LAST_REGION_SYMBOL] + 1] = False
+    logp[0, mask] = -float("inf")
+    region_id = logp.argmax(dim=-1).tolist()[0]
+
+    return lang_id, region_id
+
+
+@torch.no_grad()
+def detect_language(model, waveform) -> Tuple[str, str]:
+    """Language and region of ``waveform`` from one encoder pass and two
+    single-step decoder scores, without decoding any text."""
+    speech = torch.as_tensor(waveform, dtype=torch.float32)[:SAMPLE_RATE * SPEECH_LENGTH]
+    lengths = torch.tensor([speech.size(0)], dtype=torch.long)
+    speech = speech.unsqueeze(0).to(getattr(torch, model.dtype))
+
+    enc, _ = model.s2t_model.encode(
+        speech=speech.to(model.device), speech_lengths=lengths.to(model.device)
+    )
+    if isinstance(enc, tuple):
+        enc, _ = enc
+
+    lang_id, region_id = resolve_language_ids(model, enc)
+    lang, reg = model.converter.ids2tokens([lang_id, region_id])
+    return lang[1:-1], reg[1:-1]
+
+
+@torch.no_grad()
+def transcribe_waveform_batch(model, waveforms: List[Any], language: Optional[str] = None,
+                              region: Optional[str] = None) -> List[Dict[str, Any]]:
+    if len(waveforms) == 1:
+        return [transcribe_waveform(model, waveforms[0], language, region)]
+
+    # Dolphin only looks at the first SPEECH_LENGTH seconds of each utterance
+    max_samples = SAMPLE_RATE * SPEECH_LENGTH
+    speeches = [torch.as_tensor(w, dtype=torch.float32)[:max_samples] for w in waveforms]
+    lengths = torch.tensor([s.size(0) for s in speeches], dtype=torch.long)
+    speech = pad_sequence(speeches, batch_first=True).to(getattr(torch, model.dtype))
+
+    enc, enc_lengths = model.s2t_model.encode(
+        speech=speech.to(model.device), speech_lengths=lengths.to(model.device)
+    )
+    if isinstance(enc, tuple):
+        enc, _ = enc
+
+    token2id = model.converter.token2id
+    results = []
+    for i in range(len(speeches)):
+        sample_enc = enc[i, :enc_lengths[i]]
+        lang_id, region_id = resolve_language_ids(
+            model, sample_enc.unsqueeze(0), language, region)
+
+        model.beam_search.set_hyp_primer([
+            model.s2t_model.sos, lang_id, region_id,
+            token2id["<asr>"], token2id[NOTIME_SYMBOL]
+        ])
+        text = model._decode_single_sample(sample_enc)[0][0]
+        lang, reg = model.converter.ids2tokens([lang_id, region_id])
+
+        results.append({
+            'text': text.strip(),
+            'language': lang[1:-1],
+            'region': reg[1:-1],
+            'confidence': None
+        })
+
+    return results
+
+
+class BatchItem:
+    def __init__(self, waveform):
+        self.waveform = waveform
+        self.future = Future()
+        self.batch_full = threading.Event()
+
+
+class BatchScheduler:
+    """Groups concurrent decodes for the same model, language and region.
+
+    A request arriving while the model is idle runs at once. One arriving
+    while another decode is in progress leads a group: it waits up to
+    ``window_ms`` for company and then runs one padded encoder pass for
+    everything that arrived meanwhile; the other requests just wait for
+    their slice of the result.
+
+    Each worker process decodes one request at a time, so there is nothing to
+    group with in process mode and ``init_worker`` turns batching off.
+    """
+
+    def __init__(self, max_batch_size: int = 1, window_ms: int = 20):
+        self.max_batch_size = max(1, max_batch_size)
+        self.window = max(0, window_ms) / 1000
+        self._pending: Dict[Tuple, List[BatchItem]] = {}
+        # Groups being decoded, or waiting for the model lock, per model
+        self._running: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_batch_size > 1
+
+    def submit(self, model_key: str, model, waveform, language: Optional[str] = None,
+               region: Optional[str] = None) -> Dict[str, Any]:
+        return self.submit_many(model_key, model, [waveform], language, region)[0]
+
+    def submit_many(self, model_key: str, model, waveforms: List[Any], language: Optional[str] = None,
+                    region: Optional[str] = None) -> List[Dict[str, Any]]:
+        if not self.enabled:
+            with get_model_lock(model_key):
+                return [transcribe_waveform(model, waveform, language, region) for waveform in waveforms]
+
+        key = (model_key, language, region)
+        items = [BatchItem(waveform) for waveform in waveforms]
+
+        with self._lock:
+            group = self._pending.setdefault(key, [])
+            is_leader = not group
+            model_busy = self._running[model_key] > 0
+            group.extend(items)
+            if len(group) >= self.max_batch_size:
+                group[0].batch_full.set()
+
+        if is_leader:
+            if model_busy:
+                items[0].batch_full.wait(self.window)
+            with self._lock:
+                batch = self._pending.pop(key, [])
+                self._running[model_key] += 1
+            try:
+                self._run(model_key, model, batch, language, region)
+            finally:
+                with self._lock:
+                    self._running[model_key] -= 1
+
+        return [item.future.result() for item in items]
+
+    def _run(self, model_key: str, model, batch: List[BatchItem],
+             language: Optional[str], region: Optional[str]):
+        # Sort by length so each chunk pads to similar sizes
+        batch = sorted(batch, key=lambda item: len(item.waveform))
+
+        for start in range(0, len(batch), self.max_batch_size):
+            chunk = batch[start:start + self.max_batch_size]
+            try:
+                with get_model_lock(model_key):
+                    results = transcribe_waveform_batch(
+                        model, [item.waveform for item in chunk], language, region)
+                for item, result in zip(chunk, results):
+                    item.future.set_result(result)
+            except Exception as e:
+                for item in chunk:
+                    item.future.set_exception(e)
+
+
+batch_scheduler = BatchScheduler(
+    max_batch_size=ASR_CONFIG["batch_max_size"],
+    window_ms=ASR_CONFIG["batch_window_ms"]
+)
+
+
+def frame_energies(waveform: np.ndarray, frame_ms: int = VAD_FRAME_MS) -> np.ndarray:
+    frame_size = max(1, int(SAMPLE_RATE * frame_ms / 1000))
+    num_frames = len(waveform) // frame_size
+    if num_frames == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    frames = waveform[:num_frames * frame_size].reshape(num_frames, frame_size)
+    return np.sqrt(np.mean(frames ** 2, axis=1))
+
+
+def has_speech(waveform: np.ndarray) -> bool:
+    energies = frame_energies(waveform)
+    return bool(energies.size) and bool(energies.max() >= ASR_CONFIG["vad_energy_threshold"])
+
+
+def detect_speech_segments(waveform: np.ndarray) -> List[Tuple[int, int]]:
+    """Energy-based VAD returning (start, end) sample ranges that contain speech.
+
+    Short gaps are bridged, blips shorter than ``vad_min_speech_ms`` are
+    dropped, each range is padded by ``vad_padding_ms`` and ranges longer than
+    Dolphin's input window are split so nothing gets truncated.
+    """
+    frame_size = int(SAMPLE_RATE * VAD_FRAME_MS / 1000)
+    energies = frame_energies(waveform, VAD_FRAME_MS)
+    if not energies.size:
+        return []
+
+    # Follow the recording's own noise floor so a noisy room isn't all "speech".
+    # With few pauses the 10th percentile is speech rather than noise, so the
+    # floor may not put the threshold within 20 dB of the loud frames.
+    noise_floor = float(np.percentile(energies, 10)) * 3
+    threshold = max(ASR_CONFIG["vad_energy_threshold"],
+                    min(noise_floor, float(np.percentile(energies, 90)) * VAD_MAX_THRESHOLD_RATIO))
+    voiced = energies >= threshold
+
+    min_silence = ASR_CONFIG["vad_min_silence_ms"] // VAD_FRAME_MS
+    min_speech = ASR_CONFIG["vad_min_speech_ms"] // VAD_FRAME_MS
+    padding = ASR_CONFIG["vad_padding_ms"] // VAD_FRAME_MS
+
+    runs = []
+    start = None
+    for i, is_voiced in enumerate(voiced):
+        if is_voiced and start is None:
+            start = i
+        elif not is_voiced and start is not None:
+            runs.append([start, i])
+            start = None
+    if start is not None:
+        runs.append([start, len(voiced)])
+
+    merged = []
+    for run in runs:
+        if merged and run[0] - merged[-1][1] < min_silence:
+            merged[-1][1] = run[1]
         else:
-            temp_file.close()
-            os.unlink(temp_file.name)
+            merged.append(run)
+
+    max_samples = SAMPLE_RATE * SPEECH_LENGTH
+    segments = []
+    for start, end in merged:
+        if end - start < min_speech:
+            continue
+
+        start_sample = max(0, (start - padding) * frame_size)
+        end_sample = min(len(waveform), (end + padding) * frame_size)
+        if segments and start_sample <= segments[-1][1]:
+            start_sample = segments[-1][1]
+
+        for offset in range(start_sample, end_sample, max_samples):
+            segments.append((offset, min(offset + max_samples, end_sample)))
+
+    return segments
+
+
+def whole_waveform_segments(num_samples: int) -> List[Tuple[int, int]]:
+    max_samples = SAMPLE_RATE * SPEECH_LENGTH
+    return [(offset, min(offset + max_samples, num_samples)) for offset in range(0, num_samples, max_samples)]
+
+
+def stitch_results(results: List[Dict[str, Any]], language: Optional[str] = None,
+                   region: Optional[str] = None) -> Dict[str, Any]:
+    texts = [result['text'] for result in results if result and result['text']]
+    languages = Counter(result['language'] for result in results if result and result['language'])
+    regions = Counter(result['region'] for result in results if result and result['region'])
+
+    return {
+        'text': " ".join(texts),
+        'language': languages.most_common(1)[0][0] if languages else language,
+        'region': regions.most_common(1)[0][0] if regions else region,
+        'confidence': None
+    }
+
+
+def identify_language(model_key: str, model, waveform: np.ndarray, segments: List[Tuple[int, int]],
+                      region: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    """Detect the language from the first ``lid_seconds`` of speech so the
+    full decode can run with it pinned.
+
+    Returns ``(None, region)`` when there is no more speech than that, since
+    the decode would then detect the language from the same audio anyway.
+    """
+    lid_samples = int(ASR_CONFIG["lid_seconds"] * SAMPLE_RATE)
+    if sum(end - start for start, end in segments) <= lid_samples:
+        return None, region
+
+    parts, remaining = [], lid_samples
+    for start, end in segments:
+        parts.append(waveform[start:min(end, start + remaining)])
+        remaining -= len(parts[-1])
+        if remaining <= 0:
+            break
+
+    with timed("language_id"), get_model_lock(model_key):
+        language, detected_region = detect_language(model, np.concatenate(parts))
+    return language, region or detected_region
+
+
+def transcribe_speech(model_key: str, model, waveform: np.ndarray, language: Optional[str] = None,
+                      region: Optional[str] = None) -> Dict[str, Any]:
+    record_audio(len(waveform) / SAMPLE_RATE)
+
+    if ASR_CONFIG["vad_enabled"]:
+        with timed("vad"):
+            segments = detect_speech_segments(np.asarray(waveform, dtype=np.float32))
+        if not segments:
+            if not has_speech(waveform):
+                return stitch_results([], language, region)
+            # Never drop audible input on a VAD misjudgement
+            segments = whole_waveform_segments(len(waveform))
+    else:
+        segments = [(0, len(waveform))]
+
+    if not language and ASR_CONFIG["lid_enabled"]:
+        language, region = identify_language(model_key, model, waveform, segments, region)
+
+    with timed("inference"):
+        if len(segments) == 1:
+            start, end = segments[0]
+            return batch_scheduler.submit(model_key, model, waveform[start:end], language, region)
+
+        # Segments are queued together so the scheduler can encode them as one batch
+        results = batch_scheduler.submit_many(
+            model_key, model, [waveform[start:end] for start, end in segments], language, region)
+    return stitch_results(results, language, region)
+
+
+class StreamingSession:
+    """Buffers live PCM and cuts it into segments Dolphin can decode.
+
+    A segment is closed when the speaker pauses for ``stream_silence_ms`` or
+    when it reaches ``stream_segment_seconds``; until then the open segment is
+    re-decoded every ``stream_partial_seconds`` to produce partial text.
+    """
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.segments: List[str] = []
+        self.partial_text = ""
+        self.language = None
+        self.region = None
+        self._samples_since_partial = 0
+
+        self._max_segment = int(min(ASR_CONFIG["stream_segment_seconds"], SPEECH_LENGTH) * SAMPLE_RATE)
+        self._silence = int(ASR_CONFIG["stream_silence_ms"] * SAMPLE_RATE / 1000)
+        self._partial_interval = int(ASR_CONFIG["stream_partial_seconds"] * SAMPLE_RATE)
+
+    @property
+    def text(self) -> str:
+        parts = self.segments + ([self.partial_text] if self.partial_text else [])
+        return " ".join(parts)
+
+    def add_pcm(self, pcm: bytes):
+        samples = resample(pcm_to_float(pcm[:len(pcm) - len(pcm) % 2], 2), self.sample_rate)
+
+        self.buffer = np.concatenate([self.buffer, samples])
+        self._samples_since_partial += len(samples)
+
+    def pop_segment(self) -> Optional[np.ndarray]:
+        if len(self.buffer) >= self._max_segment:
+            segment = self.buffer[:self._max_segment]
+            self.buffer = self.buffer[self._max_segment:]
+            return segment
+
+        if len(self.buffer) <= self._silence:
             return None
 
-    except Exception as e:
-        print(f"Error converting audio data: {e}")
-        return None
+        head, tail = self.buffer[:-self._silence], self.buffer[-self._silence:]
+        if has_speech(tail):
+            return None
+
+        if not has_speech(head):
+            # Nothing said yet, drop the silence instead of decoding it
+            self.buffer = tail
+            return None
+
+        self.buffer = np.zeros(0, dtype=np.float32)
+        return head
+
+    def wants_partial(self) -> bool:
+        return self._samples_since_partial >= self._partial_interval and has_speech(self.buffer)
+
+    def take_partial_audio(self) -> np.ndarray:
+        self._samples_since_partial = 0
+        return self.buffer.copy()
+
+    def set_partial(self, result: Optional[Dict[str, Any]]):
+        if result:
+            self.partial_text = result["text"]
+
+    def commit(self, result: Optional[Dict[str, Any]]):
+        self.partial_text = ""
+        self._samples_since_partial = 0
+        if not result:
+            return
+
+        if result["text"]:
+            self.segments.append(result["text"])
+        self.language = result.get("language") or self.language
+        self.region = result.get("region") or self.region
+
+    def flush(self) -> Optional[np.ndarray]:
+        segment, self.buffer = self.buffer, np.zeros(0, dtype=np.float32)
+        return segment if has_speech(segment) else None
+
+
+def check_audio_duration(waveform: np.ndarray):
+    duration = len(waveform) / SAMPLE_RATE
+    if duration > ASR_CONFIG["max_audio_duration"]:
+        raise AudioTooLongError(
+            f"Audio is {duration:.0f} seconds long, the limit is {ASR_CONFIG['max_audio_duration']} seconds. "
+            "Use /transcribe/long for longer recordings."
+        )
+
+
+def cached_transcription(audio_hash: Callable[[], str], model_key: str, language: Optional[str],
+                         region: Optional[str], transcribe: Callable[[], Optional[Dict[str, Any]]]
+                         ) -> Optional[Dict[str, Any]]:
+    """Return the cached result for this audio, model, language and region,
+    or run ``transcribe`` and cache what it returns."""
+    if not transcription_cache.enabled:
+        return transcribe()
 
+    cache_key = make_cache_key(audio_hash(), model_key, language, region)
+    result = transcription_cache.get(cache_key)
+    if result is not None:
+        return result
 
-def transcribe_audio_file(file_path: str, language: Optional[str] = None, region: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    global dolphin_model
+    result = transcribe()
+    if result is not None:
+        transcription_cache.put(cache_key, result)
+    return result
 
+
+def transcribe_audio_file(file_path: str, language: Optional[str] = None, region: Optional[str] = None,
+                          model_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
     if not os.path.exists(file_path):
         print(f"Audio file not found: {file_path}")
         return None
 
-    if dolphin_model is None:
-        print("Dolphin ASR model is not loaded")
-        return None
+    model_key = model_key or ASR_CONFIG["default_model"]
 
-    try:
-        # Load audio
-        waveform = dolphin.load_audio(file_path)
-
-        # Prepare transcription kwargs
-        kwargs = {
-            "predict_time": False,
-            "padding_speech": False
-        }
-
-        if language:
-            kwargs["lang_sym"] = language
-        if region:
-            kwargs["region_sym"] = region
-
-        # Transcribe
-        result = dolphin_model(waveform, **kwargs)
-
-        transcription = result.text.strip() if hasattr(result, 'text') else ""
-        detected_language = getattr(result, 'language', None)
-        detected_region = getattr(result, 'region', None)
-        confidence = getattr(result, 'confidence', None)
-
-        return {
-            'text': transcription,
-            'language': detected_language,
-            'region': detected_region,
-            'confidence': confidence
-        }
+    def transcribe():
+        with load_dolphin_model(model_key) as handle:
+            try:
+                # Load audio
+                with timed("audio_decode"):
+                    waveform = dolphin.load_audio(file_path)
+                check_audio_duration(waveform)
+
+                # Transcribe, possibly batched with concurrent requests
+                return transcribe_speech(handle.key, handle.model, waveform, language, region)
+
+            except AudioTooLongError:
+                raise
+            except Exception as e:
+                print(f"Transcription error for file {file_path}: {e}")
+                return None
+
+    return cached_transcription(lambda: hash_audio_file(file_path), model_key, language, region, transcribe)
 
+
+def transcribe_audio_bytes(audio_data: bytes, language: Optional[str] = None, region: Optional[str] = None,
+                           model_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    model_key = model_key or ASR_CONFIG["default_model"]
+
+    def transcribe():
+        with load_dolphin_model(model_key) as handle:
+            try:
+                with timed("audio_decode"):
+                    waveform = decode_audio_bytes(audio_data)
+                check_audio_duration(waveform)
+                return transcribe_speech(handle.key, handle.model, waveform, language, region)
+
+            except AudioTooLongError:
+                raise
+            except Exception as e:
+                print(f"Transcription error for audio data: {e}")
+                return None
+
+    return cached_transcription(lambda: hash_audio(audio_data), model_key, language, region, transcribe)
+
+
+def transcribe_base64_audio(base64_audio: str, language: Optional[str] = None, region: Optional[str] = None,
+                            model_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    try:
+        with timed("base64_decode"):
+            audio_data = base64.b64decode(base64_audio)
     except Exception as e:
-        print(f"Transcription error for file {file_path}: {e}")
+        print(f"Error decoding base64 audio: {e}")
         return None
 
+    return transcribe_audio_bytes(audio_data, language, region, model_key)
 
-def transcribe_base64_audio(base64_audio: str, language: Optional[str] = None, region: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    try:
-        # Decode base64 audio
-        audio_data = base64.b64decode(base64_audio)
 
-        # Convert to temporary WAV file
-        temp_file_path = convert_audio_to_wav_file(audio_data)
-        if not temp_file_path:
-            print("Failed to convert audio data to WAV file")
-            return None
+def run_transcription(model_key: str, audio_data: bytes, language: Optional[str] = None,
+                      region: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    return transcribe_audio_bytes(audio_data, language, region, model_key)
+
+
+def run_base64_transcription(model_key: str, base64_audio: str, language: Optional[str] = None,
+                             region: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    return transcribe_base64_audio(base64_audio, language, region, model_key)
 
+
+def run_waveform_transcription(model_key: str, waveform: np.ndarray, language: Optional[str] = None,
+                               region: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    with load_dolphin_model(model_key) as handle:
         try:
-            # Transcribe
-            result = transcribe_audio_file(temp_file_path, language, region)
-            return result
+            return transcribe_speech(handle.key, handle.model, waveform, language, region)
+        except Exception as e:
+            print(f"Transcription error for streamed audio: {e}")
+            return None
 
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+
+def get_preload_models() -> List[str]:
+    models = [ASR_CONFIG["default_model"]] + ASR_CONFIG["preload_models"]
+    return list(dict.fromkeys(models))
+
+
+def synthetic_speech(seconds: float) -> np.ndarray:
+    """Voice-like test signal: a few harmonics with syllable-rate modulation."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    noise = np.random.default_rng(0).normal(0, 0.01, len(t))
+    return (0.2 * voice * envelope + noise).astype(np.float32)
+
+
+def warm_up_model(model_key: str) -> Dict[str, Any]:
+    """Load ``model_key`` and run it once so the first request doesn't pay
+    for lazy kernel initialization and allocator growth."""
+    model_status[model_key] = {"state": "loading"}
+    try:
+        with load_dolphin_model(model_key) as handle:
+            status = {
+                "state": "ready",
+                "load_seconds": model_cache.stats()["models"][model_key]["load_seconds"],
+                "warmup_seconds": None
+            }
+
+            if ASR_CONFIG["warmup_enabled"]:
+                waveform = synthetic_speech(ASR_CONFIG["warmup_seconds"])
+                start = time.perf_counter()
+                with get_model_lock(model_key):
+                    transcribe_waveform(handle.model, waveform)
+                    if batch_scheduler.enabled:
+                        # Also exercise the padded batch encode path
+                        transcribe_waveform_batch(handle.model, [waveform, waveform[:len(waveform) // 2]])
+                status["warmup_seconds"] = round(time.perf_counter() - start, 3)
 
     except Exception as e:
-        print(f"Error transcribing base64 audio: {e}")
-        return None
+        print(f"Warm-up failed for ASR model {model_key}: {e}")
+        status = {"state": "failed", "error": str(e)}
+
+    model_status[model_key] = status
+    return status
+
+
+def warm_up_models(model_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    return {model_key: warm_up_model(model_key) for model_key in model_keys}
 
 
+def get_model_status() -> Dict[str, Dict[str, Any]]:
+    return {model_key: dict(status) for model_key, status in model_status.items()}
+
+
+def merge_worker_statuses(reports: List[Tuple[int, Dict[str, Dict[str, Any]]]]) -> Dict[str, Dict[str, Any]]:
+    """Combine the (pid, statuses) each worker process reports after warm-up.
+
+    A model is ready only once it is ready in every worker; otherwise the
+    status of the first worker where it isn't is reported.
+    """
+    merged = {}
+    for pid, statuses in reports:
+        for model_key, status in statuses.items():
+            current = merged.get(model_key)
+            if status["state"] != "ready":
+                if current is None or current["state"] == "ready":
+                    merged[model_key] = {**status, "error": f"worker {pid}: {status.get('error')}"}
+            elif current is None:
+                merged[model_key] = dict(status)
+            elif current["state"] == "ready":
+                # The slowest worker is the one requests may have waited for
+                for field in ("load_seconds", "warmup_seconds"):
+                    if current.get(field) is None or (status.get(field) or 0) > current[field]:
+                        current[field] = status.get(field)
+    return merged
+
+
+def init_worker(model_keys: List[str], status_queue=None):
+    print(f"Initializing ASR worker with models: {', '.join(model_keys)}")
+    configure_torch_threads()
+    batch_scheduler.max_batch_size = 1
+    statuses = warm_up_models(model_keys)
+    if status_queue is not None:
+        # The API process is ready only once every worker has reported
+        status_queue.put((os.getpid(), statuses))
+
+
+@functools.lru_cache(maxsize=1)
 def get_available_languages() -> List[Dict[str, Any]]:
     try:
         from dolphin.languages import LANGUAGE_CODES, LANGUAGE_REGION_CODES
@@ -231,24 +1269,44 @@ def get_available_languages() -> List[Dict[str, Any]]:
         ]
 
 
+@functools.lru_cache(maxsize=1)
+def get_language_catalog() -> Dict[str, Any]:
+    """The language list serialized once, with an ETag derived from its content
+    so every replica hands out the same one."""
+    languages = get_available_languages()
+    body = json.dumps({"success": True, "languages": languages}, ensure_ascii=False).encode("utf-8")
+    return {
+        "languages": languages,
+        "regions": {language["code"]: language["regions"] for language in languages},
+        "body": body,
+        "etag": hashlib.sha256(body).hexdigest()[:32]
+    }
+
+
 def get_available_models() -> Dict[str, Dict[str, str]]:
     return ASR_MODELS
 
 
 def get_current_model() -> Optional[str]:
-    return current_model_key if dolphin_model else None
+    # Most recently used model; requests pick their own model per call
+    return model_cache.most_recent()
 
 
 def clear_model_cache() -> int:
-    global model_cache, dolphin_model, current_model_key
-
-    cached_count = len(model_cache)
-    model_cache.clear()
-    dolphin_model = None
-    current_model_key = None
-
-    return cached_count
+    return model_cache.clear()
 
 
 def get_model_cache_size() -> int:
     return len(model_cache)
+
+
+def get_model_cache_stats() -> Dict[str, Any]:
+    return model_cache.stats()
+
+
+def get_transcription_cache_stats() -> Dict[str, Any]:
+    return transcription_cache.stats()
+
+
+def clear_transcription_cache() -> int:
+    return transcription_cache.clear()
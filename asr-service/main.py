@@ -1,10 +1,33 @@
+import asyncio
+import multiprocessing
+import os
+import queue
 import uvicorn
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from config import ASR_CONFIG, FASTAPI_CONFIG, TAGS_METADATA, SERVER_CONFIG
-from core import setup_dolphin_model, clear_model_cache
+from core import (
+    clear_model_cache, init_worker, configure_torch_threads,
+    get_preload_models, warm_up_models, model_status, merge_worker_statuses, get_language_catalog
+)
 from routes import router
+from metrics import ServerTimingMiddleware
+from workers import inference_pool
+
+async def collect_worker_statuses(status_queue) -> list:
+    # Workers are started on demand, so keep every one of them busy at once
+    await asyncio.gather(*(inference_pool.run(os.getpid) for _ in range(inference_pool.max_workers)))
+
+    reports = []
+    while len(reports) < inference_pool.max_workers:
+        try:
+            reports.append(await asyncio.to_thread(status_queue.get, True, 5))
+        except queue.Empty:
+            # Raises BrokenProcessPool if a worker died while warming up
+            await inference_pool.run(os.getpid)
+    return reports
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -13,17 +36,46 @@ async def lifespan(app: FastAPI):
     ASR_CONFIG["model_dir"].mkdir(parents=True, exist_ok=True)
     ASR_CONFIG["assets_dir"].mkdir(parents=True, exist_ok=True)
     
-    default_model = ASR_CONFIG["default_model"]
-    print(f"Loading default ASR model: {default_model}")
+    configure_torch_threads()
+    
+    # Built once here so /languages only ever serves the cached bytes
+    catalog = get_language_catalog()
+    print(f"🌐 Language catalog ready: {len(catalog['languages'])} languages")
+    
+    preload_models = get_preload_models()
+    
+    # Process workers load and warm up their own copy of the models in
+    # init_worker and report how it went on status_queue
+    status_queue = None
+    if inference_pool.worker_type == "process":
+        status_queue = multiprocessing.get_context("spawn").Queue()
+    inference_pool.start(initializer=init_worker, initargs=(preload_models, status_queue))
+    print(f"⚙️ ASR inference pool: {inference_pool.max_workers} {inference_pool.worker_type} workers, "
+          f"queue size {inference_pool.max_queue_size}")
+    
+    print(f"Loading and warming up ASR models: {', '.join(preload_models)}")
+    if inference_pool.worker_type == "thread":
+        statuses = warm_up_models(preload_models)
+    else:
+        statuses = merge_worker_statuses(await collect_worker_statuses(status_queue))
+        model_status.update(statuses)
+    
+    for model_key, model_state in statuses.items():
+        if model_state["state"] == "ready":
+            print(f"🔥 {model_key}: loaded in {model_state['load_seconds']}s, "
+                  f"warm-up took {model_state['warmup_seconds']}s")
+        else:
+            print(f"⚠️ {model_key}: {model_state.get('error')}")
     
-    if setup_dolphin_model(default_model):
+    if all(model_state["state"] == "ready" for model_state in statuses.values()):
         print("✅ ASR Microservice ready!")
     else:
-        print("⚠️ ASR Microservice started but default model failed to load")
+        print("⚠️ ASR Microservice started but not every model is ready")
     
     yield
     
     print("🔄 Shutting down ASR Microservice...")
+    inference_pool.shutdown()
     clear_model_cache()
     print("✅ ASR Microservice shutdown complete!")
 
@@ -39,6 +91,7 @@ app = FastAPI(
     docs_url="/api/asr/docs",
 )
 
+app.add_middleware(ServerTimingMiddleware)
 app.include_router(router)
 
 if __name__ == "__main__":
@@ -0,0 +1,228 @@
+"""Prometheus text-format metrics and per-request stage timings.
+
+Stages that run on an inference worker (thread or process) are collected in
+a thread-local, handed back together with the result by ``run_timed`` and
+recorded by the API process, which is the one ``/metrics`` is scraped from.
+"""
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from starlette.datastructures import MutableHeaders
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+RTF_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 5.0)
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._values: Dict[Tuple[Tuple[str, str], ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in self._values.items():
+                lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # Per label set: bucket counts (not cumulative), sum, count
+        self._values: Dict[Tuple[Tuple[str, str], ...], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+            series[0][bisect.bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (counts, total, count) in self._values.items():
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    lines.append(f"{self.name}_bucket{_format_labels(labels, ('le', _format_value(bound)))} "
+                                 f"{cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+def scraped(name: str, documentation: str, values: Dict[Tuple[Tuple[str, str], ...], Any],
+            metric_type: str = "gauge") -> List[str]:
+    """Render a metric whose values are read at scrape time, e.g. from cache stats."""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {metric_type}"]
+    for labels, value in values.items():
+        if value is not None:
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return lines
+
+
+REQUEST_DURATION = Histogram(
+    "asr_request_duration_seconds", "HTTP request latency by endpoint")
+STAGE_DURATION = Histogram(
+    "asr_stage_duration_seconds", "Time spent in each stage of a transcription")
+REAL_TIME_FACTOR = Histogram(
+    "asr_real_time_factor", "Inference seconds per second of audio, per transcription", RTF_BUCKETS)
+AUDIO_SECONDS = Counter(
+    "asr_audio_seconds_total", "Seconds of audio transcribed; its rate is audio seconds per wall second")
+INFERENCE_SECONDS = Counter(
+    "asr_inference_seconds_total", "Seconds spent in model inference")
+QUEUE_REJECTIONS = Counter(
+    "asr_queue_rejections_total", "Requests turned away because the inference queue was full")
+
+REGISTRY = [REQUEST_DURATION, STAGE_DURATION, REAL_TIME_FACTOR, AUDIO_SECONDS, INFERENCE_SECONDS, QUEUE_REJECTIONS]
+
+
+class StageTimings:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.audio_seconds = 0.0
+
+    def add(self, stage: str, seconds: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def server_timing(self) -> str:
+        entries = [f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in self.stages.items()]
+        entries.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.1f}")
+        return ", ".join(entries)
+
+
+current_request: contextvars.ContextVar[Optional[StageTimings]] = contextvars.ContextVar(
+    "asr_request_timings", default=None)
+_worker = threading.local()
+
+
+def record_stage(stage: str, seconds: float):
+    worker_timings = getattr(_worker, "timings", None)
+    if worker_timings is not None:
+        # Recorded by the API process once the worker returns
+        worker_timings.add(stage, seconds)
+        return
+
+    STAGE_DURATION.observe(seconds, stage=stage)
+    request_timings = current_request.get()
+    if request_timings is not None:
+        request_timings.add(stage, seconds)
+
+
+def record_since_request_start(stage: str):
+    """Record the time from the start of the current request, e.g. how long
+    the request body took to arrive and be parsed."""
+    request_timings = current_request.get()
+    if request_timings is not None:
+        record_stage(stage, time.perf_counter() - request_timings.started)
+
+
+def record_audio(seconds: float):
+    worker_timings = getattr(_worker, "timings", None)
+    if worker_timings is not None:
+        worker_timings.audio_seconds += seconds
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - start)
+
+
+def run_timed(fn: Callable, submitted_at: float, *args) -> Tuple[Any, Dict[str, float], float]:
+    """Run ``fn`` on an inference worker and return its result with the
+    stage timings and audio duration it recorded."""
+    timings = StageTimings()
+    # Wall clock, since process workers don't share perf_counter with the API
+    timings.add("queue_wait", max(0.0, time.time() - submitted_at))
+    _worker.timings = timings
+    try:
+        return fn(*args), timings.stages, timings.audio_seconds
+    finally:
+        _worker.timings = None
+
+
+def record_worker_timings(stages: Dict[str, float], audio_seconds: float):
+    for stage, seconds in stages.items():
+        record_stage(stage, seconds)
+
+    inference_seconds = stages.get("inference", 0.0)
+    INFERENCE_SECONDS.inc(inference_seconds)
+    if audio_seconds > 0:
+        AUDIO_SECONDS.inc(audio_seconds)
+        # Silent audio never reaches the model and would drag the RTF down
+        if inference_seconds > 0:
+            REAL_TIME_FACTOR.observe(inference_seconds / audio_seconds)
+
+
+def render(extra: List[str] = ()) -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    lines.extend(extra)
+    return "\n".join(lines) + "\n"
+
+
+class ServerTimingMiddleware:
+    """Collects stage timings for each HTTP request, returns them in a
+    ``Server-Timing`` header and records request latency per endpoint."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = StageTimings()
+        token = current_request.set(timings)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timings.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+            endpoint = scope.get("endpoint")
+            REQUEST_DURATION.observe(time.perf_counter() - timings.started,
+                                     endpoint=getattr(endpoint, "__name__", "unmatched"))
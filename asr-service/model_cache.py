@@ -0,0 +1,212 @@
+import gc
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import torch
+
+
+def estimate_model_bytes(model: Any) -> int:
+    """Bytes held by the weights of a Dolphin model, quantized or not."""
+    module = getattr(model, "s2t_model", model)
+    if not isinstance(module, torch.nn.Module):
+        return 0
+
+    # state_dict also covers the packed weights of quantized Linear layers,
+    # which don't show up in parameters()
+    def tensor_bytes(value) -> int:
+        if isinstance(value, torch.Tensor):
+            return value.numel() * value.element_size()
+        if isinstance(value, (tuple, list)):
+            return sum(tensor_bytes(v) for v in value)
+        return 0
+
+    return sum(tensor_bytes(value) for value in module.state_dict().values())
+
+
+class CachedModel:
+    def __init__(self, model: Any, size_bytes: int, load_seconds: float):
+        self.model = model
+        self.size_bytes = size_bytes
+        self.load_seconds = load_seconds
+        self.loaded_at = time.time()
+        self.last_used = self.loaded_at
+        self.refs = 0
+
+
+class ModelHandle:
+    """A reference to one loaded model, held for the duration of a request.
+
+    The cache won't evict a model while handles to it are open, so the
+    model a request started with is the one it finishes with.
+    """
+
+    __slots__ = ("_key", "_model", "_cache", "_released")
+
+    def __init__(self, key: str, model: Any, cache: "ModelCache"):
+        self._key = key
+        self._model = model
+        self._cache = cache
+        self._released = False
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def model(self) -> Any:
+        return self._model
+
+    def release(self):
+        if not self._released:
+            self._released = True
+            self._cache._release(self._key, self._model)
+
+    def __enter__(self) -> "ModelHandle":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class ModelCache:
+    """LRU cache of loaded models bounded by their total size in bytes.
+
+    Pinned models are never evicted. When a new model doesn't fit, the least
+    recently used unpinned models are dropped until it does; a model larger
+    than the whole budget is still kept, but alone next to the pinned ones.
+    Models with open handles are skipped and evicted once released.
+    """
+
+    def __init__(self, max_bytes: int, pinned: Optional[List[str]] = None):
+        self.max_bytes = max_bytes
+        self.pinned = set(pinned or [])
+        self._entries: "OrderedDict[str, CachedModel]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.evictions = 0
+        self.load_seconds = 0.0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(entry.size_bytes for entry in self._entries.values())
+
+    def keys(self) -> List[str]:
+        return list(self._entries.keys())
+
+    def acquire(self, key: str) -> Optional[ModelHandle]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            entry.refs += 1
+            entry.last_used = time.time()
+            self._entries.move_to_end(key)
+            return ModelHandle(key, entry.model, self)
+
+    def put(self, key: str, model: Any, load_seconds: float = 0.0) -> ModelHandle:
+        """Cache a freshly loaded model and return a handle to it."""
+        size_bytes = estimate_model_bytes(model)
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Someone else loaded it first, keep theirs
+                existing.refs += 1
+                return ModelHandle(key, existing.model, self)
+
+            self._make_room(size_bytes)
+            entry = CachedModel(model, size_bytes, load_seconds)
+            entry.refs = 1
+            self._entries[key] = entry
+            self.loads += 1
+            self.load_seconds += load_seconds
+            return ModelHandle(key, model, self)
+
+    def _release(self, key: str, model: Any):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.model is not model:
+                return
+
+            entry.refs -= 1
+            entry.last_used = time.time()
+            if entry.refs == 0 and self.size_bytes > self.max_bytes:
+                # Never the most recently used model, or an oversized one
+                # would be dropped as soon as its first request finished
+                self._make_room(0, keep=next(reversed(self._entries)))
+
+    def _make_room(self, size_bytes: int, keep: Optional[str] = None):
+        for key in list(self._entries.keys()):
+            if self.size_bytes + size_bytes <= self.max_bytes:
+                break
+            if key in self.pinned or key == keep or self._entries[key].refs > 0:
+                continue
+            self._evict(key)
+
+    def _evict(self, key: str):
+        entry = self._entries.pop(key)
+        self.evictions += 1
+        print(f"Evicted ASR model {key} from cache ({entry.size_bytes / 2**20:.0f} MB)")
+
+        # Give the weights back before the next model is loaded
+        del entry
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def evict(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._entries or self._entries[key].refs > 0:
+                return False
+            self._evict(key)
+            return True
+
+    def most_recent(self) -> Optional[str]:
+        with self._lock:
+            return next(reversed(self._entries), None)
+
+    def clear(self) -> int:
+        """Drop every model that isn't in use and return how many were dropped."""
+        with self._lock:
+            idle = [key for key, entry in self._entries.items() if entry.refs == 0]
+            for key in idle:
+                del self._entries[key]
+            gc.collect()
+            return len(idle)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "models": {
+                    key: {
+                        "size_mb": round(entry.size_bytes / 2**20, 1),
+                        "load_seconds": round(entry.load_seconds, 2),
+                        "last_used": entry.last_used,
+                        "in_use": entry.refs,
+                        "pinned": key in self.pinned
+                    }
+                    for key, entry in self._entries.items()
+                },
+                "size_mb": round(self.size_bytes / 2**20, 1),
+                "max_size_mb": round(self.max_bytes / 2**20, 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "total_load_seconds": round(self.load_seconds, 2)
+            }
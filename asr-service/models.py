@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List
 
 
 class ASRRequest(BaseModel):
@@ -23,6 +23,11 @@ class ASRRequest(BaseModel):
         description="ASR model to use",
         example="small"
     )
+    session_id: Optional[str] = Field(
+        None,
+        description="Client session ID. With auto-detection, the language detected for the session is reused.",
+        example="3f1c2a9e"
+    )
 
 
 class TranscribeResponse(BaseModel):
@@ -46,6 +51,12 @@ class LanguagesResponse(BaseModel):
     languages: List[LanguageInfo] = Field(description="Available languages")
 
 
+class RegionsResponse(BaseModel):
+    success: bool = Field(description="Operation success status")
+    language: str = Field(description="Language code")
+    regions: List[Dict[str, str]] = Field(description="Available regions for the language")
+
+
 class ModelInfo(BaseModel):
     name: str = Field(description="Model name")
     size: str = Field(description="Model size description")
@@ -57,6 +68,27 @@ class ModelsResponse(BaseModel):
     models: Dict[str, ModelInfo] = Field(description="Available models")
     current_model: Optional[str] = Field(description="Currently loaded model")
     cache_size: int = Field(description="Number of cached models")
+    cache_stats: Optional[Dict[str, Any]] = Field(
+        None, description="Model cache usage, hits, loads and evictions; not reported with process workers")
+    transcription_cache: Optional[Dict[str, Any]] = Field(
+        None, description="Transcription result cache size and hit rate; not reported with process workers")
+
+
+class ModelStatus(BaseModel):
+    state: str = Field(description="loading, ready or failed")
+    load_seconds: Optional[float] = Field(None, description="Time taken to load the model")
+    warmup_seconds: Optional[float] = Field(None, description="Latency of the warm-up inference")
+    error: Optional[str] = Field(None, description="Why loading or warm-up failed")
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool = Field(description="Whether every preloaded model is loaded and warmed up")
+    models: Dict[str, ModelStatus] = Field(description="Load state of each preloaded model")
+
+
+class GeneralResponse(BaseModel):
+    success: bool = Field(description="Operation success status")
+    message: str = Field(description="Response message")
 
 
 class ErrorResponse(BaseModel):
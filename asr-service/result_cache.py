@@ -0,0 +1,253 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Process workers share the disk tier, so its size is re-measured at least
+# this often rather than only counted by each process
+DISK_RESCAN_SECONDS = 60
+
+
+def make_cache_key(audio_hash: str, model_key: str, language: Optional[str], region: Optional[str]) -> str:
+    return hashlib.sha256(f"{audio_hash}|{model_key}|{language or ''}|{region or ''}".encode()).hexdigest()
+
+
+def hash_audio(audio_data: bytes) -> str:
+    return hashlib.sha256(audio_data).hexdigest()
+
+
+def hash_audio_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TranscriptionCache:
+    """Transcription results keyed by audio content hash, model, language and region.
+
+    Results live in an in-memory LRU and, when ``disk_dir`` is set, as JSON
+    files on disk so they survive restarts and are shared by process workers.
+    Both tiers drop entries older than ``ttl_seconds``; the oldest files are
+    removed once the disk tier grows past ``max_disk_bytes``.
+    """
+
+    def __init__(self, max_entries: int = 1024, disk_dir: Optional[Path] = None,
+                 ttl_seconds: float = 86400, max_disk_bytes: int = 0):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+        self._disk_bytes = 0
+        self._disk_scanned_at = 0.0
+        self._prune_lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_disk()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self.disk_dir is not None
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - created_at > self.ttl_seconds
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, result = entry
+                if not self._expired(created_at):
+                    self._entries.move_to_end(key)
+                    self.memory_hits += 1
+                    return dict(result)
+                del self._entries[key]
+
+        result = self._read_disk(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+
+        self._remember(key, result, time.time())
+        return dict(result)
+
+    def put(self, key: str, result: Dict[str, Any]):
+        created_at = time.time()
+        self._remember(key, result, created_at)
+        self._write_disk(key, result, created_at)
+
+    def _remember(self, key: str, result: Dict[str, Any], created_at: float):
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (created_at, dict(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.disk_dir:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self._expired(entry.get("created_at", 0)):
+            path.unlink(missing_ok=True)
+            return None
+        return entry["result"]
+
+    def _write_disk(self, key: str, result: Dict[str, Any], created_at: float):
+        if not self.disk_dir:
+            return
+
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent,
+                                             suffix=".part", delete=False) as f:
+                json.dump({"created_at": created_at, "result": result}, f, ensure_ascii=False)
+            os.replace(f.name, path)
+            size = path.stat().st_size
+        except OSError as e:
+            print(f"Could not write transcription cache entry: {e}")
+            return
+
+        with self._lock:
+            self._disk_bytes += size
+            due = self.max_disk_bytes > 0 and (
+                self._disk_bytes > self.max_disk_bytes
+                or time.time() - self._disk_scanned_at > DISK_RESCAN_SECONDS)
+        if due:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        # Another thread already scanning is as good as this one doing it
+        if not self._prune_lock.acquire(blocking=False):
+            return
+
+        try:
+            files = []
+            for path in self.disk_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            # Oldest first; trim to 90% so the next few writes don't rescan
+            files.sort()
+            total = sum(size for _, size, _ in files)
+            now = time.time()
+            for modified_at, size, path in files:
+                expired = self.ttl_seconds > 0 and now - modified_at > self.ttl_seconds
+                if not expired and (self.max_disk_bytes <= 0 or total <= self.max_disk_bytes * 0.9):
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+            with self._lock:
+                self._disk_bytes = total
+                self._disk_scanned_at = now
+        finally:
+            self._prune_lock.release()
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+
+        if self.disk_dir:
+            for path in self.disk_dir.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk": str(self.disk_dir) if self.disk_dir else None,
+                "disk_bytes": self._disk_bytes if self.disk_dir else None,
+                "max_disk_bytes": self.max_disk_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 3) if lookups else None
+            }
+
+
+class SessionLanguageCache:
+    """Language and region detected for each client session.
+
+    Entries expire ``ttl_seconds`` after they were last used so an idle
+    session detects again; at most ``max_entries`` sessions are kept.
+    """
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 1800):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[str, Optional[str]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: Optional[str]) -> Optional[Tuple[str, Optional[str]]]:
+        if not session_id:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            used_at, language = entry
+            if self.ttl_seconds > 0 and time.time() - used_at > self.ttl_seconds:
+                del self._entries[session_id]
+                return None
+            self._entries[session_id] = (time.time(), language)
+            self._entries.move_to_end(session_id)
+            return language
+
+    def put(self, session_id: Optional[str], language: Optional[str], region: Optional[str] = None):
+        if not session_id or not language or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[session_id] = (time.time(), (language, region))
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+    def __len__(self) -> int:
+        return len(self._entries)
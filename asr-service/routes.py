@@ -1,22 +1,119 @@
+import asyncio
+import functools
+import json
 import os
-import tempfile
-from fastapi import APIRouter, HTTPException, status, UploadFile, File, Form
-from fastapi.responses import PlainTextResponse
-from models import ASRRequest, TranscribeResponse, LanguagesResponse, ModelsResponse, GeneralResponse
+import time
+import zipfile
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from fastapi import (
+    APIRouter, HTTPException, status, UploadFile, File, Form, Request, WebSocket, WebSocketDisconnect
+)
+from fastapi.responses import PlainTextResponse, StreamingResponse, JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from config import ASR_CONFIG
+from models import (
+    ASRRequest, TranscribeResponse, LanguagesResponse, RegionsResponse, ModelsResponse, GeneralResponse,
+    ReadinessResponse
+)
 from core import (
-    get_available_languages, get_available_models, get_current_model,
-    transcribe_audio_file, transcribe_base64_audio, clear_model_cache,
-    setup_dolphin_model, get_model_cache_size
+    get_language_catalog, get_available_models, get_current_model, get_model_status,
+    run_transcription, run_base64_transcription, run_waveform_transcription,
+    clear_model_cache, get_model_cache_size, get_model_cache_stats, ModelLoadError,
+    get_transcription_cache_stats, clear_transcription_cache, AudioTooLongError,
+    StreamingSession, LongFormTranscript, iter_audio_windows, session_languages
 )
+from workers import inference_pool, QueueFullError
+from metrics import timed, record_since_request_start, render as render_metrics, scraped
 
 router = APIRouter(prefix="/api/asr")
 
-def cleanup_temp_file(file_path: str):
+ZIP_CONTENT_TYPES = {"application/zip", "application/x-zip-compressed"}
+
+
+def is_supported_audio(filename: str) -> bool:
+    extension = os.path.splitext(filename)[1].lstrip(".").lower()
+    return extension in ASR_CONFIG["supported_formats"]
+
+
+def model_cache_stats() -> Optional[Dict[str, Any]]:
+    # Process workers load their own models; the API process never does, so
+    # its model cache would only ever report zeros
+    if inference_pool.worker_type == "process":
+        return None
+    return get_model_cache_stats()
+
+
+def transcription_cache_stats() -> Optional[Dict[str, Any]]:
+    # Process workers each keep their own result cache, which the API
+    # process cannot see, so there are no figures worth reporting
+    if inference_pool.worker_type == "process":
+        return None
+    return get_transcription_cache_stats()
+
+
+def transcription_response(result: Dict[str, Any], model: str) -> JSONResponse:
+    # Rendered here rather than through response_model so serialization is timed
+    with timed("serialize"):
+        return JSONResponse(TranscribeResponse(**result, success=True, used_model=model).model_dump())
+
+
+def catalog_headers(etag: str) -> Dict[str, str]:
+    return {
+        "ETag": f'"{etag}"',
+        "Cache-Control": f"public, max-age={ASR_CONFIG['languages_max_age']}"
+    }
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/").strip('"') for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def session_language(session_id: Optional[str], language: Optional[str],
+                     region: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Language and region to decode with: the caller's choice, or the one
+    already detected for this session when the caller asked for auto-detect."""
+    if language:
+        return language, region
+
+    detected = session_languages.get(session_id)
+    if detected is None:
+        return language, region
+    return detected[0], region or detected[1]
+
+
+def remember_session_language(session_id: Optional[str], result: Optional[Dict[str, Any]]):
+    if result:
+        session_languages.put(session_id, result.get("language"), result.get("region"))
+
+
+async def run_inference(fn: Callable, *args) -> Any:
     try:
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-    except OSError:
-        pass
+        return await inference_pool.run(fn, *args, timeout=ASR_CONFIG["request_timeout"])
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="ASR service is busy, please retry later",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Transcription timed out after {ASR_CONFIG['request_timeout']} seconds"
+        )
+    except ModelLoadError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+    except AudioTooLongError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
 
 @router.get(
     "/languages",
@@ -24,16 +121,44 @@ def cleanup_temp_file(file_path: str):
     tags=["Languages"],
     summary="Get available languages"
 )
-async def get_languages():
+async def get_languages(request: Request):
+    """The catalog is built once at startup. Clients should revalidate with
+    ``If-None-Match``, which is answered with an empty 304 when unchanged."""
     try:
-        languages = get_available_languages()
-        return LanguagesResponse(success=True, languages=languages)
+        catalog = get_language_catalog()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get languages: {str(e)}"
         )
 
+    headers = catalog_headers(catalog["etag"])
+    if etag_matches(request, catalog["etag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=catalog["body"], media_type="application/json", headers=headers)
+
+@router.get(
+    "/languages/{language}/regions",
+    response_model=RegionsResponse,
+    tags=["Languages"],
+    summary="Get the regions of one language"
+)
+async def get_language_regions(language: str, request: Request):
+    catalog = get_language_catalog()
+    if language not in catalog["regions"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown language: {language}"
+        )
+
+    etag = f"{catalog['etag']}-{language}"
+    headers = catalog_headers(etag)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response = RegionsResponse(success=True, language=language, regions=catalog["regions"][language])
+    return JSONResponse(content=response.model_dump(), headers=headers)
+
 @router.get(
     "/models",
     response_model=ModelsResponse,
@@ -46,7 +171,9 @@ async def get_models():
             success=True,
             models=get_available_models(),
             current_model=get_current_model(),
-            cache_size=get_model_cache_size()
+            cache_size=get_model_cache_size(),
+            cache_stats=model_cache_stats(),
+            transcription_cache=transcription_cache_stats()
         )
     except Exception as e:
         raise HTTPException(
@@ -64,7 +191,8 @@ async def transcribe_audio(
     audio: UploadFile = File(..., description="Audio file to transcribe"),
     language: str = Form(None, description="Language code (e.g., 'en')"),
     region: str = Form(None, description="Region code (e.g., 'us')"),
-    model: str = Form("small", description="ASR model to use")
+    model: str = Form("small", description="ASR model to use"),
+    session_id: str = Form(None, description="Reuse the language detected earlier in this session")
 ):
     if not audio.content_type or not audio.content_type.startswith('audio/'):
         raise HTTPException(
@@ -72,21 +200,78 @@ async def transcribe_audio(
             detail="File must be an audio file"
         )
     
-    temp_file_path = None
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-            temp_file_path = temp_file.name
-            content = await audio.read()
-            temp_file.write(content)
-        
-        if not setup_dolphin_model(model):
+        content = await audio.read()
+        record_since_request_start("upload_read")
+        result = await run_inference(
+            run_transcription, model, content, *session_language(session_id, language, region))
+        if result is None:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to load ASR model: {model}"
+                detail="Transcription failed: could not decode audio"
             )
-        
-        result = transcribe_audio_file(temp_file_path, language, region)
-        return TranscribeResponse(**result, success=True, used_model=model)
+        if not language:
+            remember_session_language(session_id, result)
+        return transcription_response(result, model)
+
+    except Exception as e:
+        if isinstance(e, HTTPException):
+            raise e
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Transcription failed: {str(e)}"
+        )
+
+@router.post(
+    "/transcribe/raw",
+    response_model=TranscribeResponse,
+    tags=["Transcription"],
+    summary="Transcribe a raw audio request body"
+)
+async def transcribe_raw(
+    request: Request,
+    language: Optional[str] = None,
+    region: Optional[str] = None,
+    model: str = "small",
+    session_id: Optional[str] = None
+):
+    """Transcribe audio sent as the request body (``application/octet-stream``
+    or ``audio/*``) instead of multipart or base64 JSON. The body is read in
+    chunks as it arrives."""
+    max_bytes = ASR_CONFIG["max_upload_mb"] * 2**20
+    if int(request.headers.get("content-length") or 0) > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Audio is larger than {ASR_CONFIG['max_upload_mb']} MB"
+        )
+
+    content = bytearray()
+    async for chunk in request.stream():
+        content += chunk
+        if len(content) > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Audio is larger than {ASR_CONFIG['max_upload_mb']} MB"
+            )
+
+    record_since_request_start("upload_read")
+    if not content:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Request body is empty"
+        )
+
+    try:
+        result = await run_inference(
+            run_transcription, model, content, *session_language(session_id, language, region))
+        if result is None:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Transcription failed: could not decode audio"
+            )
+        if not language:
+            remember_session_language(session_id, result)
+        return transcription_response(result, model)
 
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -95,9 +280,6 @@ async def transcribe_audio(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Transcription failed: {str(e)}"
         )
-    finally:
-        if temp_file_path:
-            cleanup_temp_file(temp_file_path)
 
 @router.post(
     "/transcribe/base64",
@@ -106,17 +288,20 @@ async def transcribe_audio(
     summary="Transcribe base64 audio"
 )
 async def transcribe_base64(request: ASRRequest):
+    record_since_request_start("upload_read")
     try:
-        if not setup_dolphin_model(request.model):
+        result = await run_inference(
+            run_base64_transcription, request.model, request.audio_data,
+            *session_language(request.session_id, request.language, request.region)
+        )
+        if result is None:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to load ASR model: {request.model}"
+                detail="Transcription failed: could not decode audio"
             )
-        
-        result = transcribe_base64_audio(
-            request.audio_data, request.language, request.region
-        )
-        return TranscribeResponse(**result, success=True, used_model=request.model)
+        if not request.language:
+            remember_session_language(request.session_id, result)
+        return transcription_response(result, request.model)
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
@@ -125,6 +310,339 @@ async def transcribe_base64(request: ASRRequest):
             detail=f"Transcription failed: {str(e)}"
         )
 
+@router.post(
+    "/transcribe/batch",
+    tags=["Transcription"],
+    summary="Transcribe many audio files"
+)
+async def transcribe_batch(
+    files: List[UploadFile] = File(..., description="Audio files, or ZIP archives of audio files"),
+    language: str = Form(None, description="Language code (e.g., 'en')"),
+    region: str = Form(None, description="Region code (e.g., 'us')"),
+    model: str = Form("small", description="ASR model to use")
+):
+    """Transcribe a list of uploads or ZIP archives as newline-delimited JSON.
+
+    Files are fed to the inference workers a few at a time and each result
+    is sent as a ``{"type": "result", ...}`` line as soon as it finishes, so
+    lines may arrive out of order; ``index`` gives the position in the
+    batch. A ``{"type": "summary", ...}`` line closes the stream.
+    """
+    # The stream reads the uploads after this handler returns. FastAPI up to
+    # 0.105 (requirements.txt pins 0.104.1) closes them only once the response
+    # is sent; from 0.106 on they must be copied here first.
+    max_file_bytes = ASR_CONFIG["max_upload_mb"] * 2**20
+    max_archive_bytes = ASR_CONFIG["batch_max_archive_mb"] * 2**20
+    sources = []
+    for upload in files:
+        filename = upload.filename or f"file-{len(sources)}"
+        if filename.lower().endswith(".zip") or upload.content_type in ZIP_CONTENT_TYPES:
+            try:
+                archive = await run_in_threadpool(zipfile.ZipFile, upload.file)
+            except zipfile.BadZipFile:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"{filename} is not a valid ZIP archive"
+                )
+
+            # Checked before anything is extracted, so a small archive can't
+            # expand past the limits in memory. zipfile never reads more than
+            # the size a member declares.
+            archive_bytes = 0
+            for info in archive.infolist():
+                if info.is_dir() or not is_supported_audio(info.filename):
+                    continue
+                if info.file_size > max_file_bytes:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"{info.filename} in {filename} is larger than {ASR_CONFIG['max_upload_mb']} MB"
+                    )
+                archive_bytes += info.file_size
+                if archive_bytes > max_archive_bytes:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"{filename} unpacks to more than {ASR_CONFIG['batch_max_archive_mb']} MB"
+                    )
+                sources.append((info.filename, functools.partial(archive.read, info)))
+        elif (upload.content_type or "").startswith("audio/") or is_supported_audio(filename):
+            if (upload.size or 0) > max_file_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"{filename} is larger than {ASR_CONFIG['max_upload_mb']} MB"
+                )
+            sources.append((filename, upload.file.read))
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{filename} is not an audio file or ZIP archive"
+            )
+
+    if not sources:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No audio files found in the request"
+        )
+    if len(sources) > ASR_CONFIG["batch_max_files"]:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch has {len(sources)} files, the limit is {ASR_CONFIG['batch_max_files']}"
+        )
+
+    # One file per worker at a time leaves room in the queue for live traffic
+    slots = asyncio.Semaphore(inference_pool.max_workers)
+
+    async def transcribe_one(index: int, filename: str, read: Callable[[], bytes]) -> dict:
+        line = {"type": "result", "index": index, "filename": filename}
+        async with slots:
+            try:
+                audio_data = await run_in_threadpool(read)
+                give_up_at = time.monotonic() + ASR_CONFIG["batch_busy_wait_seconds"]
+                while True:
+                    try:
+                        result = await inference_pool.run(
+                            run_transcription, model, audio_data, language, region,
+                            timeout=ASR_CONFIG["request_timeout"]
+                        )
+                        break
+                    except QueueFullError as e:
+                        if time.monotonic() + e.retry_after > give_up_at:
+                            return {**line, "success": False, "error": "ASR service is busy, please retry later",
+                                    "retry_after": e.retry_after}
+                        await asyncio.sleep(e.retry_after)
+            except asyncio.TimeoutError:
+                return {**line, "success": False, "error": "Transcription timed out"}
+            except Exception as e:
+                return {**line, "success": False, "error": str(e)}
+
+        if result is None:
+            return {**line, "success": False, "error": "Could not decode audio"}
+        return {**line, "success": True, **result, "used_model": model}
+
+    async def stream():
+        tasks = [asyncio.ensure_future(transcribe_one(index, *source)) for index, source in enumerate(sources)]
+        succeeded = 0
+        try:
+            for task in asyncio.as_completed(tasks):
+                line = await task
+                succeeded += line["success"]
+                yield json.dumps(line, ensure_ascii=False) + "\n"
+
+            yield json.dumps({
+                "type": "summary",
+                "total": len(tasks),
+                "succeeded": succeeded,
+                "failed": len(tasks) - succeeded
+            }) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+@router.post(
+    "/transcribe/long",
+    tags=["Transcription"],
+    summary="Transcribe a long recording window by window"
+)
+async def transcribe_long_audio(
+    audio: UploadFile = File(..., description="Audio file to transcribe"),
+    language: str = Form(None, description="Language code (e.g., 'en')"),
+    region: str = Form(None, description="Region code (e.g., 'us')"),
+    model: str = Form("small", description="ASR model to use"),
+    session_id: str = Form(None, description="Reuse the language detected earlier in this session")
+):
+    """Transcribe audio of any length as newline-delimited JSON.
+
+    The upload is read in overlapping windows so memory stays flat. Each
+    decoded window is sent as ``{"type": "window", ...}`` with only the text
+    that wasn't already covered by the overlap, followed by one
+    ``{"type": "final", ...}`` line with the merged transcript.
+    """
+    if not audio.content_type or not audio.content_type.startswith('audio/'):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File must be an audio file"
+        )
+
+    auto_detect = not language
+    language, region = session_language(session_id, language, region)
+    # Like /transcribe/batch, this streams from the upload after returning,
+    # which relies on FastAPI before 0.106 keeping it open until the
+    # response is sent
+    windows = iter_audio_windows(audio.file)
+    transcript = LongFormTranscript(language, region)
+
+    async def next_window():
+        return await run_in_threadpool(next, windows, None)
+
+    try:
+        try:
+            window = await next_window()
+        except (ValueError, EOFError, OSError) as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Could not decode audio: {str(e)}"
+            )
+        if window is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Audio file is empty"
+            )
+
+        # The first window is decoded before responding so that a busy queue or
+        # a model that fails to load still comes back as a proper HTTP status.
+        decoding = asyncio.ensure_future(
+            run_inference(run_waveform_transcription, model, window[2], language, region))
+        try:
+            upcoming = await next_window()
+        except Exception as e:
+            # Reported in the stream once the windows before it are sent
+            upcoming = e
+        result = await decoding
+    except BaseException:
+        await run_in_threadpool(windows.close)
+        raise
+
+    if auto_detect and result:
+        # Later windows are decoded in the language found in the first one
+        remember_session_language(session_id, result)
+        language, region = result["language"] or language, result["region"] or region
+
+    def window_line(index, window, result):
+        return json.dumps({
+            "type": "window",
+            "index": index,
+            "start": round(window[0], 2),
+            "end": round(window[1], 2),
+            "text": transcript.add(result)
+        }, ensure_ascii=False) + "\n"
+
+    async def stream():
+        index, current, current_result, following = 0, window, result, upcoming
+        try:
+            while True:
+                yield window_line(index, current, current_result)
+                if following is None:
+                    break
+                if isinstance(following, Exception):
+                    raise following
+
+                # Read the next window while this one is being decoded
+                decoding = asyncio.ensure_future(inference_pool.run(
+                    run_waveform_transcription, model, following[2], language, region,
+                    timeout=ASR_CONFIG["request_timeout"]
+                ))
+                index, current = index + 1, following
+                try:
+                    following = await next_window()
+                except Exception as e:
+                    # Reported like the first window's, once this one is sent
+                    following = e
+                except BaseException:
+                    decoding.cancel()
+                    raise
+                current_result = await decoding
+
+            final = transcript.final()
+            final.update({"type": "final", "used_model": model})
+            yield json.dumps(final, ensure_ascii=False) + "\n"
+
+        except QueueFullError as e:
+            yield json.dumps({
+                "type": "error",
+                "detail": "ASR service is busy, please retry later",
+                "retry_after": e.retry_after,
+                "text": transcript.text
+            }, ensure_ascii=False) + "\n"
+        except Exception as e:
+            yield json.dumps({
+                "type": "error",
+                "detail": str(e) or "Transcription timed out",
+                "text": transcript.text
+            }, ensure_ascii=False) + "\n"
+        finally:
+            await run_in_threadpool(windows.close)
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+@router.websocket("/stream")
+async def stream_transcription(
+    websocket: WebSocket,
+    language: Optional[str] = None,
+    region: Optional[str] = None,
+    model: str = "small",
+    sample_rate: int = 16000,
+    session_id: Optional[str] = None
+):
+    """Live transcription over a WebSocket.
+
+    The client sends 16-bit mono PCM as binary frames at ``sample_rate`` and a
+    text frame ``end`` when the user stops talking. The server answers with
+    ``{"type": "partial", "text": ...}`` messages while audio arrives and one
+    ``{"type": "final", ...}`` message before closing.
+    """
+    await websocket.accept()
+    session = StreamingSession(sample_rate)
+    session.language, session.region = session_language(session_id, language, region)
+
+    async def decode(waveform):
+        # Once a segment has been committed its language is kept for the rest
+        return await inference_pool.run(
+            run_waveform_transcription, model, waveform,
+            language or session.language, region or session.region,
+            timeout=ASR_CONFIG["request_timeout"]
+        )
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+            if message.get("bytes"):
+                session.add_pcm(message["bytes"])
+
+                segment = session.pop_segment()
+                if segment is not None:
+                    session.commit(await decode(segment))
+                elif session.wants_partial():
+                    session.set_partial(await decode(session.take_partial_audio()))
+                else:
+                    continue
+
+                await websocket.send_json({"type": "partial", "text": session.text})
+
+            elif (message.get("text") or "").strip() == "end":
+                remainder = session.flush()
+                if remainder is not None:
+                    session.commit(await decode(remainder))
+
+                if not language:
+                    session_languages.put(session_id, session.language, session.region)
+                await websocket.send_json({
+                    "type": "final",
+                    "text": session.text,
+                    "language": session.language,
+                    "region": session.region,
+                    "used_model": model
+                })
+                await websocket.close()
+                return
+
+    except WebSocketDisconnect:
+        pass
+    except QueueFullError as e:
+        await websocket.send_json({
+            "type": "error",
+            "detail": "ASR service is busy, please retry later",
+            "retry_after": e.retry_after
+        })
+        await websocket.close(code=1013)
+    except (asyncio.TimeoutError, ModelLoadError) as e:
+        await websocket.send_json({"type": "error", "detail": str(e) or "Transcription timed out"})
+        await websocket.close(code=1011)
+
 @router.delete(
     "/cache",
     response_model=GeneralResponse,
@@ -144,6 +662,25 @@ async def clear_cache():
             detail=f"Failed to clear cache: {str(e)}"
         )
 
+@router.delete(
+    "/cache/transcriptions",
+    response_model=GeneralResponse,
+    tags=["Health & Management"],
+    summary="Clear transcription result cache"
+)
+async def clear_transcriptions_cache():
+    try:
+        cached_count = clear_transcription_cache()
+        return GeneralResponse(
+            success=True,
+            message=f"Transcription cache cleared. Removed {cached_count} cached results."
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to clear transcription cache: {str(e)}"
+        )
+
 @router.get(
     "/health",
     response_class=PlainTextResponse,
@@ -152,3 +689,61 @@ async def clear_cache():
 )
 async def health_check():
     return PlainTextResponse("healthy")
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    tags=["Health & Management"],
+    summary="Prometheus metrics"
+)
+async def metrics():
+    """Stage and request latency histograms, real-time factor, queue depth and
+    cache usage in the Prometheus text format. With process workers the cache
+    series are left out, since the caches live in the workers."""
+    model_stats = model_cache_stats()
+    result_stats = transcription_cache_stats()
+
+    lines = []
+    lines += scraped("asr_queue_depth", "Requests waiting for a free inference worker",
+                     {(): inference_pool.queue_depth})
+    lines += scraped("asr_inflight_requests", "Requests running on or waiting for an inference worker",
+                     {(): inference_pool.pending})
+    lines += scraped("asr_queue_capacity", "Requests the inference pool accepts before answering 503",
+                     {(): inference_pool.capacity})
+    if model_stats is not None:
+        lines += scraped("asr_model_cache_bytes", "Estimated size of the loaded models",
+                         {(): int(model_stats["size_mb"] * 2**20)})
+        lines += scraped("asr_model_cache_models", "Models currently loaded",
+                         {(): len(model_stats["models"])})
+        lines += scraped("asr_model_cache_lookups_total", "Model cache lookups by result",
+                         {(("result", "hit"),): model_stats["hits"], (("result", "miss"),): model_stats["misses"]},
+                         "counter")
+        lines += scraped("asr_model_cache_evictions_total", "Models evicted from the cache",
+                         {(): model_stats["evictions"]}, "counter")
+        lines += scraped("asr_model_load_seconds_total", "Time spent loading models",
+                         {(): model_stats["total_load_seconds"]}, "counter")
+    if result_stats is not None:
+        lines += scraped("asr_transcription_cache_entries", "Transcription results held in memory",
+                         {(): result_stats["entries"]})
+        lines += scraped("asr_transcription_cache_lookups_total", "Transcription cache lookups by result",
+                         {(("result", "memory_hit"),): result_stats["memory_hits"],
+                          (("result", "disk_hit"),): result_stats["disk_hits"],
+                          (("result", "miss"),): result_stats["misses"]}, "counter")
+
+    return PlainTextResponse(render_metrics(lines), media_type="text/plain; version=0.0.4")
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    tags=["Health & Management"],
+    summary="Readiness check",
+    responses={503: {"model": ReadinessResponse, "description": "Models are still loading or failed to load"}}
+)
+async def readiness_check():
+    models = get_model_status()
+    ready = bool(models) and all(model["state"] == "ready" for model in models.values())
+    response = ReadinessResponse(ready=ready, models=models)
+    return JSONResponse(
+        content=response.model_dump(),
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
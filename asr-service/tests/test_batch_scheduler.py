@@ -0,0 +1,87 @@
+import threading
+import time
+
+import numpy as np
+
+import core
+
+
+def recording_decoder(monkeypatch, release: threading.Event = None):
+    """Patches the batch decode to record each group's size."""
+    batches = []
+
+    def decode(model, waveforms, language=None, region=None):
+        batches.append(len(waveforms))
+        if release is not None:
+            release.wait(5)
+        return [{"text": str(len(w)), "language": language, "region": region} for w in waveforms]
+
+    monkeypatch.setattr(core, "transcribe_waveform_batch", decode)
+    return batches
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_idle_model_decodes_without_waiting(monkeypatch):
+    batches = recording_decoder(monkeypatch)
+    scheduler = core.BatchScheduler(max_batch_size=4, window_ms=2000)
+
+    started = time.monotonic()
+    assert scheduler.submit("idle", object(), np.zeros(1))["text"] == "1"
+    assert time.monotonic() - started < 1
+    assert batches == [1]
+
+
+def test_requests_arriving_while_busy_share_one_decode(monkeypatch):
+    release = threading.Event()
+    batches = recording_decoder(monkeypatch, release)
+    scheduler = core.BatchScheduler(max_batch_size=4, window_ms=300)
+    results = {}
+
+    def submit(waveform):
+        results[waveform] = scheduler.submit("busy", object(), np.zeros(waveform))["text"]
+
+    first = threading.Thread(target=submit, args=(1,))
+    first.start()
+    wait_for(lambda: batches)
+
+    followers = [threading.Thread(target=submit, args=(n,)) for n in (2, 3)]
+    for thread in followers:
+        thread.start()
+        time.sleep(0.05)
+    release.set()
+    for thread in [first, *followers]:
+        thread.join(5)
+
+    assert batches == [1, 2]
+    assert results == {1: "1", 2: "2", 3: "3"}
+
+
+def test_full_group_stops_waiting(monkeypatch):
+    release = threading.Event()
+    batches = recording_decoder(monkeypatch, release)
+    scheduler = core.BatchScheduler(max_batch_size=2, window_ms=10_000)
+
+    blocker = threading.Thread(target=scheduler.submit, args=("full", object(), np.zeros(1)))
+    blocker.start()
+    wait_for(lambda: batches)
+    release.set()
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=scheduler.submit, args=("full", object(), np.zeros(n))) for n in (1, 2)]
+    # Keep the model busy so the leader would otherwise wait the whole window
+    scheduler._running["full"] += 1
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    scheduler._running["full"] -= 1
+    blocker.join(5)
+
+    assert time.monotonic() - started < 5
+    assert batches[-1] == 2
@@ -0,0 +1,39 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routes import router
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+def test_unchanged_catalog_is_answered_with_304():
+    response = client.get("/api/asr/languages")
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    etag = response.headers["ETag"]
+    assert "max-age" in response.headers["Cache-Control"]
+
+    revalidated = client.get("/api/asr/languages", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+
+    # Weak validators and lists of tags match as well
+    assert client.get("/api/asr/languages", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+    assert client.get("/api/asr/languages", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_regions_have_their_own_etag():
+    languages = client.get("/api/asr/languages")
+    language = languages.json()["languages"][0]["code"]
+
+    response = client.get(f"/api/asr/languages/{language}/regions")
+    assert response.status_code == 200
+    assert response.headers["ETag"] != languages.headers["ETag"]
+
+    revalidated = client.get(f"/api/asr/languages/{language}/regions",
+                             headers={"If-None-Match": response.headers["ETag"]})
+    assert revalidated.status_code == 304
+    assert client.get("/api/asr/languages/xx/regions").status_code == 404
@@ -0,0 +1,66 @@
+import torch
+
+from model_cache import ModelCache
+
+MODEL_BYTES = 64 * 64 * 4
+
+
+def model():
+    return torch.nn.Linear(64, 64, bias=False)
+
+
+def fill(cache, *keys):
+    for key in keys:
+        cache.put(key, model()).release()
+
+
+def test_least_recently_used_model_is_evicted_first():
+    cache = ModelCache(max_bytes=2 * MODEL_BYTES)
+    fill(cache, "base", "small")
+    cache.acquire("base").release()
+
+    fill(cache, "large")
+    assert cache.keys() == ["base", "large"]
+    assert cache.evictions == 1
+    assert cache.size_bytes == 2 * MODEL_BYTES
+
+
+def test_pinned_models_are_never_evicted():
+    cache = ModelCache(max_bytes=2 * MODEL_BYTES, pinned=["base"])
+    fill(cache, "base", "small", "large", "medium")
+    assert cache.keys() == ["base", "medium"]
+
+
+def test_model_in_use_is_evicted_once_released():
+    cache = ModelCache(max_bytes=MODEL_BYTES)
+    handle = cache.put("base", model())
+
+    fill(cache, "small")
+    # Over budget while the request on "base" still runs
+    assert cache.keys() == ["base", "small"]
+    assert handle.model is not None
+
+    handle.release()
+    handle.release()
+    assert cache.keys() == ["small"]
+    assert not cache.evict("missing")
+
+
+def test_model_larger_than_the_budget_is_kept_alone():
+    cache = ModelCache(max_bytes=MODEL_BYTES // 2)
+    fill(cache, "base", "small")
+    assert cache.keys() == ["small"]
+
+
+def test_second_load_reuses_the_cached_model():
+    cache = ModelCache(max_bytes=2 * MODEL_BYTES)
+    first = cache.put("base", model())
+    second = cache.put("base", model())
+    assert second.model is first.model
+
+    first.release()
+    assert not cache.evict("base")
+    second.release()
+    assert cache.evict("base")
+    assert cache.acquire("base") is None
+    assert cache.stats()["misses"] == 1
@@ -0,0 +1,37 @@
+import core
+
+
+def test_words_repeated_from_the_overlap_are_dropped():
+    previous = "the patient reports chest pain since yesterday morning"
+    current = "yesterday morning and shortness of breath"
+    assert core.merge_overlap_text(previous, current) == "and shortness of breath"
+
+
+def test_repeated_words_in_speech_are_kept():
+    # Only the overlap is removed; the speaker's own repeat of "stable" stays
+    previous = "blood pressure is stable"
+    current = "is stable stable and the patient is alert"
+    assert core.merge_overlap_text(previous, current) == "stable and the patient is alert"
+
+
+def test_match_must_reach_the_end_of_the_previous_text():
+    previous = "no fever no cough reported today"
+    current = "no fever at night"
+    assert core.merge_overlap_text(previous, current) == "no fever at night"
+
+
+def test_single_word_match_is_not_trusted():
+    assert core.merge_overlap_text("take two tablets", "tablets daily") == "tablets daily"
+
+
+def test_empty_sides():
+    assert core.merge_overlap_text("", " first window ") == "first window"
+    assert core.merge_overlap_text("some text", "") == ""
+
+
+def test_long_form_transcript_joins_windows():
+    transcript = core.LongFormTranscript(language="en")
+    assert transcript.add({"text": "one two three four"}) == "one two three four"
+    assert transcript.add({"text": "three four five six"}) == "five six"
+    assert transcript.add(None) == ""
+    assert transcript.text == "one two three four five six"
@@ -0,0 +1,73 @@
+import os
+
+import result_cache
+from result_cache import TranscriptionCache
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+def fake_clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(result_cache.time, "time", clock.time)
+    return clock
+
+
+def test_least_recently_used_result_is_dropped():
+    cache = TranscriptionCache(max_entries=2)
+    cache.put("a", {"text": "a"})
+    cache.put("b", {"text": "b"})
+    assert cache.get("a") == {"text": "a"}
+
+    cache.put("c", {"text": "c"})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"text": "a"}
+    assert cache.get("c") == {"text": "c"}
+
+
+def test_results_expire_after_ttl(monkeypatch):
+    clock = fake_clock(monkeypatch)
+    cache = TranscriptionCache(max_entries=4, ttl_seconds=60)
+    cache.put("a", {"text": "a"})
+
+    clock.now += 59
+    assert cache.get("a") == {"text": "a"}
+    clock.now += 2
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_disk_tier_survives_restart_and_expires(tmp_path, monkeypatch):
+    clock = fake_clock(monkeypatch)
+    TranscriptionCache(max_entries=4, disk_dir=tmp_path, ttl_seconds=60).put("ab12", {"text": "salam"})
+
+    restarted = TranscriptionCache(max_entries=4, disk_dir=tmp_path, ttl_seconds=60)
+    assert restarted.get("ab12") == {"text": "salam"}
+    assert restarted.stats()["disk_hits"] == 1
+
+    clock.now += 61
+    assert TranscriptionCache(max_entries=0, disk_dir=tmp_path, ttl_seconds=60).get("ab12") is None
+    assert not list(tmp_path.glob("*/*.json"))
+
+
+def test_disk_tier_drops_oldest_files_past_its_budget(tmp_path):
+    cache = TranscriptionCache(max_entries=0, disk_dir=tmp_path, ttl_seconds=0)
+    text = "x" * 1000
+    for n in range(5):
+        key = f"{n:02d}" + "0" * 62
+        cache.put(key, {"text": text})
+        os.utime(cache._disk_path(key), (n, n))
+    entry_bytes = cache._disk_path("00" + "0" * 62).stat().st_size
+
+    cache.max_disk_bytes = 3 * entry_bytes
+    cache.put("05" + "0" * 62, {"text": text})
+
+    remaining = sorted(path.stem[:2] for path in tmp_path.glob("*/*.json"))
+    # Trimmed below the budget, oldest first
+    assert remaining == ["04", "05"]
+    assert cache.stats()["disk_bytes"] <= 3 * entry_bytes
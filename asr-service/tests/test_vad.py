@@ -0,0 +1,61 @@
+import numpy as np
+
+import core
+
+SAMPLE_RATE = 16000
+
+
+def voiced(seconds: float, amplitude: float) -> np.ndarray:
+    """A 180 Hz tone with a syllable-rate envelope and no pauses."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    envelope = 0.6 + 0.4 * np.abs(np.sin(2 * np.pi * 3 * t))
+    return (amplitude * envelope * np.sin(2 * np.pi * 180 * t)).astype(np.float32)
+
+
+def covered(segments, num_samples: int) -> float:
+    return sum(end - start for start, end in segments) / num_samples
+
+
+def refuse(*args):
+    raise AssertionError("silence must not reach the model")
+
+
+def test_continuous_speech_is_detected():
+    for amplitude in (0.5, 0.03):
+        waveform = voiced(10, amplitude)
+        assert covered(core.detect_speech_segments(waveform), len(waveform)) > 0.95
+
+
+def test_loud_then_soft_speaker_is_detected():
+    waveform = np.concatenate([voiced(5, 0.5), voiced(5, 0.08)])
+    segments = core.detect_speech_segments(waveform)
+    assert covered(segments, len(waveform)) > 0.95
+    assert segments[-1][1] == len(waveform)
+
+
+def test_noise_between_utterances_is_skipped():
+    waveform = np.random.default_rng(0).normal(0, 0.03, 10 * SAMPLE_RATE).astype(np.float32)
+    waveform[2 * SAMPLE_RATE:4 * SAMPLE_RATE] += voiced(2, 0.5)
+    waveform[6 * SAMPLE_RATE:8 * SAMPLE_RATE] += voiced(2, 0.5)
+    segments = core.detect_speech_segments(waveform)
+    assert len(segments) == 2
+    assert covered(segments, len(waveform)) < 0.6
+
+
+def test_audible_input_is_transcribed_when_vad_finds_nothing(monkeypatch):
+    decoded = []
+    monkeypatch.setattr(core, "detect_speech_segments", lambda waveform: [])
+    monkeypatch.setitem(core.ASR_CONFIG, "lid_enabled", False)
+    monkeypatch.setattr(core.batch_scheduler, "submit",
+                        lambda model_key, model, waveform, language, region: decoded.append(len(waveform))
+                        or {"text": "salam", "language": language, "region": region})
+
+    result = core.transcribe_speech("base", object(), voiced(3, 0.5), language="fa")
+    assert result["text"] == "salam"
+    assert decoded == [3 * SAMPLE_RATE]
+
+
+def test_silence_is_not_decoded(monkeypatch):
+    monkeypatch.setattr(core.batch_scheduler, "submit", refuse)
+    result = core.transcribe_speech("base", object(), np.zeros(3 * SAMPLE_RATE, dtype=np.float32))
+    assert result["text"] == ""
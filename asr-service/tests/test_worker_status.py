@@ -0,0 +1,23 @@
+import core
+
+
+def ready(load_seconds, warmup_seconds):
+    return {"state": "ready", "load_seconds": load_seconds, "warmup_seconds": warmup_seconds, "error": None}
+
+
+def test_ready_when_every_worker_is_ready():
+    merged = core.merge_worker_statuses([
+        (101, {"small": ready(1.0, 0.2)}),
+        (102, {"small": ready(2.0, 0.1)}),
+    ])
+    assert merged == {"small": ready(2.0, 0.2)}
+
+
+def test_one_failed_worker_fails_the_model():
+    merged = core.merge_worker_statuses([
+        (101, {"small": ready(1.0, 0.2), "base": ready(3.0, 0.4)}),
+        (102, {"small": {"state": "failed", "error": "out of memory"}, "base": ready(3.0, 0.4)}),
+    ])
+    assert merged["small"]["state"] == "failed"
+    assert merged["small"]["error"] == "worker 102: out of memory"
+    assert merged["base"]["state"] == "ready"
@@ -0,0 +1,110 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from config import ASR_CONFIG
+from metrics import QUEUE_REJECTIONS, run_timed, record_worker_timings
+
+
+class QueueFullError(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__("ASR inference queue is full")
+        self.retry_after = retry_after
+
+
+class InferencePool:
+    def __init__(self, worker_type: str = "thread", max_workers: int = 1,
+                 max_queue_size: int = 0, retry_after: int = 5):
+        if worker_type not in ("thread", "process"):
+            raise ValueError(f"Unknown ASR worker type: {worker_type}")
+
+        self.worker_type = worker_type
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self.retry_after = retry_after
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue_size
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._pending - self.max_workers)
+
+    def start(self, initializer: Optional[Callable] = None, initargs: tuple = ()):
+        if self._executor is not None:
+            return
+
+        if self.worker_type == "process":
+            # Each worker process loads its own copy of the model; spawn avoids
+            # forking a parent that already holds torch threads.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=initializer,
+                initargs=initargs
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="asr-worker"
+            )
+
+    def shutdown(self):
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def _reserve_slot(self):
+        with self._lock:
+            if self._pending >= self.capacity:
+                QUEUE_REJECTIONS.inc()
+                raise QueueFullError(self.retry_after)
+            self._pending += 1
+
+    def _release_slot(self, *_):
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        if self._executor is None:
+            self.start()
+
+        self._reserve_slot()
+        try:
+            future = self._executor.submit(run_timed, fn, time.time(), *args)
+        except Exception:
+            self._release_slot()
+            raise
+
+        # The slot is held until the work really finishes, even if the caller
+        # times out, so an abandoned decode still counts against the queue.
+        future.add_done_callback(self._release_slot)
+
+        try:
+            result, stages, audio_seconds = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise
+
+        record_worker_timings(stages, audio_seconds)
+        return result
+
+
+inference_pool = InferencePool(
+    worker_type=ASR_CONFIG["worker_type"],
+    max_workers=ASR_CONFIG["max_workers"],
+    max_queue_size=ASR_CONFIG["max_queue_size"],
+    retry_after=ASR_CONFIG["retry_after"]
+)
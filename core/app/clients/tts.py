@@ -4,10 +4,16 @@ import os
 from typing import Optional, Dict, Any
 
 
+AUDIO_EXTENSIONS = {"wav": ".wav", "opus": ".ogg", "mp3": ".mp3"}
+
+
 class TTSServiceClient:
-    def __init__(self, base_url: str = None):
+    def __init__(self, base_url: str = None, audio_format: str = None):
         self.base_url = (base_url or os.getenv(
             "TTS_SERVICE_URL", "http://localhost:8001")).rstrip('/')
+        # Compressed formats are a fraction of the size of WAV on the way
+        # to the browser
+        self.audio_format = audio_format or os.getenv("TTS_AUDIO_FORMAT", "wav")
         self._voices_cache = None
 
     def get_voices(self) -> Dict[str, Any]:
@@ -41,7 +47,8 @@ class TTSServiceClient:
                 "speaker_id": speaker_id,
                 "speed": speed,
                 "noise_scale": noise_scale,
-                "noise_scale_w": noise_scale_w
+                "noise_scale_w": noise_scale_w,
+                "audio_format": self.audio_format
             }
 
             response = requests.post(
@@ -53,7 +60,7 @@ class TTSServiceClient:
             response.raise_for_status()
 
             temp_file = tempfile.NamedTemporaryFile(
-                suffix=".wav", delete=False)
+                suffix=AUDIO_EXTENSIONS.get(self.audio_format, ".wav"), delete=False)
             temp_file.write(response.content)
             temp_file.close()
 
@@ -1,9 +1,8 @@
 from typing import List, Tuple
-from app.clients.asr import ASRServiceClient
+from app.clients.asr import asr_client
 
 current_language = "fa"
 current_region = None
-asr_client = ASRServiceClient()
 
 
 def get_language_options() -> List[Tuple[str, str]]:
@@ -42,21 +41,18 @@ def get_region_options(language: str) -> Tuple[List[Tuple[str, str]], str, bool]
         return [], None, False
 
     try:
-        languages = asr_client.get_languages()
-        for lang_info in languages:
-            if lang_info.get("code") == language:
-                regions = lang_info.get("regions", [])
-                if regions:
-                    region_options = []
-                    for region_info in regions:
-                        code = region_info.get("code")
-                        name = region_info.get("name")
-                        if code and name:
-                            region_options.append((f"{code}: {name}", code))
+        regions = asr_client.get_regions(language)
+        if regions:
+            region_options = []
+            for region_info in regions:
+                code = region_info.get("code")
+                name = region_info.get("name")
+                if code and name:
+                    region_options.append((f"{code}: {name}", code))
 
-                    region_options.sort(key=lambda x: x[0])
-                    default_value = region_options[0][1] if region_options else None
-                    return region_options, default_value, True
+            region_options.sort(key=lambda x: x[0])
+            default_value = region_options[0][1] if region_options else None
+            return region_options, default_value, True
 
         return [], None, False
 
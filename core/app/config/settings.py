@@ -13,5 +13,9 @@ class Config:
     APP_URL = os.getenv("APP_URL", "https://localhost:7860")
     
     TTS_SERVICE_URL = os.getenv("TTS_SERVICE_URL", "http://tts-service:8001")
+    # Browser-facing WebSocket for live transcription, e.g. /api/asr/stream behind nginx
+    ASR_STREAM_URL = os.getenv("ASR_STREAM_URL")
+    # Browser-facing endpoint that takes the recording as a raw binary body
+    ASR_UPLOAD_URL = os.getenv("ASR_UPLOAD_URL")
     
     DATA_DIR = Path.cwd() / "data"
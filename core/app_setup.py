@@ -7,6 +7,7 @@ from app.handlers.settings_handlers import SettingsHandlers
 from app.handlers.file_manager_handlers import FileManagerHandlers
 from app.handlers.interaction_handlers import InteractionHandlers
 from app.config.asr_config import get_language_options
+from app.config.settings import Config
 from app.utils.static import assets
 import gradio as gr
 
@@ -24,7 +25,8 @@ class AppSetup:
         self.asr_language_options = get_language_options()
         self.voice_options, self.tts_language_options, self.default_voice = self.settings_handlers.get_initial_options()
 
-        med_chat_js = MedChatInput.get_transcription_js()
+        med_chat_js = MedChatInput.get_transcription_js(
+            stream_url=Config.ASR_STREAM_URL, upload_url=Config.ASR_UPLOAD_URL)
         file_manager_js = get_file_manager_js()
 
         self.js = f"function(){{{med_chat_js}{file_manager_js}}}"
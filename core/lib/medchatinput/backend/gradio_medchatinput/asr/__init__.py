@@ -0,0 +1,6 @@
+from .client import ASRServiceClient
+
+# Shared by the component and the app, so every caller in the process goes
+# through one connection pool, one set of circuit breakers and one view of
+# the replicas' outstanding requests
+asr_client = ASRServiceClient()
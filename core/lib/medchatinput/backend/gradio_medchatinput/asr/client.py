@@ -1,127 +1,618 @@
-import requests
+import asyncio
 import os
-from typing import Optional, Dict, Any, List
+import random
+import threading
+import time
+from typing import Optional, Dict, Any, List, Union, BinaryIO, Callable, Iterator, AsyncIterator
 
+import httpx
 
-class ASRServiceClient:
-    def __init__(self, base_url: str = None):
-        self.base_url = (base_url or os.getenv(
-            "ASR_SERVICE_URL", "http://localhost:8002")).rstrip('/')
-        self._languages_cache = None
-        self._models_cache = None
+RETRY_STATUS_CODES = {502, 503, 504}
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
-    def get_languages(self) -> List[Dict[str, Any]]:
-        if self._languages_cache is not None:
-            return self._languages_cache
 
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """Stops calling the ASR service after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail immediately for ``reset_timeout`` seconds. Then one trial call
+    is let through; if it succeeds the circuit closes again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._failures >= self.failure_threshold or self._opened_at is not None:
+                self._opened_at = time.monotonic()
+
+    def abandon_trial(self):
+        # The call ended without a verdict on the service (e.g. a bad
+        # response body or cancellation), so let the next call be the trial
+        with self._lock:
+            self._trial_running = False
+
+
+class Endpoint:
+    """One ASR replica: its breaker, in-flight requests and loaded models."""
+
+    def __init__(self, base_url: str, breaker: CircuitBreaker):
+        self.base_url = base_url.rstrip('/')
+        self.breaker = breaker
+        self.outstanding = 0
+        self.loaded_models: set = set()
+        self.refreshed_at = 0.0
+
+
+class EndpointPool:
+    """Least-outstanding-requests routing with model affinity.
+
+    Requests go to a healthy replica that already has the requested model
+    loaded, unless those replicas are busier than the least loaded healthy
+    replica by more than ``affinity_slack`` requests.
+    """
+
+    def __init__(self, base_urls: List[str], breaker_factory: Callable[[], CircuitBreaker],
+                 affinity_slack: int = 2, refresh_interval: float = 30.0):
+        self.endpoints = [Endpoint(url, breaker_factory()) for url in base_urls]
+        self.affinity_slack = affinity_slack
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+
+    def choose(self, model: Optional[str] = None, exclude: Optional[set] = None) -> Endpoint:
+        with self._lock:
+            candidates = [e for e in self.endpoints if e.breaker.state != "open"]
+            untried = [e for e in candidates if e not in (exclude or set())]
+            candidates = untried or candidates
+
+            while candidates:
+                least = min(e.outstanding for e in candidates)
+                warm = [e for e in candidates if model in e.loaded_models]
+                if warm and min(e.outstanding for e in warm) <= least + self.affinity_slack:
+                    pool = warm
+                else:
+                    pool = candidates
+
+                fewest = min(e.outstanding for e in pool)
+                endpoint = random.choice([e for e in pool if e.outstanding == fewest])
+                if endpoint.breaker.allow():
+                    endpoint.outstanding += 1
+                    return endpoint
+                # A half-open replica already has its trial request in flight
+                candidates.remove(endpoint)
+
+        raise CircuitOpenError("No healthy ASR service replica available")
+
+    def release(self, endpoint: Endpoint, model: Optional[str] = None, loaded: bool = False):
+        with self._lock:
+            endpoint.outstanding -= 1
+            if loaded and model:
+                endpoint.loaded_models.add(model)
+
+    def stale(self) -> List[Endpoint]:
+        # Affinity only matters with more than one replica
+        if len(self.endpoints) < 2:
+            return []
+        now = time.monotonic()
+        return [e for e in self.endpoints if now - e.refreshed_at >= self.refresh_interval]
+
+    def apply_probe(self, endpoint: Endpoint, models_data: Optional[Dict[str, Any]]):
+        endpoint.refreshed_at = time.monotonic()
+        if models_data is None:
+            endpoint.breaker.record_failure()
+            return
+
+        endpoint.breaker.record_success()
+        cached = (models_data.get("cache_stats") or {}).get("models") or {}
+        loaded = set(cached) or {models_data.get("current_model")} - {None}
+        with self._lock:
+            endpoint.loaded_models = loaded
+
+
+class _CachedResponse:
+    __slots__ = ("etag", "expires_at", "value")
+
+    def __init__(self, etag: Optional[str], expires_at: float, value: Any):
+        self.etag = etag
+        self.expires_at = expires_at
+        self.value = value
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+def _max_age(response: httpx.Response) -> float:
+    for directive in response.headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "no-store":
+            return 0.0
+        if name.lower() == "max-age" and value.isdigit():
+            return float(value)
+    return 0.0
+
+
+def _split_urls(urls: Union[str, List[str]]) -> List[str]:
+    if isinstance(urls, str):
+        urls = urls.split(",")
+    return [url.strip() for url in urls if url.strip()]
+
+
+def _parse_languages(data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    return data.get("languages", []) if data.get("success") else None
+
+
+def _parse_regions(data: Dict[str, Any]) -> Optional[List[Dict[str, str]]]:
+    return data.get("regions", []) if data.get("success") else None
+
+
+def _transcription_result(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if result.get("success"):
+        return {
+            'text': result.get('text', ''),
+            'language': result.get('language'),
+            'region': result.get('region'),
+            'confidence': result.get('confidence')
+        }
+    return None
+
+
+def _transcription_params(language: Optional[str], region: Optional[str], model: str,
+                          session_id: Optional[str] = None) -> Dict[str, str]:
+    params = {"model": model}
+
+    if language:
+        params["language"] = language
+    if region:
+        params["region"] = region
+    if session_id:
+        params["session_id"] = session_id
+    return params
+
+
+def _iter_file(f: BinaryIO) -> Iterator[bytes]:
+    f.seek(0)
+    while chunk := f.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+async def _aiter_file(f: BinaryIO) -> AsyncIterator[bytes]:
+    # File reads run in the default executor so a slow disk never stalls the loop
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, f.seek, 0)
+    while chunk := await loop.run_in_executor(None, f.read, UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+def _busy(response: httpx.Response) -> bool:
+    # A full queue answers 503 with Retry-After; the replica itself is healthy
+    return response.status_code == 503 and "Retry-After" in response.headers
+
+
+class _ASRClientBase:
+    def __init__(self, base_url: Union[str, List[str]] = None, max_retries: int = None, backoff: float = None,
+                 max_backoff: float = 5.0, timeout: float = 60.0, max_connections: int = 10,
+                 affinity_slack: int = None, refresh_interval: float = None):
+        # Several replicas can be given as a comma separated list
+        base_urls = _split_urls(base_url or os.getenv("ASR_SERVICE_URL", "http://localhost:8002"))
+        self.base_url = base_urls[0].rstrip('/')
+        self.max_retries = int(os.getenv("ASR_CLIENT_RETRIES", "2")) if max_retries is None else max_retries
+        self.backoff = float(os.getenv("ASR_CLIENT_BACKOFF", "0.5")) if backoff is None else backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.limits = httpx.Limits(max_connections=max_connections * len(base_urls),
+                                   max_keepalive_connections=max_connections * len(base_urls))
+        self.endpoints = EndpointPool(
+            base_urls,
+            breaker_factory=lambda: CircuitBreaker(
+                failure_threshold=int(os.getenv("ASR_CLIENT_BREAKER_THRESHOLD", "5")),
+                reset_timeout=float(os.getenv("ASR_CLIENT_BREAKER_RESET", "30"))
+            ),
+            affinity_slack=int(os.getenv("ASR_CLIENT_AFFINITY_SLACK", "2")) if affinity_slack is None else affinity_slack,
+            refresh_interval=float(os.getenv("ASR_CLIENT_REFRESH_INTERVAL", "30")) if refresh_interval is None else refresh_interval
+        )
+        # Catalog responses reused until their max-age runs out, then
+        # revalidated with If-None-Match
+        self._response_cache: Dict[str, _CachedResponse] = {}
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self.endpoints.endpoints[0].breaker
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        # Honour the server's Retry-After, otherwise exponential backoff with full jitter
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _finish(self, endpoint: Endpoint, response: httpx.Response) -> httpx.Response:
+        if _busy(response):
+            endpoint.breaker.abandon_trial()
+        elif response.status_code in RETRY_STATUS_CODES:
+            endpoint.breaker.record_failure()
+        else:
+            endpoint.breaker.record_success()
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def _conditional_headers(self, path: str) -> Dict[str, str]:
+        cached = self._response_cache.get(path)
+        return {"If-None-Match": cached.etag} if cached and cached.etag else {}
+
+    def _cache_response(self, path: str, response: httpx.Response, parse: Callable[[Dict[str, Any]], Any]) -> Any:
+        cached = self._response_cache.get(path)
+        if response.status_code == 304 and cached:
+            value = cached.value
+        else:
+            value = parse(response.json())
+            if value is None:
+                return None
+
+        self._response_cache[path] = _CachedResponse(
+            response.headers.get("ETag"), time.monotonic() + _max_age(response), value)
+        return value
+
+    def _fresh_response(self, path: str) -> Optional[_CachedResponse]:
+        cached = self._response_cache.get(path)
+        return cached if cached and cached.fresh else None
+
+
+class ASRServiceClient(_ASRClientBase):
+    """Blocking ASR client sharing one pool of keep-alive connections."""
+
+    def __init__(self, base_url: Union[str, List[str]] = None, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self._client = httpx.Client(timeout=self.timeout, limits=self.limits)
+
+    def close(self):
+        self._client.close()
+
+    def __enter__(self) -> "ASRServiceClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _request(self, method: str, path: str, body: Optional[Callable[[], Any]] = None,
+                 model: Optional[str] = None, **kwargs) -> httpx.Response:
+        self._refresh_endpoints()
+        tried = set()
+
+        for attempt in range(self.max_retries + 1):
+            # Each retry prefers a replica that hasn't failed this request yet
+            endpoint = self.endpoints.choose(model, exclude=tried)
+            tried.add(endpoint)
+            response = None
+            try:
+                content = body() if body else None
+                response = self._client.request(method, f"{endpoint.base_url}{path}", content=content, **kwargs)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return self._finish(endpoint, response)
+                if _busy(response):
+                    endpoint.breaker.abandon_trial()
+                else:
+                    endpoint.breaker.record_failure()
+            except httpx.TransportError:
+                endpoint.breaker.record_failure()
+                if attempt == self.max_retries:
+                    raise
+            except BaseException:
+                endpoint.breaker.abandon_trial()
+                raise
+            finally:
+                self.endpoints.release(endpoint, model, loaded=response is not None and response.is_success)
+
+            time.sleep(self._retry_delay(attempt, response))
+
+    def _probe(self, endpoint: Endpoint):
         try:
-            response = requests.get(f"{self.base_url}/languages", timeout=10)
+            response = self._client.get(f"{endpoint.base_url}/models", timeout=5)
             response.raise_for_status()
-            languages_data = response.json()
+            self.endpoints.apply_probe(endpoint, response.json())
+        except (httpx.HTTPError, ValueError):
+            self.endpoints.apply_probe(endpoint, None)
 
-            if languages_data.get("success"):
-                self._languages_cache = languages_data.get("languages", [])
-                return self._languages_cache
-            return []
+    def _refresh_endpoints(self):
+        # Probed in the background so routing never waits on a slow replica
+        for endpoint in self.endpoints.stale():
+            endpoint.refreshed_at = time.monotonic()
+            threading.Thread(target=self._probe, args=(endpoint,), daemon=True).start()
+
+    def _get_cached(self, path: str, parse: Callable[[Dict[str, Any]], Any]) -> Any:
+        cached = self._fresh_response(path)
+        if cached:
+            return cached.value
 
-        except requests.RequestException as e:
+        response = self._request("GET", path, headers=self._conditional_headers(path), timeout=10)
+        return self._cache_response(path, response, parse)
+
+    def get_languages(self) -> List[Dict[str, Any]]:
+        try:
+            return self._get_cached("/languages", _parse_languages) or []
+
+        except (httpx.HTTPError, CircuitOpenError) as e:
             print(f"Error fetching languages: {e}")
             return []
 
+    def get_regions(self, language: str) -> List[Dict[str, str]]:
+        try:
+            return self._get_cached(f"/languages/{language}/regions", _parse_regions) or []
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                print(f"Error fetching regions: {e}")
+            return []
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            print(f"Error fetching regions: {e}")
+            return []
+
     def get_models(self) -> Dict[str, Any]:
         try:
-            response = requests.get(f"{self.base_url}/models", timeout=10)
-            response.raise_for_status()
-            models_data = response.json()
+            models_data = self._request("GET", "/models", timeout=10).json()
 
             if models_data.get("success"):
                 return models_data
             return {}
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, CircuitOpenError) as e:
             print(f"Error fetching models: {e}")
             return {}
 
     def transcribe_file(self, file_path: str, language: Optional[str] = None,
-                        region: Optional[str] = None, model: str = "small") -> Optional[Dict[str, Any]]:
+                        region: Optional[str] = None, model: str = "small",
+                        session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         if not os.path.exists(file_path):
             print(f"File not found: {file_path}")
             return None
 
-        try:
-            with open(file_path, 'rb') as f:
-                files = {"audio": (os.path.basename(
-                    file_path), f, "audio/wav")}
-                data = {"model": model}
-
-                if language:
-                    data["language"] = language
-                if region:
-                    data["region"] = region
-
-                response = requests.post(
-                    f"{self.base_url}/transcribe",
-                    files=files,
-                    data=data,
-                    timeout=60
-                )
-                response.raise_for_status()
-
-            result = response.json()
-            if result.get("success"):
-                return {
-                    'text': result.get('text', ''),
-                    'language': result.get('language'),
-                    'region': result.get('region'),
-                    'confidence': result.get('confidence')
-                }
+        # The open file is streamed as the request body, not read into memory
+        with open(file_path, 'rb') as f:
+            return self.transcribe_bytes(f, language, region, model, session_id)
+
+    def transcribe_bytes(self, audio_data: Union[bytes, BinaryIO], language: Optional[str] = None,
+                         region: Optional[str] = None, model: str = "small",
+                         session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if not audio_data:
             return None
 
-        except requests.RequestException as e:
+        body = (lambda: audio_data) if isinstance(audio_data, (bytes, bytearray)) else (lambda: _iter_file(audio_data))
+        try:
+            response = self._request(
+                "POST", "/transcribe/raw",
+                body=body,
+                model=model,
+                params=_transcription_params(language, region, model, session_id),
+                headers={"Content-Type": "application/octet-stream"}
+            )
+            return _transcription_result(response.json())
+
+        except (httpx.HTTPError, CircuitOpenError) as e:
             print(f"ASR transcription error: {e}")
             return None
 
     def transcribe_base64(self, base64_audio: str, language: Optional[str] = None,
-                          region: Optional[str] = None, model: str = "small") -> Optional[Dict[str, Any]]:
+                          region: Optional[str] = None, model: str = "small",
+                          session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         if not base64_audio:
             return None
 
+        payload = {"audio_data": base64_audio, **_transcription_params(language, region, model, session_id)}
         try:
-            payload = {
-                "audio_data": base64_audio,
-                "model": model
-            }
-
-            if language:
-                payload["language"] = language
-            if region:
-                payload["region"] = region
-
-            response = requests.post(
-                f"{self.base_url}/transcribe/base64",
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=60
-            )
+            response = self._request("POST", "/transcribe/base64", model=model, json=payload)
+            return _transcription_result(response.json())
+
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            print(f"ASR transcription error: {e}")
+            return None
+
+    def clear_cache(self) -> bool:
+        # Every replica holds its own model cache
+        cleared = True
+        for endpoint in self.endpoints.endpoints:
+            try:
+                self._client.delete(f"{endpoint.base_url}/cache", timeout=10).raise_for_status()
+                endpoint.loaded_models.clear()
+            except httpx.HTTPError:
+                cleared = False
+        return cleared
+
+
+class AsyncASRServiceClient(_ASRClientBase):
+    """asyncio counterpart of ASRServiceClient for async Gradio handlers."""
+
+    def __init__(self, base_url: Union[str, List[str]] = None, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+        # Strong references so pending probes aren't garbage collected
+        self._probe_tasks: set = set()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncASRServiceClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _request(self, method: str, path: str, body: Optional[Callable[[], Any]] = None,
+                       model: Optional[str] = None, **kwargs) -> httpx.Response:
+        self._refresh_endpoints()
+        tried = set()
+
+        for attempt in range(self.max_retries + 1):
+            endpoint = self.endpoints.choose(model, exclude=tried)
+            tried.add(endpoint)
+            response = None
+            try:
+                content = body() if body else None
+                response = await self._client.request(method, f"{endpoint.base_url}{path}", content=content, **kwargs)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return self._finish(endpoint, response)
+                if _busy(response):
+                    endpoint.breaker.abandon_trial()
+                else:
+                    endpoint.breaker.record_failure()
+            except httpx.TransportError:
+                endpoint.breaker.record_failure()
+                if attempt == self.max_retries:
+                    raise
+            except BaseException:
+                endpoint.breaker.abandon_trial()
+                raise
+            finally:
+                self.endpoints.release(endpoint, model, loaded=response is not None and response.is_success)
+
+            await asyncio.sleep(self._retry_delay(attempt, response))
+
+    async def _probe(self, endpoint: Endpoint):
+        try:
+            response = await self._client.get(f"{endpoint.base_url}/models", timeout=5)
             response.raise_for_status()
+            self.endpoints.apply_probe(endpoint, response.json())
+        except (httpx.HTTPError, ValueError):
+            self.endpoints.apply_probe(endpoint, None)
+
+    def _refresh_endpoints(self):
+        for endpoint in self.endpoints.stale():
+            endpoint.refreshed_at = time.monotonic()
+            task = asyncio.ensure_future(self._probe(endpoint))
+            self._probe_tasks.add(task)
+            task.add_done_callback(self._probe_tasks.discard)
+
+    async def _get_cached(self, path: str, parse: Callable[[Dict[str, Any]], Any]) -> Any:
+        cached = self._fresh_response(path)
+        if cached:
+            return cached.value
+
+        response = await self._request("GET", path, headers=self._conditional_headers(path), timeout=10)
+        return self._cache_response(path, response, parse)
+
+    async def get_languages(self) -> List[Dict[str, Any]]:
+        try:
+            return await self._get_cached("/languages", _parse_languages) or []
+
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            print(f"Error fetching languages: {e}")
+            return []
+
+    async def get_regions(self, language: str) -> List[Dict[str, str]]:
+        try:
+            return await self._get_cached(f"/languages/{language}/regions", _parse_regions) or []
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                print(f"Error fetching regions: {e}")
+            return []
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            print(f"Error fetching regions: {e}")
+            return []
+
+    async def get_models(self) -> Dict[str, Any]:
+        try:
+            models_data = (await self._request("GET", "/models", timeout=10)).json()
+
+            if models_data.get("success"):
+                return models_data
+            return {}
+
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            print(f"Error fetching models: {e}")
+            return {}
 
-            result = response.json()
-            if result.get("success"):
-                return {
-                    'text': result.get('text', ''),
-                    'language': result.get('language'),
-                    'region': result.get('region'),
-                    'confidence': result.get('confidence')
-                }
+    async def transcribe_file(self, file_path: str, language: Optional[str] = None,
+                              region: Optional[str] = None, model: str = "small",
+                              session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(file_path):
+            print(f"File not found: {file_path}")
             return None
 
-        except requests.RequestException as e:
+        f = await asyncio.get_running_loop().run_in_executor(None, open, file_path, 'rb')
+        try:
+            return await self.transcribe_bytes(f, language, region, model, session_id)
+        finally:
+            f.close()
+
+    async def transcribe_bytes(self, audio_data: Union[bytes, BinaryIO], language: Optional[str] = None,
+                               region: Optional[str] = None, model: str = "small",
+                               session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if not audio_data:
+            return None
+
+        body = (lambda: audio_data) if isinstance(audio_data, (bytes, bytearray)) else (lambda: _aiter_file(audio_data))
+        try:
+            response = await self._request(
+                "POST", "/transcribe/raw",
+                body=body,
+                model=model,
+                params=_transcription_params(language, region, model, session_id),
+                headers={"Content-Type": "application/octet-stream"}
+            )
+            return _transcription_result(response.json())
+
+        except (httpx.HTTPError, CircuitOpenError) as e:
             print(f"ASR transcription error: {e}")
             return None
 
-    def clear_cache(self) -> bool:
+    async def transcribe_base64(self, base64_audio: str, language: Optional[str] = None,
+                                region: Optional[str] = None, model: str = "small",
+                                session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if not base64_audio:
+            return None
+
+        payload = {"audio_data": base64_audio, **_transcription_params(language, region, model, session_id)}
         try:
-            response = requests.delete(f"{self.base_url}/cache", timeout=10)
-            return response.status_code == 200
-        except requests.RequestException:
-            return False
+            response = await self._request("POST", "/transcribe/base64", model=model, json=payload)
+            return _transcription_result(response.json())
+
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            print(f"ASR transcription error: {e}")
+            return None
+
+    async def clear_cache(self) -> bool:
+        cleared = True
+        for endpoint in self.endpoints.endpoints:
+            try:
+                (await self._client.delete(f"{endpoint.base_url}/cache", timeout=10)).raise_for_status()
+                endpoint.loaded_models.clear()
+            except httpx.HTTPError:
+                cleared = False
+        return cleared
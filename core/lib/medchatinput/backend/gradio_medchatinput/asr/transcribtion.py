@@ -1,10 +1,7 @@
 import os
 import tempfile
-import base64
 from typing import Union, Optional
-from .client import ASRServiceClient
-
-asr_client = ASRServiceClient()
+from . import asr_client
 
 
 def transcribe_file(file_path: str, language: Optional[str] = None, region: Optional[str] = None) -> str:
@@ -36,6 +33,23 @@ def transcribe_file(file_path: str, language: Optional[str] = None, region: Opti
             print(f"Failed to clean up temporary file {file_path}: {e}")
 
 
+def transcribe_bytes(audio_data: bytes, language: Optional[str] = None, region: Optional[str] = None) -> str:
+    if not audio_data:
+        return ""
+
+    try:
+        result = asr_client.transcribe_bytes(audio_data, language, region)
+        if result:
+            transcription = result.get('text', '').strip()
+            print(f"Transcribed audio: '{transcription}'")
+            return transcription
+        return ""
+
+    except Exception as e:
+        print(f"Audio transcription error: {e}")
+        return ""
+
+
 def transcribe_base64(base64_audio: str, language: Optional[str] = None, region: Optional[str] = None) -> str:
     if not base64_audio:
         return ""
@@ -64,36 +78,30 @@ def transcribe(audio_input: Union[tuple, bytes, str],
             return transcribe_file(audio_input, language, region)
             
         elif isinstance(audio_input, bytes):
-            base64_audio = base64.b64encode(audio_input).decode('utf-8')
-            return transcribe_base64(base64_audio, language, region)
+            return transcribe_bytes(audio_input, language, region)
             
         elif isinstance(audio_input, tuple) and len(audio_input) == 2:
             sample_rate, audio_data = audio_input
             
+            import io
             import wave
             import numpy as np
             
-            temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-            try:
-                with wave.open(temp_file.name, 'wb') as wav_file:
-                    wav_file.setnchannels(1)
-                    wav_file.setsampwidth(2)
-                    wav_file.setframerate(sample_rate)
-                    
-                    if isinstance(audio_data, np.ndarray):
-                        if audio_data.dtype != np.int16:
-                            if audio_data.dtype in [np.float32, np.float64]:
-                                audio_data = (audio_data * 32767).astype(np.int16)
-                            else:
-                                audio_data = audio_data.astype(np.int16)
-                        wav_file.writeframes(audio_data.tobytes())
-                    
-                temp_file.close()
-                return transcribe_file(temp_file.name, language, region)
+            wav_buffer = io.BytesIO()
+            with wave.open(wav_buffer, 'wb') as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(sample_rate)
                 
-            finally:
-                if os.path.exists(temp_file.name):
-                    os.unlink(temp_file.name)
+                if isinstance(audio_data, np.ndarray):
+                    if audio_data.dtype != np.int16:
+                        if audio_data.dtype in [np.float32, np.float64]:
+                            audio_data = (audio_data * 32767).astype(np.int16)
+                        else:
+                            audio_data = audio_data.astype(np.int16)
+                    wav_file.writeframes(audio_data.tobytes())
+            
+            return transcribe_bytes(wav_buffer.getvalue(), language, region)
         else:
             print(f"Unsupported audio input type: {type(audio_input)}")
             return ""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, TypedDict, cast
@@ -58,7 +59,8 @@ class MedChatInput(FormComponent):
     ]
     
     @staticmethod
-    def get_transcription_js(transcription_trigger_id: str="transcription_trigger", transcription_result_id: str="transcription_result") -> str:
+    def get_transcription_js(transcription_trigger_id: str="transcription_trigger", transcription_result_id: str="transcription_result",
+                             stream_url: str | None = None, upload_url: str | None = None) -> str:
         return """
     console.log("Setting up immediate transcription...");
     
@@ -103,6 +105,136 @@ class MedChatInput(FormComponent):
     };
     
     console.log("Immediate transcription setup complete");
+    
+    // One ID per browser tab, so the ASR service can reuse the language it
+    // detected for earlier recordings when auto-detect is on
+    const asrSessionId = (() => {
+        try {
+            let id = sessionStorage.getItem('asrSessionId');
+            if (!id) {
+                id = window.crypto && crypto.randomUUID ? crypto.randomUUID() : Date.now().toString(36) + Math.random().toString(36).slice(2);
+                sessionStorage.setItem('asrSessionId', id);
+            }
+            return id;
+        } catch (error) {
+            return null;
+        }
+    })();
+    
+    // Send the recording to the ASR service as a raw binary body, skipping
+    // the base64 round trip through the hidden textbox
+    const uploadUrl = """ + json.dumps(upload_url) + """;
+    
+    window.transcribeAudioUpload = async function(audioBlob, options) {
+        if (!uploadUrl || !window.fetch) {
+            return null;
+        }
+        options = options || {};
+        
+        const url = new URL(uploadUrl, window.location.href);
+        if (options.language) url.searchParams.set('language', options.language);
+        if (options.region) url.searchParams.set('region', options.region);
+        if (asrSessionId) url.searchParams.set('session_id', asrSessionId);
+        
+        try {
+            const response = await fetch(url.toString(), {
+                method: 'POST',
+                headers: { 'Content-Type': audioBlob.type || 'application/octet-stream' },
+                body: audioBlob
+            });
+            if (!response.ok) {
+                console.warn('Audio upload transcription failed:', response.status);
+                return null;
+            }
+            const result = await response.json();
+            return result.success ? result.text : null;
+        } catch (error) {
+            console.warn('Audio upload transcription error:', error);
+            return null;
+        }
+    };
+    
+    // Live transcription over the ASR WebSocket, used while recording
+    const streamUrl = """ + json.dumps(stream_url) + """;
+    
+    window.startTranscriptionStream = function(mediaStream, options) {
+        if (!streamUrl || !window.WebSocket || !window.AudioContext) {
+            return null;
+        }
+        options = options || {};
+        
+        const url = new URL(streamUrl, window.location.href);
+        url.protocol = url.protocol === 'https:' ? 'wss:' : url.protocol === 'http:' ? 'ws:' : url.protocol;
+        if (options.language) url.searchParams.set('language', options.language);
+        if (options.region) url.searchParams.set('region', options.region);
+        if (asrSessionId) url.searchParams.set('session_id', asrSessionId);
+        
+        const audioContext = new AudioContext();
+        url.searchParams.set('sample_rate', String(audioContext.sampleRate));
+        
+        const socket = new WebSocket(url.toString());
+        socket.binaryType = 'arraybuffer';
+        
+        const source = audioContext.createMediaStreamSource(mediaStream);
+        const processor = audioContext.createScriptProcessor(4096, 1, 1);
+        
+        // Audio captured before the socket opens is held back, not dropped
+        const pending = [];
+        socket.onopen = () => {
+            pending.forEach((chunk) => socket.send(chunk));
+            pending.length = 0;
+        };
+        
+        processor.onaudioprocess = (event) => {
+            if (socket.readyState > WebSocket.OPEN) return;
+            const input = event.inputBuffer.getChannelData(0);
+            const pcm = new Int16Array(input.length);
+            for (let i = 0; i < input.length; i++) {
+                const sample = Math.max(-1, Math.min(1, input[i]));
+                pcm[i] = sample < 0 ? sample * 0x8000 : sample * 0x7FFF;
+            }
+            if (socket.readyState === WebSocket.OPEN) {
+                socket.send(pcm.buffer);
+            } else {
+                pending.push(pcm.buffer);
+            }
+        };
+        source.connect(processor);
+        processor.connect(audioContext.destination);
+        
+        let finalText = null;
+        let resolveFinal = null;
+        const finished = new Promise((resolve) => { resolveFinal = resolve; });
+        
+        socket.onmessage = (event) => {
+            const message = JSON.parse(event.data);
+            if (message.type === 'partial' && options.onPartial) {
+                options.onPartial(message.text);
+            } else if (message.type === 'final') {
+                finalText = message.text;
+                resolveFinal(finalText);
+            } else if (message.type === 'error') {
+                console.warn('Streaming transcription error:', message.detail);
+                resolveFinal(null);
+            }
+        };
+        socket.onerror = () => resolveFinal(null);
+        socket.onclose = () => resolveFinal(finalText);
+        
+        return {
+            stop: async function() {
+                processor.disconnect();
+                source.disconnect();
+                audioContext.close();
+                if (socket.readyState === WebSocket.OPEN) {
+                    socket.send('end');
+                } else if (socket.readyState === WebSocket.CONNECTING) {
+                    socket.addEventListener('open', () => socket.send('end'));
+                }
+                return await finished;
+            }
+        };
+    };
 """
 
     def __init__(
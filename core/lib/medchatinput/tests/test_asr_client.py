@@ -0,0 +1,131 @@
+import asyncio
+
+import httpx
+import pytest
+
+from gradio_medchatinput.asr.client import ASRServiceClient, AsyncASRServiceClient, CircuitOpenError
+
+MODELS = {"success": True, "current_model": "small", "cache_stats": {"models": {}}}
+
+
+def failing_then(handler):
+    """Transport that fails once with a connection error, then calls ``handler``."""
+    calls = []
+
+    def transport(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return handler(request)
+
+    return httpx.MockTransport(transport), calls
+
+
+def make_client(client_class, transport):
+    client = client_class("http://asr", max_retries=0)
+    client.endpoints.endpoints[0].breaker.failure_threshold = 1
+    client.endpoints.endpoints[0].breaker.reset_timeout = 0
+    client_type = httpx.AsyncClient if client_class is AsyncASRServiceClient else httpx.Client
+    client._client = client_type(transport=transport)
+    return client
+
+
+def test_breaker_recovers_after_trial_raises():
+    transport, calls = failing_then(lambda request: httpx.Response(200, json=MODELS))
+    client = make_client(ASRServiceClient, transport)
+
+    with pytest.raises(httpx.ConnectError):
+        client._request("GET", "/models")
+
+    def broken_body():
+        raise RuntimeError("body could not be read")
+
+    with pytest.raises(RuntimeError):
+        client._request("POST", "/transcribe/raw", body=broken_body)
+    assert client._request("GET", "/models").json() == MODELS
+
+
+def test_async_breaker_recovers_after_cancelled_trial():
+    async def scenario():
+        calls = []
+
+        async def transport(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("connection refused", request=request)
+            if len(calls) == 2:
+                # The trial hangs until it is cancelled
+                await asyncio.sleep(10)
+            return httpx.Response(200, json=MODELS)
+
+        client = make_client(AsyncASRServiceClient, httpx.MockTransport(transport))
+        with pytest.raises(httpx.ConnectError):
+            await client._request("GET", "/models")
+
+        trial = asyncio.ensure_future(client._request("GET", "/models"))
+        await asyncio.sleep(0.01)
+        with pytest.raises(CircuitOpenError):
+            await client._request("GET", "/models")
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        response = await client._request("GET", "/models")
+        assert response.json() == MODELS
+
+    asyncio.run(scenario())
+
+
+def test_queue_full_does_not_open_breaker():
+    calls = []
+
+    def transport(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= 2:
+            return httpx.Response(503, headers={"Retry-After": "0"}, json={"detail": "queue full"})
+        return httpx.Response(200, json=MODELS)
+
+    client = make_client(ASRServiceClient, httpx.MockTransport(transport))
+    with pytest.raises(httpx.HTTPStatusError):
+        client._request("GET", "/models")
+
+    client.max_retries = 1
+    assert client._request("GET", "/models").json() == MODELS
+    assert client.breaker.state == "closed"
+
+
+def test_async_transcribe_file_streams_upload(tmp_path):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"RIFF" + b"\0" * 200_000)
+
+    async def scenario():
+        received = []
+
+        async def transport(request: httpx.Request) -> httpx.Response:
+            received.append(await request.aread())
+            return httpx.Response(200, json={"success": True, "text": "ok"})
+
+        client = make_client(AsyncASRServiceClient, httpx.MockTransport(transport))
+        result = await client.transcribe_file(str(audio))
+        assert result["text"] == "ok"
+        assert received == [audio.read_bytes()]
+
+    asyncio.run(scenario())
+
+
+def test_async_probes_are_kept_until_done():
+    async def scenario():
+        async def transport(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=MODELS)
+
+        client = AsyncASRServiceClient("http://asr1,http://asr2")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        client._refresh_endpoints()
+        assert len(client._probe_tasks) == 2
+
+        await asyncio.gather(*client._probe_tasks)
+        await asyncio.sleep(0)
+        assert not client._probe_tasks
+        assert all(e.loaded_models == {"small"} for e in client.endpoints.endpoints)
+
+    asyncio.run(scenario())
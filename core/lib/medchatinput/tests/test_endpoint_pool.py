@@ -0,0 +1,63 @@
+import pytest
+
+from gradio_medchatinput.asr.client import CircuitBreaker, CircuitOpenError, EndpointPool
+
+
+def make_pool(*urls, affinity_slack=2):
+    return EndpointPool(list(urls), breaker_factory=lambda: CircuitBreaker(failure_threshold=1, reset_timeout=60),
+                        affinity_slack=affinity_slack)
+
+
+def by_url(pool):
+    return {endpoint.base_url: endpoint for endpoint in pool.endpoints}
+
+
+def test_least_outstanding_replica_is_chosen():
+    pool = make_pool("http://a", "http://b", "http://c")
+    endpoints = by_url(pool)
+    endpoints["http://a"].outstanding = 3
+    endpoints["http://b"].outstanding = 1
+    endpoints["http://c"].outstanding = 2
+
+    assert pool.choose().base_url == "http://b"
+    assert endpoints["http://b"].outstanding == 2
+
+
+def test_warm_replica_wins_within_affinity_slack():
+    pool = make_pool("http://a", "http://b", affinity_slack=2)
+    endpoints = by_url(pool)
+    endpoints["http://a"].loaded_models = {"small"}
+    endpoints["http://a"].outstanding = 2
+
+    assert pool.choose("small").base_url == "http://a"
+    # Now three ahead of the cold replica, more than the slack allows
+    assert pool.choose("small").base_url == "http://b"
+
+
+def test_open_breaker_is_skipped():
+    pool = make_pool("http://a", "http://b")
+    endpoints = by_url(pool)
+    endpoints["http://a"].loaded_models = {"small"}
+    endpoints["http://a"].breaker.record_failure()
+    endpoints["http://b"].outstanding = 5
+
+    for _ in range(3):
+        endpoint = pool.choose("small")
+        assert endpoint.base_url == "http://b"
+        pool.release(endpoint, "small", loaded=True)
+    assert endpoints["http://b"].loaded_models == {"small"}
+
+    endpoints["http://b"].breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        pool.choose("small")
+
+
+def test_retry_prefers_an_untried_replica():
+    pool = make_pool("http://a", "http://b")
+    endpoints = by_url(pool)
+    first = pool.choose()
+    pool.release(first)
+
+    assert pool.choose(exclude={first}) is not first
+    # With every replica tried, any healthy one is still used
+    assert pool.choose(exclude=set(endpoints.values())) in endpoints.values()
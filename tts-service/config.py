@@ -6,7 +6,37 @@ TTS_CONFIG = {
     "model_dir": Path(os.getenv("TTS_MODEL_DIR", "./data/piper/models")),
     "voices_file": Path(os.getenv("TTS_VOICES_FILE", "./data/piper/voices.json")),
     "use_cuda": os.getenv("USE_CUDA", "false").lower() == "true",
-    "ezafe_model_path": os.getenv("EZAFE_MODEL_PATH")
+    "ezafe_model_path": os.getenv("EZAFE_MODEL_PATH"),
+    # Synthesis runs on a pool of worker threads, each with its own ONNX
+    # session per voice. Requests beyond max_workers + max_queue_size are
+    # rejected with 503 and Retry-After.
+    "max_workers": int(os.getenv("TTS_MAX_WORKERS", "2")),
+    "max_queue_size": int(os.getenv("TTS_MAX_QUEUE_SIZE", "8")),
+    "voice_concurrency": int(os.getenv("TTS_VOICE_CONCURRENCY", "2")),
+    "request_timeout": float(os.getenv("TTS_REQUEST_TIMEOUT", "60")),
+    "retry_after": int(os.getenv("TTS_RETRY_AFTER", "2")),
+    # Intra-op threads of each worker's ONNX sessions; 0 splits the cores
+    # evenly between the workers
+    "session_threads": int(os.getenv("TTS_SESSION_THREADS", "0")),
+    # Synthesized chunks a stream may run ahead of a slow client
+    "stream_buffer_chunks": int(os.getenv("TTS_STREAM_BUFFER_CHUNKS", "4")),
+    # Split the text into sentences and synthesize them on several workers
+    # at once, returning the audio in order. sentence_window is how many
+    # sentences of one request may be in flight (0 = max_workers).
+    "parallel_sentences": os.getenv("TTS_PARALLEL_SENTENCES", "true").lower() == "true",
+    "sentence_window": int(os.getenv("TTS_SENTENCE_WINDOW", "0")),
+    # Longer sentences are split further at commas
+    "max_sentence_chars": int(os.getenv("TTS_MAX_SENTENCE_CHARS", "400")),
+    # Synthesized sentences are reused across requests; set the directory to
+    # keep them across restarts
+    "phrase_cache_max_mb": int(os.getenv("TTS_PHRASE_CACHE_MAX_MB", "64")),
+    "phrase_cache_dir": Path(os.getenv("TTS_PHRASE_CACHE_DIR")) if os.getenv("TTS_PHRASE_CACHE_DIR") else None,
+    "phrase_cache_ttl_seconds": int(os.getenv("TTS_PHRASE_CACHE_TTL_SECONDS", "604800")),
+    # Oldest phrase files are removed past this size; 0 leaves the disk tier unbounded
+    "phrase_cache_max_disk_mb": int(os.getenv("TTS_PHRASE_CACHE_MAX_DISK_MB", "1024")),
+    # Target bitrates in bits per second of the compressed output formats
+    "opus_bitrate": int(os.getenv("TTS_OPUS_BITRATE", "24000")),
+    "mp3_bitrate": int(os.getenv("TTS_MP3_BITRATE", "32000"))
 }
 
 
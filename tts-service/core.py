@@ -1,13 +1,28 @@
 import re
 import json
 import os
-import tempfile
-from typing import Optional, Tuple, Generator
+import threading
+from functools import lru_cache
+from typing import List, Optional, Tuple, Generator
+from piper.config import PiperConfig
 from piper.voice import PiperVoice
 from config import TTS_CONFIG
+from phrase_cache import PhraseCache, make_phrase_key
 
 voices_config = {}
+# One PiperVoice (and so one ONNX session) per worker thread and voice
 model_cache = {}
+model_cache_lock = threading.Lock()
+phrase_cache = PhraseCache(
+    max_bytes=TTS_CONFIG["phrase_cache_max_mb"] * 1024 * 1024,
+    disk_dir=TTS_CONFIG["phrase_cache_dir"],
+    ttl_seconds=TTS_CONFIG["phrase_cache_ttl_seconds"],
+    max_disk_bytes=TTS_CONFIG["phrase_cache_max_disk_mb"] * 1024 * 1024
+)
+
+
+class VoiceLoadError(RuntimeError):
+    pass
 
 
 def load_voices_config():
@@ -63,12 +78,10 @@ def get_voice_file_paths(voice_key: str) -> Tuple[Optional[str], Optional[str]]:
 
 
 def load_voice_model(voice_key: str):
-    global model_cache
+    cache_key = (threading.get_ident(), voice_key)
+    if cache_key in model_cache:
+        return model_cache[cache_key]
 
-    if voice_key in model_cache:
-        return model_cache[voice_key]
-
-    temp_config_path = None
     try:
         model_path, config_path = get_voice_file_paths(voice_key)
 
@@ -79,52 +92,93 @@ def load_voice_model(voice_key: str):
             raise FileNotFoundError(
                 f"Voice files not found: {model_path}, {config_path}")
 
-        final_config_path = str(config_path)
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config_data = json.load(f)
+
         ezafe_model_path = TTS_CONFIG.get("ezafe_model_path")
 
         if ezafe_model_path and os.path.exists(ezafe_model_path):
             print(f"ℹ️ Ezafe model found at '{ezafe_model_path}', updating config...")
-            
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            
             config_data['ezafe_model_path'] = ezafe_model_path
 
-            with tempfile.NamedTemporaryFile(
-                mode='w', delete=False, suffix=".json", encoding='utf-8', dir="/tmp"
-            ) as temp_f:
-                json.dump(config_data, temp_f)
-                temp_config_path = temp_f.name
-            
-            final_config_path = temp_config_path
-            print(f"📝 Using temporary config: {final_config_path}")
-
         use_cuda = TTS_CONFIG.get("use_cuda", False)
         print(f"ℹ️ CUDA usage set to: {use_cuda}")
-        
-        model = PiperVoice.load(
-            model_path=str(model_path), 
-            config_path=final_config_path, 
-            use_cuda=use_cuda
+
+        # Built here rather than through PiperVoice.load, which would create
+        # a session with default threading that then had to be replaced
+        providers = ["CUDAExecutionProvider"] if use_cuda else ["CPUExecutionProvider"]
+        model = PiperVoice(
+            config=PiperConfig.from_dict(config_data),
+            session=create_onnx_session(model_path, providers)
         )
-        model_cache[voice_key] = model
 
-        print(f"✅ Loaded voice model: {voice_key}")
+        with model_cache_lock:
+            model_cache[cache_key] = model
+
+        print(f"✅ Loaded voice model: {voice_key} ({threading.current_thread().name})")
         return model
 
     except Exception as e:
         print(f"❌ Error loading voice model {voice_key}: {e}")
         return None
-    finally:
-        if temp_config_path and os.path.exists(temp_config_path):
-            os.unlink(temp_config_path)
-            print(f"🗑️ Removed temporary config file: {temp_config_path}")
 
 
-def configure_wav_file(wav_file, sample_rate: int):
-    wav_file.setnchannels(1)
-    wav_file.setsampwidth(2)
-    wav_file.setframerate(sample_rate)
+def get_session_threads() -> int:
+    if TTS_CONFIG["session_threads"] > 0:
+        return TTS_CONFIG["session_threads"]
+    # Split the cores between the workers so their sessions don't oversubscribe them
+    return max(1, (os.cpu_count() or 1) // max(1, TTS_CONFIG["max_workers"]))
+
+
+def create_onnx_session(model_path, providers):
+    import onnxruntime
+
+    # Several workers run sessions side by side, so each gets a share of the
+    # cores instead of one intra-op thread per core
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = get_session_threads()
+    options.inter_op_num_threads = 1
+    return onnxruntime.InferenceSession(str(model_path), sess_options=options, providers=providers)
+
+
+def get_worker_voice(voice_key: str) -> PiperVoice:
+    model = load_voice_model(voice_key)
+    if model is None:
+        raise VoiceLoadError(f"Failed to load voice model: {voice_key}")
+    return model
+
+
+def preprocess_text(text: str) -> str:
+    processed_text = re.sub(r'\n', ' ', text)
+    return re.sub(r'[?.:;!!؟]|\.{3}', '،', processed_text)
+
+
+def split_sentences(text: str, max_chars: int = 0) -> List[str]:
+    """Split text at the punctuation ``preprocess_text`` handles.
+
+    Only punctuation followed by whitespace ends a sentence, so numbers like
+    2.5 stay whole. Sentences longer than ``max_chars`` are split further
+    at commas, or at spaces when there are none.
+    """
+    sentences = []
+    for sentence in re.split(r'(?<=[?.:;!!؟])\s+', re.sub(r'\n', ' ', text).strip()):
+        if not re.search(r'\w', sentence):
+            # Stray punctuation belongs to the sentence before it
+            if sentences:
+                sentences[-1] += " " + sentence
+            continue
+
+        while max_chars and len(sentence) > max_chars:
+            cut = max(sentence.rfind('،', 0, max_chars), sentence.rfind(',', 0, max_chars))
+            if cut <= 0:
+                cut = sentence.rfind(' ', 0, max_chars)
+            if cut <= 0:
+                break
+            sentences.append(sentence[:cut + 1].strip())
+            sentence = sentence[cut + 1:].strip()
+        sentences.append(sentence)
+
+    return sentences or [text]
 
 
 def prepare_synthesis_kwargs(speaker_id: Optional[int], num_speakers: int, speed: float,
@@ -143,9 +197,12 @@ def prepare_synthesis_kwargs(speaker_id: Optional[int], num_speakers: int, speed
 
 
 def clear_model_cache() -> int:
-    global model_cache
-    cached_count = len(model_cache)
-    model_cache.clear()
+    # Workers reload their voices on the next request
+    with model_cache_lock:
+        cached_count = len(model_cache)
+        model_cache.clear()
+    get_voice_sample_rate.cache_clear()
+    get_voice_revision.cache_clear()
     return cached_count
 
 
@@ -157,12 +214,93 @@ def get_model_cache_size() -> int:
     return len(model_cache)
 
 
-def synthesize_stream_audio(model: PiperVoice, text: str, **synthesis_kwargs) -> Generator[bytes, None, None]:
+def synthesize_pcm(voice_key: str, text: str, **synthesis_kwargs) -> bytes:
+    """Return the raw PCM for ``text``. Runs on a synthesis worker."""
+    model = get_worker_voice(voice_key)
+    return b"".join(model.synthesize_stream_raw(preprocess_text(text), **synthesis_kwargs))
+
+
+def normalize_sentence(sentence: str) -> str:
+    return " ".join(preprocess_text(sentence).split())
+
+
+@lru_cache(maxsize=None)
+def get_voice_revision(voice_key: str) -> str:
+    # A replaced model file must not be answered from the phrase cache
+    model_path, _ = get_voice_file_paths(voice_key)
     try:
-        processed_text = re.sub(r'\n', ' ', text)
-        processed_text = re.sub(r'[?.:;!!؟]|\.{3}', '،', processed_text)
-        
-        for audio_chunk in model.synthesize_stream_raw(processed_text, **synthesis_kwargs):
+        stat = model_path.stat()
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+    except (AttributeError, OSError):
+        return ""
+
+
+def phrase_key(voice_key: str, sentence: str, synthesis_kwargs: dict) -> str:
+    return make_phrase_key(normalize_sentence(sentence), voice_key, get_voice_revision(voice_key),
+                           synthesis_kwargs)
+
+
+def sentence_silence_pcm(voice_key: str, sentence_silence: float) -> bytes:
+    return bytes(int(sentence_silence * get_voice_sample_rate(voice_key)) * 2)
+
+
+def cached_sentence(voice_key: str, sentence: str, sentence_silence: float = 0.0,
+                    **synthesis_kwargs) -> Optional[Tuple[bytes, bool]]:
+    """The sentence's PCM if it is in the in-memory phrase cache."""
+    if not phrase_cache.enabled:
+        return None
+    pcm = phrase_cache.peek(phrase_key(voice_key, sentence, synthesis_kwargs))
+    if pcm is None:
+        return None
+    return pcm + sentence_silence_pcm(voice_key, sentence_silence), True
+
+
+def sentence_audio(voice_key: str, sentence: str, sentence_silence: float = 0.0,
+                   **synthesis_kwargs) -> Tuple[bytes, bool]:
+    """Return the PCM for one sentence from the phrase cache, or synthesize
+    and cache it, and whether it was cached. Runs on a synthesis worker.
+
+    The cache holds the sentence without its trailing silence, so file and
+    stream requests share entries whatever ``sentence_silence`` they use.
+    """
+    silence = sentence_silence_pcm(voice_key, sentence_silence)
+    if not phrase_cache.enabled:
+        return synthesize_pcm(voice_key, sentence, **synthesis_kwargs) + silence, False
+
+    key = phrase_key(voice_key, sentence, synthesis_kwargs)
+    pcm = phrase_cache.get(key)
+    if pcm is not None:
+        return pcm + silence, True
+
+    pcm = synthesize_pcm(voice_key, sentence, **synthesis_kwargs)
+    phrase_cache.put(key, pcm)
+    return pcm + silence, False
+
+
+def get_phrase_cache_stats() -> dict:
+    return phrase_cache.stats()
+
+
+def clear_phrase_cache() -> int:
+    return phrase_cache.clear()
+
+
+@lru_cache(maxsize=None)
+def get_voice_sample_rate(voice_key: str) -> int:
+    _, config_path = get_voice_file_paths(voice_key)
+    if not config_path or not config_path.exists():
+        raise VoiceLoadError(f"Voice config not found: {voice_key}")
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)["audio"]["sample_rate"]
+
+
+def synthesize_stream_pcm(voice_key: str, text: str, **synthesis_kwargs) -> Generator[bytes, None, None]:
+    """Yield raw PCM per sentence. Runs on a synthesis worker."""
+    try:
+        model = get_worker_voice(voice_key)
+
+        for audio_chunk in model.synthesize_stream_raw(preprocess_text(text), **synthesis_kwargs):
             yield audio_chunk
             
     except Exception as e:
@@ -170,8 +308,15 @@ def synthesize_stream_audio(model: PiperVoice, text: str, **synthesis_kwargs) ->
         raise
 
 
-def add_wav_header(sample_rate: int, num_channels: int = 1, bits_per_sample: int = 16) -> bytes:
-    data_size = 0xFFFFFFFF - 36
+def pcm_duration(pcm_size: int, sample_rate: int) -> float:
+    return pcm_size / (sample_rate * 2)
+
+
+def add_wav_header(sample_rate: int, num_channels: int = 1, bits_per_sample: int = 16,
+                   data_size: Optional[int] = None) -> bytes:
+    if data_size is None:
+        # Unknown length while streaming
+        data_size = 0xFFFFFFFF - 36
     
     header = bytearray(44)
     
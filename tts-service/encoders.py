@@ -0,0 +1,99 @@
+from typing import List
+
+import av
+import numpy as np
+
+from config import TTS_CONFIG
+
+# Output format: (media type, file extension)
+MEDIA_TYPES = {
+    "wav": ("audio/wav", "wav"),
+    "opus": ("audio/ogg", "ogg"),
+    "mp3": ("audio/mpeg", "mp3"),
+}
+
+# Compressed output format: (container, codec, sample rate the codec runs at
+# or None for the voice's own)
+ENCODINGS = {
+    "opus": ("ogg", "libopus", 48000),
+    "mp3": ("mp3", "libmp3lame", None),
+}
+
+
+class _Sink:
+    """Write-only file object collecting what the muxer writes."""
+
+    def __init__(self):
+        self.parts: List[bytes] = []
+
+    def write(self, data) -> int:
+        self.parts.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self.parts)
+        self.parts.clear()
+        return data
+
+
+class AudioEncoder:
+    """Incrementally encodes 16-bit mono PCM into a compressed container.
+
+    ``encode`` returns whatever container bytes are complete so far, so the
+    result can be streamed while later sentences are still being
+    synthesized; ``close`` returns the rest. Not thread-safe: feed one
+    encoder from one task at a time.
+    """
+
+    def __init__(self, audio_format: str, sample_rate: int, bitrate: int):
+        container_format, codec, codec_rate = ENCODINGS[audio_format]
+        self._sink = _Sink()
+        # Flush a page every 100 ms instead of once a second, so audio reaches
+        # the client as soon as it is encoded
+        self._container = av.open(self._sink, mode="w", format=container_format,
+                                  options={"page_duration": "100000"} if container_format == "ogg" else {},
+                                  container_options={"flush_packets": "1"})
+        self._stream = self._container.add_stream(codec, rate=codec_rate or sample_rate, layout="mono")
+        self._stream.bit_rate = bitrate
+        self._sample_rate = sample_rate
+        self._resampler = av.AudioResampler(
+            format=self._stream.codec_context.codec.audio_formats[0].name,
+            layout="mono",
+            rate=self._stream.rate
+        )
+        self._fifo = av.AudioFifo()
+        self._pts = 0
+
+    def _mux(self, frame) -> None:
+        for packet in self._stream.encode(frame):
+            self._container.mux(packet)
+
+    def _drain(self, final: bool = False) -> None:
+        frame_size = self._stream.codec_context.frame_size or 1024
+        while self._fifo.samples >= frame_size or (final and self._fifo.samples):
+            frame = self._fifo.read(min(frame_size, self._fifo.samples))
+            frame.pts = self._pts
+            self._pts += frame.samples
+            self._mux(frame)
+
+    def encode(self, pcm: bytes) -> bytes:
+        if pcm:
+            samples = np.frombuffer(pcm, dtype="<i2").reshape(1, -1)
+            frame = av.AudioFrame.from_ndarray(samples, format="s16", layout="mono")
+            frame.sample_rate = self._sample_rate
+            for resampled in self._resampler.resample(frame):
+                self._fifo.write(resampled)
+            self._drain()
+        return self._sink.take()
+
+    def close(self) -> bytes:
+        for resampled in self._resampler.resample(None):
+            self._fifo.write(resampled)
+        self._drain(final=True)
+        self._mux(None)
+        self._container.close()
+        return self._sink.take()
+
+
+def create_encoder(audio_format: str, sample_rate: int) -> AudioEncoder:
+    return AudioEncoder(audio_format, sample_rate, TTS_CONFIG[f"{audio_format}_bitrate"])
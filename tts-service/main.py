@@ -7,15 +7,20 @@ from contextlib import asynccontextmanager
 from config import TTS_CONFIG, FASTAPI_CONFIG, TAGS_METADATA, SERVER_CONFIG
 from core import load_voices_config, clear_model_cache
 from routes import router
+from workers import synthesis_pool
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🚀 Starting TTS Microservice...")
     TTS_CONFIG["model_dir"].mkdir(parents=True, exist_ok=True)
     load_voices_config()
+    synthesis_pool.start()
+    print(f"⚙️ TTS synthesis pool: {synthesis_pool.max_workers} workers, queue size {synthesis_pool.max_queue_size}, "
+          f"{synthesis_pool.voice_concurrency} per voice")
     print("✅ TTS Microservice ready!")
     yield
     print("🔄 Shutting down TTS Microservice...")
+    synthesis_pool.shutdown()
     clear_model_cache()
     print("✅ TTS Microservice shutdown complete!")
 
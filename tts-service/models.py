@@ -1,11 +1,16 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, List, Literal
+from typing import Optional, Any, Dict, List, Literal
 from enum import Enum
 
 class OutputFormat(str, Enum):
     FILE = "file"
     STREAM = "stream"
 
+class AudioFormat(str, Enum):
+    WAV = "wav"
+    OPUS = "opus"
+    MP3 = "mp3"
+
 class TTSRequest(BaseModel):
     text: str = Field(
         ...,
@@ -50,6 +55,10 @@ class TTSRequest(BaseModel):
         OutputFormat.FILE,
         description="Output format: 'file' returns complete audio file, 'stream' returns chunked audio"
     )
+    audio_format: AudioFormat = Field(
+        AudioFormat.WAV,
+        description="Audio encoding: 'wav' (16-bit PCM), 'opus' (Opus in OGG) or 'mp3'"
+    )
     sentence_silence: Optional[float] = Field(
         0.0,
         description="Seconds of silence after each sentence (streaming mode only)",
@@ -78,5 +87,11 @@ class VoicesResponse(BaseModel):
         description="Available voices dictionary")
 
 
+class PhraseCacheResponse(BaseModel):
+    success: bool = Field(description="Operation success status")
+    phrase_cache: Dict[str, Any] = Field(
+        description="Entries, size, hits, misses and hit rate of the phrase cache")
+
+
 class ErrorResponse(BaseModel):
     detail: str = Field(description="Error message")
@@ -0,0 +1,197 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Other service instances may write to the same directory, so its size is
+# re-measured at least this often rather than only counted here
+DISK_RESCAN_SECONDS = 60
+
+
+def make_phrase_key(sentence: str, voice_key: str, voice_revision: str, synthesis_kwargs: Dict[str, Any]) -> str:
+    settings = "|".join(f"{name}={synthesis_kwargs[name]}" for name in sorted(synthesis_kwargs))
+    return hashlib.sha256(f"{sentence}|{voice_key}|{voice_revision}|{settings}".encode()).hexdigest()
+
+
+class PhraseCache:
+    """Raw PCM of synthesized sentences keyed by text, voice and synthesis settings.
+
+    Audio lives in an in-memory LRU bounded by ``max_bytes`` and, when
+    ``disk_dir`` is set, as raw PCM files on disk so common phrases survive
+    restarts. Disk entries older than ``ttl_seconds`` are dropped, and the
+    oldest ones once the disk tier grows past ``max_disk_bytes``.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_dir: Optional[Path] = None,
+                 ttl_seconds: float = 604800, max_disk_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+        self._disk_bytes = 0
+        self._disk_scanned_at = 0.0
+        self._prune_lock = threading.Lock()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_disk()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 or self.disk_dir is not None
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.pcm"
+
+    def peek(self, key: str) -> Optional[bytes]:
+        """Memory-only lookup, cheap enough for the event loop. A miss is not
+        counted since ``get`` is expected to follow."""
+        with self._lock:
+            pcm = self._entries.get(key)
+            if pcm is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+            return pcm
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            pcm = self._entries.get(key)
+            if pcm is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return pcm
+
+        pcm = self._read_disk(key)
+        with self._lock:
+            if pcm is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+
+        self._remember(key, pcm)
+        return pcm
+
+    def put(self, key: str, pcm: bytes):
+        self._remember(key, pcm)
+        self._write_disk(key, pcm)
+
+    def _remember(self, key: str, pcm: bytes):
+        if len(pcm) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = pcm
+            self._size += len(pcm)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            if self.ttl_seconds > 0 and time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, pcm: bytes):
+        if not self.disk_dir:
+            return
+
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=path.parent, suffix=".part", delete=False) as f:
+                f.write(pcm)
+            os.replace(f.name, path)
+        except OSError as e:
+            print(f"Could not write phrase cache entry: {e}")
+            return
+
+        with self._lock:
+            self._disk_bytes += len(pcm)
+            due = self.max_disk_bytes > 0 and (
+                self._disk_bytes > self.max_disk_bytes
+                or time.time() - self._disk_scanned_at > DISK_RESCAN_SECONDS)
+        if due:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        # Another thread already scanning is as good as this one doing it
+        if not self._prune_lock.acquire(blocking=False):
+            return
+
+        try:
+            files = []
+            for path in self.disk_dir.glob("*/*.pcm"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            # Oldest first; trim to 90% so the next few writes don't rescan
+            files.sort()
+            total = sum(size for _, size, _ in files)
+            now = time.time()
+            for modified_at, size, path in files:
+                expired = self.ttl_seconds > 0 and now - modified_at > self.ttl_seconds
+                if not expired and (self.max_disk_bytes <= 0 or total <= self.max_disk_bytes * 0.9):
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+            with self._lock:
+                self._disk_bytes = total
+                self._disk_scanned_at = now
+        finally:
+            self._prune_lock.release()
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._size = 0
+
+        if self.disk_dir:
+            for path in self.disk_dir.glob("*/*.pcm"):
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "disk": str(self.disk_dir) if self.disk_dir else None,
+                "disk_bytes": self._disk_bytes if self.disk_dir else None,
+                "max_disk_bytes": self.max_disk_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 3) if lookups else None
+            }
@@ -1,26 +1,27 @@
-import os
-import re
-import tempfile
-import wave
+import asyncio
+import functools
 from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
-from starlette.background import BackgroundTask
-from models import TTSRequest, OutputFormat, TTSResponse, VoicesResponse
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from config import TTS_CONFIG
+from encoders import MEDIA_TYPES, create_encoder
+from models import TTSRequest, OutputFormat, AudioFormat, TTSResponse, VoicesResponse, PhraseCacheResponse
 from core import (
-    get_voices_config, load_voice_model,
-    configure_wav_file, prepare_synthesis_kwargs, clear_model_cache,
-    synthesize_stream_audio, add_wav_header
+    get_voices_config, prepare_synthesis_kwargs, clear_model_cache,
+    synthesize_pcm, synthesize_stream_pcm, VoiceLoadError,
+    split_sentences, sentence_audio, cached_sentence, get_voice_sample_rate, add_wav_header, pcm_duration,
+    get_phrase_cache_stats, clear_phrase_cache
 )
+from workers import synthesis_pool, QueueFullError
 
 router = APIRouter(prefix="/api/tts")
 
 
-def cleanup_temp_file(file_path: str):
-    try:
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-    except OSError:
-        pass
+def busy_error(e: QueueFullError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="TTS service is busy, please retry later",
+        headers={"Retry-After": str(e.retry_after)}
+    )
 
 
 @router.get(
@@ -49,16 +50,18 @@ async def get_voices():
 
 @router.post(
     "/synthesize",
-    response_class=FileResponse,
+    response_class=Response,
     tags=["Speech Synthesis"],
     summary="Convert text to speech",
     responses={
         200: {
             "description": "Audio file generated successfully",
-            "content": {"audio/wav": {}},
+            "content": {"audio/wav": {}, "audio/ogg": {}, "audio/mpeg": {}},
             "headers": {
                 "X-Audio-Duration": {"description": "Duration of the audio in seconds"},
+                "X-Phrase-Cache-Hits": {"description": "Sentences served from the phrase cache, of all sentences"},
                 "X-Voice-Key": {"description": "Voice used for synthesis"},
+                "X-Audio-Format": {"description": "Audio encoding: wav, opus or mp3"},
             },
         }
     }
@@ -73,13 +76,6 @@ async def synthesize_speech(request: TTSRequest):
                 detail=f"Voice '{request.voice_key}' not found. Available voices: {list(voices_config.keys())}"
             )
 
-        model = load_voice_model(request.voice_key)
-        if not model:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to load voice model: {request.voice_key}"
-            )
-
         voice_info = voices_config[request.voice_key]
         num_speakers = voice_info["num_speakers"]
 
@@ -98,12 +94,24 @@ async def synthesize_speech(request: TTSRequest):
             synthesis_kwargs['sentence_silence'] = request.sentence_silence or 0.0
 
         if request.output_format == OutputFormat.STREAM:
-            return await _synthesize_streaming(model, request, synthesis_kwargs)
+            return await _synthesize_streaming(request, synthesis_kwargs)
         else:
-            return await _synthesize_file(model, request, synthesis_kwargs, voice_info)
+            return await _synthesize_file(request, synthesis_kwargs)
 
     except HTTPException:
         raise
+    except QueueFullError as e:
+        raise busy_error(e)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Speech synthesis timed out after {TTS_CONFIG['request_timeout']} seconds"
+        )
+    except VoiceLoadError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -111,66 +119,151 @@ async def synthesize_speech(request: TTSRequest):
         )
 
 
-async def _synthesize_file(model, request: TTSRequest, synthesis_kwargs: dict, voice_info: dict):
-    temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    temp_file_path = temp_file.name
-    temp_file.close()
+def _sentence_audio(request: TTSRequest, synthesis_kwargs: dict):
+    """PCM of each sentence in order and whether it came from the phrase
+    cache. Cache misses are synthesized several at a time."""
+    return synthesis_pool.map_ordered(
+        request.voice_key,
+        functools.partial(sentence_audio, request.voice_key, **synthesis_kwargs),
+        split_sentences(request.text, TTS_CONFIG["max_sentence_chars"]),
+        window=TTS_CONFIG["sentence_window"],
+        timeout=TTS_CONFIG["request_timeout"],
+        lookup=functools.partial(cached_sentence, request.voice_key, **synthesis_kwargs)
+    )
+
+
+async def _whole_text_audio(request: TTSRequest, synthesis_kwargs: dict):
+    """PCM of the whole text synthesized in one pass on a single worker."""
+    pcm = await synthesis_pool.run(
+        request.voice_key,
+        functools.partial(synthesize_pcm, request.voice_key, request.text, **synthesis_kwargs),
+        timeout=TTS_CONFIG["request_timeout"]
+    )
+    yield pcm, False
+
 
+async def _sentence_pcm(request: TTSRequest, synthesis_kwargs: dict):
+    sentences = _sentence_audio(request, synthesis_kwargs)
     try:
-        with wave.open(temp_file_path, 'wb') as wav_file:
-            configure_wav_file(wav_file, model.config.sample_rate)
-            
-            processed_text = re.sub(r'\n', ' ', request.text)
-            processed_text = re.sub(r'[?.:;!!؟]|\.{3}', '،', processed_text)
-
-            model.synthesize(processed_text, wav_file, **synthesis_kwargs)
-
-        with wave.open(temp_file_path, 'rb') as wav_file:
-            frames = wav_file.getnframes()
-            sample_rate = wav_file.getframerate()
-            duration = frames / sample_rate
-
-        return FileResponse(
-            temp_file_path,
-            media_type="audio/wav",
-            filename=f"tts_output_{request.voice_key}.wav",
-            headers={
-                "X-Audio-Duration": str(duration),
-                "X-Voice-Key": request.voice_key,
-                "X-Speaker-ID": str(request.speaker_id),
-                "X-Speed": str(request.speed),
-                "X-Output-Format": "file"
-            },
-            background=BackgroundTask(cleanup_temp_file, temp_file_path)
+        async for pcm, _ in sentences:
+            yield pcm
+    finally:
+        await sentences.aclose()
+
+
+async def _encode(pcm_chunks, audio_format: AudioFormat, sample_rate: int):
+    """Encode PCM as it arrives. Encoding runs off the event loop while the
+    workers go on with the following sentences."""
+    encoder = await asyncio.to_thread(create_encoder, audio_format.value, sample_rate)
+    try:
+        async for pcm in pcm_chunks:
+            data = await asyncio.to_thread(encoder.encode, pcm)
+            if data:
+                yield data
+        yield await asyncio.to_thread(encoder.close)
+    finally:
+        await pcm_chunks.aclose()
+
+
+async def _synthesize_file(request: TTSRequest, synthesis_kwargs: dict):
+    sample_rate = get_voice_sample_rate(request.voice_key)
+    media_type, extension = MEDIA_TYPES[request.audio_format.value]
+
+    if TTS_CONFIG["parallel_sentences"]:
+        sentences = _sentence_audio(request, synthesis_kwargs)
+    else:
+        sentences = _whole_text_audio(request, synthesis_kwargs)
+
+    totals = {"pcm_size": 0, "sentences": 0, "cached": 0}
+
+    async def pcm_chunks():
+        try:
+            async for pcm, cached in sentences:
+                totals["pcm_size"] += len(pcm)
+                totals["sentences"] += 1
+                totals["cached"] += cached
+                yield pcm
+        finally:
+            await sentences.aclose()
+
+    if request.audio_format == AudioFormat.WAV:
+        parts = [pcm async for pcm in pcm_chunks()]
+        parts.insert(0, add_wav_header(sample_rate, data_size=totals["pcm_size"]))
+    else:
+        parts = [data async for data in _encode(pcm_chunks(), request.audio_format, sample_rate)]
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="tts_output_{request.voice_key}.{extension}"',
+        "X-Audio-Duration": str(pcm_duration(totals["pcm_size"], sample_rate)),
+        "X-Voice-Key": request.voice_key,
+        "X-Speaker-ID": str(request.speaker_id),
+        "X-Speed": str(request.speed),
+        "X-Output-Format": "file",
+        "X-Audio-Format": request.audio_format.value
+    }
+    if TTS_CONFIG["parallel_sentences"]:
+        headers["X-Phrase-Cache-Hits"] = f"{totals['cached']}/{totals['sentences']}"
+
+    # The parts are sent as they are rather than joined, so the audio is
+    # never copied again on its way out
+    async def send_parts():
+        for part in parts:
+            yield part
+
+    return StreamingResponse(
+        send_parts(),
+        media_type=media_type,
+        headers={**headers, "Content-Length": str(sum(len(part) for part in parts))}
+    )
+
+
+async def _synthesize_streaming(request: TTSRequest, synthesis_kwargs: dict):
+    sample_rate = get_voice_sample_rate(request.voice_key)
+    media_type, _ = MEDIA_TYPES[request.audio_format.value]
+
+    if TTS_CONFIG["parallel_sentences"]:
+        chunks = _sentence_pcm(request, synthesis_kwargs)
+    else:
+        chunks = synthesis_pool.stream(
+            request.voice_key,
+            functools.partial(synthesize_stream_pcm, request.voice_key, request.text, **synthesis_kwargs),
+            buffer_chunks=TTS_CONFIG["stream_buffer_chunks"]
         )
 
-    except Exception as e:
-        if os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
-        raise e
+    if request.audio_format == AudioFormat.WAV:
+        stream_header = add_wav_header(sample_rate)
+    else:
+        stream_header = b""
+        chunks = _encode(chunks, request.audio_format, sample_rate)
 
+    # Wait for the first chunk so a full queue or a voice that fails to load
+    # still comes back as a proper HTTP status
+    try:
+        first_chunk = await asyncio.wait_for(chunks.__anext__(), TTS_CONFIG["request_timeout"])
+    except BaseException:
+        await chunks.aclose()
+        raise
 
-async def _synthesize_streaming(model, request: TTSRequest, synthesis_kwargs: dict):
-    def audio_stream_generator():
+    async def audio_stream_generator():
         try:
-            wav_header = add_wav_header(model.config.sample_rate)
-            yield wav_header
-            
-            for audio_chunk in synthesize_stream_audio(model, request.text, **synthesis_kwargs):
+            yield stream_header + first_chunk
+            async for audio_chunk in chunks:
                 yield audio_chunk
-                
         except Exception as e:
             print(f"❌ Streaming error: {e}")
             raise
+        finally:
+            await chunks.aclose()
 
     return StreamingResponse(
         audio_stream_generator(),
-        media_type="audio/wav",
+        media_type=media_type,
         headers={
             "X-Voice-Key": request.voice_key,
             "X-Speaker-ID": str(request.speaker_id),
             "X-Speed": str(request.speed),
             "X-Output-Format": "stream",
+            "X-Audio-Format": request.audio_format.value,
             "Cache-Control": "no-cache",
             "Connection": "keep-alive"
         }
@@ -192,6 +285,35 @@ async def clear_cache():
     }
 
 
+@router.get(
+    "/cache/phrases",
+    response_model=PhraseCacheResponse,
+    tags=["Health & Management"],
+    summary="Phrase cache statistics",
+    description="Returns the size and hit ratio of the synthesized sentence cache."
+)
+async def phrase_cache_stats():
+    return {
+        "success": True,
+        "phrase_cache": get_phrase_cache_stats()
+    }
+
+
+@router.delete(
+    "/cache/phrases",
+    response_model=TTSResponse,
+    tags=["Health & Management"],
+    summary="Clear phrase cache",
+    description="Clears all synthesized sentences from memory and disk."
+)
+async def clear_phrases_cache():
+    cached_count = await asyncio.to_thread(clear_phrase_cache)
+    return {
+        "success": True,
+        "message": f"Phrase cache cleared. Removed {cached_count} cached sentences."
+    }
+
+
 @router.get(
     "/health",
     response_class=PlainTextResponse,
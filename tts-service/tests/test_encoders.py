@@ -0,0 +1,47 @@
+import io
+
+import av
+import numpy as np
+import pytest
+
+from encoders import AudioEncoder, MEDIA_TYPES
+
+SAMPLE_RATE = 22050
+
+
+def tone(seconds: float) -> bytes:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.3 * 32767 * np.sin(2 * np.pi * 220 * t)).astype("<i2").tobytes()
+
+
+def decoded_seconds(data: bytes) -> float:
+    with av.open(io.BytesIO(data)) as container:
+        stream = container.streams.audio[0]
+        samples = sum(frame.samples for frame in container.decode(stream))
+        return samples / stream.rate
+
+
+@pytest.mark.parametrize("audio_format", ["opus", "mp3"])
+def test_encoded_audio_decodes_to_the_same_length(audio_format):
+    encoder = AudioEncoder(audio_format, SAMPLE_RATE, bitrate=32000)
+    data = b"".join(encoder.encode(tone(0.5)) for _ in range(3)) + encoder.close()
+
+    with av.open(io.BytesIO(data)) as container:
+        assert container.format.name.split(",")[0] == MEDIA_TYPES[audio_format][1]
+    assert decoded_seconds(data) == pytest.approx(1.5, abs=0.1)
+
+
+def test_opus_pages_are_flushed_while_encoding():
+    encoder = AudioEncoder("opus", SAMPLE_RATE, bitrate=24000)
+    first = encoder.encode(tone(1.0))
+    # Audio reaches the client before the stream is closed
+    assert first.startswith(b"OggS")
+    assert len(first) > 1000
+    encoder.close()
+
+
+def test_empty_chunks_are_accepted():
+    encoder = AudioEncoder("mp3", SAMPLE_RATE, bitrate=32000)
+    assert encoder.encode(b"") == b""
+    data = encoder.encode(tone(0.3)) + encoder.close()
+    assert decoded_seconds(data) == pytest.approx(0.3, abs=0.1)
@@ -0,0 +1,61 @@
+import os
+import time
+
+from phrase_cache import PhraseCache, make_phrase_key
+
+
+def test_key_depends_on_voice_and_settings():
+    key = make_phrase_key("سلام", "fa_IR-amir", "1", {"length_scale": 1.0, "noise_scale": 0.667})
+    assert key == make_phrase_key("سلام", "fa_IR-amir", "1", {"noise_scale": 0.667, "length_scale": 1.0})
+    assert key != make_phrase_key("سلام", "fa_IR-amir", "2", {"length_scale": 1.0, "noise_scale": 0.667})
+    assert key != make_phrase_key("سلام", "fa_IR-amir", "1", {"length_scale": 0.8, "noise_scale": 0.667})
+
+
+def test_least_recently_used_audio_is_evicted_past_the_byte_budget():
+    cache = PhraseCache(max_bytes=300)
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    cache.put("c", b"c" * 100)
+    assert cache.peek("a") is not None
+
+    cache.put("d", b"d" * 100)
+    assert cache.get("b") is None
+    assert [cache.peek(key) is not None for key in "acd"] == [True, True, True]
+    assert cache.stats()["bytes"] == 300
+
+
+def test_audio_larger_than_the_budget_is_not_kept():
+    cache = PhraseCache(max_bytes=100)
+    cache.put("a", b"a" * 50)
+    cache.put("big", b"x" * 200)
+    assert cache.get("big") is None
+    assert cache.get("a") == b"a" * 50
+
+
+def test_disk_tier_survives_restart_and_expires(tmp_path):
+    PhraseCache(max_bytes=0, disk_dir=tmp_path, ttl_seconds=60).put("ab12", b"pcm")
+
+    restarted = PhraseCache(max_bytes=1024, disk_dir=tmp_path, ttl_seconds=60)
+    assert restarted.peek("ab12") is None
+    assert restarted.get("ab12") == b"pcm"
+    assert restarted.peek("ab12") == b"pcm"
+
+    old = time.time() - 61
+    os.utime(restarted._disk_path("ab12"), (old, old))
+    assert PhraseCache(max_bytes=0, disk_dir=tmp_path, ttl_seconds=60).get("ab12") is None
+    assert not list(tmp_path.glob("*/*.pcm"))
+
+
+def test_disk_tier_drops_oldest_files_past_its_budget(tmp_path):
+    cache = PhraseCache(max_bytes=0, disk_dir=tmp_path, ttl_seconds=0)
+    for n in range(5):
+        key = f"{n:02d}" + "0" * 62
+        cache.put(key, b"\0" * 1000)
+        os.utime(cache._disk_path(key), (n, n))
+
+    cache.max_disk_bytes = 3000
+    cache.put("05" + "0" * 62, b"\0" * 1000)
+
+    # Trimmed below the budget, oldest first
+    assert sorted(path.stem[:2] for path in tmp_path.glob("*/*.pcm")) == ["04", "05"]
+    assert cache.stats()["disk_bytes"] == 2000
@@ -0,0 +1,23 @@
+from core import split_sentences
+
+
+def test_text_is_split_at_sentence_punctuation():
+    assert split_sentences("سلام. حال شما چطور است؟ خوبم!") == ["سلام.", "حال شما چطور است؟", "خوبم!"]
+
+
+def test_decimal_numbers_stay_whole():
+    assert split_sentences("قیمت 2.5 دلار است. ممنون") == ["قیمت 2.5 دلار است.", "ممنون"]
+
+
+def test_stray_punctuation_joins_the_previous_sentence():
+    assert split_sentences("واقعا؟ ! بله") == ["واقعا؟ !", "بله"]
+
+
+def test_long_sentences_are_split_at_commas_then_spaces():
+    text = "اول این، دوم آن، سوم هم این"
+    assert split_sentences(text, max_chars=12) == ["اول این،", "دوم آن،", "سوم هم این"]
+    assert split_sentences("یک دو سه چهار پنج", max_chars=8) == ["یک دو", "سه چهار", "پنج"]
+
+
+def test_text_without_words_is_returned_as_is():
+    assert split_sentences("...") == ["..."]
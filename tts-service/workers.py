@@ -0,0 +1,241 @@
+import asyncio
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, Optional
+
+from config import TTS_CONFIG
+
+_END = object()
+
+
+class QueueFullError(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__("TTS synthesis queue is full")
+        self.retry_after = retry_after
+
+
+class _Admission:
+    """A request's place in the pool's queue.
+
+    The place is given back once the request is over and none of the work it
+    submitted is still running on a worker, so synthesis a caller gave up on
+    keeps counting against the queue.
+    """
+
+    def __init__(self, pool: "SynthesisPool"):
+        self._pool = pool
+        self._holds = 1
+        self._lock = threading.Lock()
+
+    def hold(self, future: Future) -> Future:
+        with self._lock:
+            self._holds += 1
+        future.add_done_callback(self._drop)
+        return future
+
+    def _drop(self, *_):
+        with self._lock:
+            self._holds -= 1
+            done = self._holds == 0
+        if done:
+            self._pool._release()
+
+    def __enter__(self) -> "_Admission":
+        return self
+
+    def __exit__(self, *_):
+        self._drop()
+
+
+class SynthesisPool:
+    """Runs Piper synthesis on worker threads instead of the event loop.
+
+    At most ``max_workers + max_queue_size`` requests are admitted at once;
+    beyond that ``QueueFullError`` is raised so the caller can answer 503.
+    Admitted requests also wait for one of ``voice_concurrency`` slots of
+    their voice, so one popular voice can't occupy every worker.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue_size: int = 0,
+                 voice_concurrency: int = 0, retry_after: int = 2):
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(0, max_queue_size)
+        self.voice_concurrency = voice_concurrency if voice_concurrency > 0 else self.max_workers
+        self.retry_after = retry_after
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._voice_slots_by_key: Dict[str, asyncio.Semaphore] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue_size
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="tts-worker"
+            )
+
+    def shutdown(self):
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def _admit(self) -> "_Admission":
+        with self._lock:
+            if self._pending >= self.capacity:
+                raise QueueFullError(self.retry_after)
+            self._pending += 1
+        return _Admission(self)
+
+    def _release(self):
+        with self._lock:
+            self._pending -= 1
+
+    def _voice_slots(self, voice_key: str) -> asyncio.Semaphore:
+        return self._voice_slots_by_key.setdefault(voice_key, asyncio.Semaphore(self.voice_concurrency))
+
+    async def _submit(self, voice_key: str, fn: Callable, *args) -> Future:
+        """Submit ``fn`` once a slot of the voice is free.
+
+        The slot is held until the work really finishes, even if the caller
+        stops waiting, since a running future can't be cancelled.
+        """
+        slots = self._voice_slots(voice_key)
+        await slots.acquire()
+        loop = asyncio.get_running_loop()
+
+        def release_slot(_):
+            try:
+                loop.call_soon_threadsafe(slots.release)
+            except RuntimeError:
+                # The event loop is gone and the semaphore with it
+                pass
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(release_slot)
+        return future
+
+    async def run(self, voice_key: str, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        if self._executor is None:
+            self.start()
+
+        with self._admit() as admission:
+            future = admission.hold(await self._submit(voice_key, fn, *args))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise
+
+    async def map_ordered(self, voice_key: str, fn: Callable, items: Iterable, window: int = 0,
+                          timeout: Optional[float] = None,
+                          lookup: Optional[Callable] = None) -> AsyncIterator[Any]:
+        """Run ``fn(item)`` for every item across the workers and yield the
+        results in item order.
+
+        Up to ``window`` items are in flight or finished but not yet yielded,
+        and each one takes a slot of the voice while it runs, so a single
+        request spreads over several cores without starving other voices.
+        Items for which ``lookup(item)`` returns a result skip the workers.
+        """
+        if self._executor is None:
+            self.start()
+
+        async def submit(item):
+            if lookup is not None:
+                result = lookup(item)
+                if result is not None:
+                    return result
+            future = admission.hold(await self._submit(voice_key, fn, item))
+            return await asyncio.wrap_future(future)
+
+        with self._admit() as admission:
+            items = iter(items)
+            tasks = deque(asyncio.ensure_future(submit(item))
+                          for item in itertools.islice(items, max(1, window or self.max_workers)))
+            try:
+                while tasks:
+                    result = await asyncio.wait_for(tasks.popleft(), timeout)
+                    # Refill before handing the result over so synthesis
+                    # continues while it is being sent
+                    following = next(items, _END)
+                    if following is not _END:
+                        tasks.append(asyncio.ensure_future(submit(following)))
+                    yield result
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def stream(self, voice_key: str, fn: Callable[..., Iterator[bytes]], *args,
+                     buffer_chunks: int = 4) -> AsyncIterator[bytes]:
+        """Iterate the generator ``fn(*args)`` on a worker thread.
+
+        The worker stays at most ``buffer_chunks`` chunks ahead of the
+        consumer, so a slow client slows synthesis down instead of piling
+        audio up in memory. Closing the iterator stops the worker.
+        """
+        if self._executor is None:
+            self.start()
+
+        with self._admit() as admission:
+            loop = asyncio.get_running_loop()
+            chunks: asyncio.Queue = asyncio.Queue()
+            room = threading.Semaphore(max(1, buffer_chunks))
+            cancelled = threading.Event()
+
+            def deliver(item):
+                try:
+                    loop.call_soon_threadsafe(chunks.put_nowait, item)
+                except RuntimeError:
+                    # The event loop is gone, nobody is listening any more
+                    cancelled.set()
+
+            def produce():
+                try:
+                    for chunk in fn(*args):
+                        while not room.acquire(timeout=0.1):
+                            if cancelled.is_set():
+                                return
+                        if cancelled.is_set():
+                            return
+                        deliver(chunk)
+                    deliver(_END)
+                except Exception as e:
+                    deliver(e)
+
+            future = admission.hold(await self._submit(voice_key, produce))
+            try:
+                while True:
+                    item = await chunks.get()
+                    room.release()
+                    if item is _END:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                cancelled.set()
+                future.cancel()
+
+
+synthesis_pool = SynthesisPool(
+    max_workers=TTS_CONFIG["max_workers"],
+    max_queue_size=TTS_CONFIG["max_queue_size"],
+    voice_concurrency=TTS_CONFIG["voice_concurrency"],
+    retry_after=TTS_CONFIG["retry_after"]
+)